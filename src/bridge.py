@@ -4,13 +4,33 @@ WSL <-> Windows Python 브릿지
 WSL 환경에서 Windows Python을 호출하여 COM 자동화 스크립트를 실행합니다.
 """
 import subprocess
-import json
+import base64
 import os
+import queue
+import shutil
 import sys
+import tempfile
+import threading
+import time
 import zipfile
 
+from src.op_codec import encode_plan
+from src.com_jobs import (
+    STEP_OPEN, STEP_REPLACE, STEP_FILL_MARKERS, STEP_INSERT_OPS,
+    STEP_DELETE_TEXT, STEP_SAVE_HWPX, STEP_EXPORT_PDF,
+    INPUT_PATH_FIELDS, OUTPUT_PATH_FIELDS, HEARTBEAT_PREFIX, LAUNCH_GRACE,
+    validate_plan,
+)
+
 WIN_PYTHON = "python"  # cmd.exe 경유로 실행 — PATH에서 해석됨
 
+# COM 스크립트가 이 시간(초) 동안 아무 진행(stdout/하트비트)도 없으면 종료
+STALL_TIMEOUT = 60
+
+# 스테이징 루트 재정의용 환경 변수 (WSL 경로, Windows 드라이브 아래여야 함)
+STAGE_DIR_ENV = "HWPX_STAGE_DIR"
+_stage_root = None
+
 
 def wsl_to_win_path(wsl_path):
     """WSL 경로를 Windows 경로로 변환
@@ -47,6 +67,147 @@ def win_to_wsl_path(win_path):
     raise ValueError(f"Cannot convert path to WSL format: {win_path}")
 
 
+def get_stage_root():
+    """스테이징 루트 디렉토리의 WSL 경로를 반환
+
+    HWPX_STAGE_DIR 환경 변수가 있으면 그 값을, 없으면 Windows %TEMP%
+    아래 hwpx_stage 폴더를 사용한다. %TEMP% 조회는 프로세스당 1회만 한다.
+
+    Returns:
+        str: 스테이징 루트의 WSL 경로 (예: /mnt/c/Users/me/AppData/Local/Temp/hwpx_stage)
+    """
+    global _stage_root
+    env = os.environ.get(STAGE_DIR_ENV)
+    if env:
+        return env
+    if _stage_root is None:
+        try:
+            out = subprocess.run(
+                ["cmd.exe", "/c", "echo %TEMP%"],
+                capture_output=True,
+                timeout=30,
+            ).stdout.decode("utf-8", errors="replace").strip()
+            _stage_root = os.path.join(win_to_wsl_path(out), "hwpx_stage")
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            _stage_root = "/mnt/c/Temp/hwpx_stage"
+    return _stage_root
+
+
+class StagingArea:
+    """Windows 네이티브 파일시스템 스테이징 영역
+
+    입력 파일을 Windows 임시 폴더로 한 번에 복사하고, 한글이 그 폴더에서
+    문서를 열고 (섹션별 중간 저장 포함) 쓰게 한 뒤, 실행이 끝나면 출력
+    파일만 원래 위치로 한 번에 복사해 온다.
+
+    - WSL 측 작업 파일이 /mnt 밖(ext4)에 있어도 COM 실행이 가능하다.
+    - 한글의 반복 I/O가 WSL 공유 경로를 거치지 않는다.
+
+    enabled=False이면 wsl_to_win_path 변환만 하는 pass-through로 동작한다.
+
+    Usage:
+        st = StagingArea(enabled=True)
+        win_in = st.input('/home/me/form.hwpx')
+        win_out = st.output('/home/me/out.hwpx')
+        ok = st.run(script, timeout=600)   # 실행 후 출력 회수 + 정리
+    """
+
+    def __init__(self, enabled=True, root=None):
+        """
+        Args:
+            enabled: False이면 스테이징 없이 원래 경로를 그대로 사용
+            root: 스테이징 루트 WSL 경로 (None이면 get_stage_root())
+        """
+        self.enabled = enabled
+        self._root = root
+        self._dir = None
+        self._inputs = {}    # 원본 WSL 경로 → 스테이징 WSL 경로
+        self._outputs = []   # (스테이징 WSL 경로, 최종 WSL 경로)
+
+    def _staged_path(self, wsl_path):
+        if self._dir is None:
+            root = self._root or get_stage_root()
+            os.makedirs(root, exist_ok=True)
+            self._dir = tempfile.mkdtemp(prefix="stage_", dir=root)
+        # 확장자로 형식을 판별하므로 파일명은 유지하고 순번만 붙인다
+        n = len(self._inputs) + len(self._outputs)
+        return os.path.join(self._dir, f"{n:02d}_{os.path.basename(wsl_path)}")
+
+    def input(self, wsl_path):
+        """입력 파일을 스테이징하고 한글이 읽을 Windows 경로를 반환
+
+        Args:
+            wsl_path: 입력 파일의 WSL 경로
+
+        Returns:
+            str: Windows 경로
+        """
+        if not self.enabled:
+            return wsl_to_win_path(wsl_path)
+        src = os.path.abspath(wsl_path)
+        staged = self._inputs.get(src)
+        if staged is None:
+            staged = self._staged_path(src)
+            shutil.copyfile(src, staged)
+            self._inputs[src] = staged
+        return wsl_to_win_path(staged)
+
+    def output(self, wsl_path):
+        """출력 파일의 스테이징 위치를 예약하고 Windows 경로를 반환
+
+        Args:
+            wsl_path: 최종 출력 파일의 WSL 경로
+
+        Returns:
+            str: 한글이 저장할 Windows 경로
+        """
+        if not self.enabled:
+            return wsl_to_win_path(wsl_path)
+        dst = os.path.abspath(wsl_path)
+        staged = self._staged_path(dst)
+        self._outputs.append((staged, dst))
+        return wsl_to_win_path(staged)
+
+    def collect(self):
+        """스테이징된 출력 파일을 최종 위치로 복사
+
+        실행이 실패해 생성되지 않은 출력은 건너뛴다.
+
+        Returns:
+            list[str]: 복사된 최종 경로 목록
+        """
+        copied = []
+        for staged, dst in self._outputs:
+            if not os.path.exists(staged):
+                continue
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            tmp_path = dst + ".tmp"
+            shutil.copyfile(staged, tmp_path)
+            os.replace(tmp_path, dst)
+            copied.append(dst)
+        return copied
+
+    def cleanup(self):
+        """스테이징 디렉토리 삭제"""
+        if self._dir is not None:
+            shutil.rmtree(self._dir, ignore_errors=True)
+            self._dir = None
+
+    def run(self, script_code, timeout=None, stall_timeout=STALL_TIMEOUT):
+        """인라인 스크립트를 실행하고 출력 회수 및 정리까지 수행
+
+        Returns:
+            bool: _run_inline_script 결과
+        """
+        try:
+            return _run_inline_script(script_code, timeout=timeout,
+                                      stall_timeout=stall_timeout)
+        finally:
+            if self.enabled:
+                self.collect()
+                self.cleanup()
+
+
 def run_com_script(script_path, *args, timeout=120):
     """Windows Python으로 COM 스크립트 실행
 
@@ -124,42 +285,101 @@ def fix_hwpx_for_pdf(input_hwpx, output_hwpx=None):
     return output_hwpx
 
 
-def open_and_save_as_pdf(hwpx_path, pdf_path, timeout=300):
-    """HWPX/HWP를 열어서 PDF로 저장
+def run_job_plan(steps, timeout=None, visible=False, profile_path=None,
+                 stage=False, stall_timeout=STALL_TIMEOUT):
+    """작업 계획을 한글 세션 하나에서 실행
+
+    여러 단계(열기, 교체, 마커 채우기, 텍스트 삭제, HWPX 저장, PDF 변환)를
+    한 번의 한글 실행/문서 열기로 처리한다. 단계 형식은 src/com_jobs.py 참고.
+    각 단계의 경로 필드는 WSL 경로로 지정하며, 여기서 Windows 경로로
+    변환된다 (stage=True면 스테이징 경로).
+
+    고정 제한 시간 대신 하트비트 워치독으로 감시한다: 단계/섹션/오퍼레이션
+    묶음마다 진행 신호가 오며, stall_timeout(또는 단계별 grace) 동안 신호가
+    없으면 즉시 종료한다.
 
     Args:
-        hwpx_path: 원본 HWPX/HWP 파일의 WSL 경로
-        pdf_path: 출력 PDF 파일의 WSL 경로
-        timeout: 실행 제한 시간 (초, 기본 300=5분)
+        steps: 단계 dict 리스트, 예:
+            [{"step": "open", "path": "/mnt/d/form.hwpx"},
+             {"step": "replace", "replacements": {"{{A}}": "값"}},
+             {"step": "save_hwpx", "path": "/mnt/d/out.hwpx"},
+             {"step": "export_pdf", "path": "/mnt/d/out.pdf"}]
+        timeout: 전체 실행 상한 (초, None이면 상한 없음)
+        visible: True이면 한글 창 표시
+        profile_path: COM 계측 리포트(JSON) 저장 경로 (None이면 계측 안 함)
+        stage: True면 Windows 네이티브 임시 폴더에서 작업 (StagingArea 참고)
+        stall_timeout: 진행 없이 허용하는 최대 시간 (초)
 
     Returns:
         bool: 성공 여부
+
+    Raises:
+        ValueError: 알 수 없는 단계가 있을 때
     """
-    win_hwpx = wsl_to_win_path(hwpx_path)
-    win_pdf = wsl_to_win_path(pdf_path)
+    validate_plan(steps)
+    st = StagingArea(enabled=stage)
+
+    win_steps = []
+    for step in steps:
+        win_step = dict(step)
+        for field in INPUT_PATH_FIELDS.get(step["step"], ()):
+            if win_step.get(field):
+                win_step[field] = st.input(win_step[field])
+        for field in OUTPUT_PATH_FIELDS.get(step["step"], ()):
+            if win_step.get(field):
+                win_step[field] = st.output(win_step[field])
+        win_steps.append(win_step)
+    plan_b64 = base64.b64encode(encode_plan(win_steps)).decode('ascii')
+
+    win_profile = st.output(profile_path) if profile_path else None
+    prof_setup, prof_teardown = _profile_snippets(win_profile)
 
     script = f'''\
-import sys, os, time
+import sys, os, base64
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from src.hwp_com import HwpController
-hwp = HwpController(visible=False)
+from src.com_jobs import heartbeat, run_plan
+from src.op_codec import decode_plan
+
+steps = decode_plan(base64.b64decode("{plan_b64}"))
+
+heartbeat("launch", {LAUNCH_GRACE})
+hwp = HwpController(visible={bool(visible)})
+{prof_setup}
 try:
-    start = time.time()
-    hwp.open(r"{win_hwpx}")
-    pages = hwp.get_page_count()
-    print(f"Opened: {{pages}} pages ({{time.time()-start:.1f}}s)", flush=True)
-    t = time.time()
-    hwp.save_as_pdf(r"{win_pdf}")
-    print(f"PDF saved ({{time.time()-t:.1f}}s)", flush=True)
+    run_plan(hwp, steps, prof)
     print("OK", flush=True)
 finally:
+{prof_teardown}
     hwp.quit()
 '''
-    return _run_inline_script(script, timeout=timeout)
+    return st.run(script, timeout=timeout, stall_timeout=stall_timeout)
+
+
+def open_and_save_as_pdf(hwpx_path, pdf_path, timeout=None, profile_path=None,
+                         stage=False):
+    """HWPX/HWP를 열어서 PDF로 저장
+
+    Args:
+        hwpx_path: 원본 HWPX/HWP 파일의 WSL 경로
+        pdf_path: 출력 PDF 파일의 WSL 경로
+        timeout: 전체 실행 상한 (초, None이면 하트비트 워치독만 적용)
+        profile_path: COM 계측 리포트(JSON) 저장 경로 (None이면 계측 안 함)
+        stage: True면 Windows 네이티브 임시 폴더에서 작업 (StagingArea 참고)
+
+    Returns:
+        bool: 성공 여부
+    """
+    steps = [
+        {"step": STEP_OPEN, "path": hwpx_path},
+        {"step": STEP_EXPORT_PDF, "path": pdf_path},
+    ]
+    return run_job_plan(steps, timeout=timeout, profile_path=profile_path,
+                        stage=stage)
 
 
 def open_and_replace(template_path, replacements, output_hwpx, output_pdf=None,
-                     timeout=120):
+                     timeout=None, profile_path=None, stage=False):
     """템플릿을 열고 텍스트 교체 후 저장
 
     Args:
@@ -167,39 +387,26 @@ def open_and_replace(template_path, replacements, output_hwpx, output_pdf=None,
         replacements: dict {찾을_텍스트: 바꿀_텍스트, ...}
         output_hwpx: 출력 HWPX 파일의 WSL 경로
         output_pdf: 출력 PDF 파일의 WSL 경로 (None이면 PDF 미생성)
-        timeout: 실행 제한 시간 (초)
+        timeout: 전체 실행 상한 (초, None이면 하트비트 워치독만 적용)
+        profile_path: COM 계측 리포트(JSON) 저장 경로 (None이면 계측 안 함)
+        stage: True면 Windows 네이티브 임시 폴더에서 작업 (StagingArea 참고)
 
     Returns:
         bool: 성공 여부
     """
-    win_template = wsl_to_win_path(template_path)
-    win_output = wsl_to_win_path(output_hwpx)
-    replacements_json = json.dumps(replacements, ensure_ascii=False)
-
-    pdf_line = ""
+    steps = [
+        {"step": STEP_OPEN, "path": template_path},
+        {"step": STEP_REPLACE, "replacements": replacements},
+        {"step": STEP_SAVE_HWPX, "path": output_hwpx},
+    ]
     if output_pdf:
-        win_pdf = wsl_to_win_path(output_pdf)
-        pdf_line = f'    hwp.save_as_pdf(r"{win_pdf}")'
-
-    script = f'''\
-import sys, os, json
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from src.hwp_com import HwpController
-replacements = json.loads({repr(replacements_json)})
-hwp = HwpController(visible=False)
-try:
-    hwp.open(r"{win_template}")
-    hwp.find_and_replace_all(replacements)
-    hwp.save_as(r"{win_output}", "HWPX")
-{pdf_line}
-    print("OK", flush=True)
-finally:
-    hwp.quit()
-'''
-    return _run_inline_script(script, timeout=timeout)
+        steps.append({"step": STEP_EXPORT_PDF, "path": output_pdf})
+    return run_job_plan(steps, timeout=timeout, profile_path=profile_path,
+                        stage=stage)
 
 
-def create_document(operations, output_path, output_pdf=None, timeout=120):
+def create_document(operations, output_path, output_pdf=None, timeout=None,
+                    profile_path=None, stage=False):
     """새 문서 생성 (JSON 기반 명령어)
 
     Args:
@@ -207,90 +414,36 @@ def create_document(operations, output_path, output_pdf=None, timeout=120):
             지원 명령어:
             - {"op": "insert_text", "text": "..."}
             - {"op": "line_break"}
+            - {"op": "page_break"}
             - {"op": "set_char_shape", "font": "...", "size": N, "bold": bool, "color": N}
             - {"op": "set_para_shape", "align": "center", "line_spacing": N}
             - {"op": "insert_table", "rows": N, "cols": N}
             - {"op": "fill_table", "data": [[...], ...]}
+            - {"op": "set_cell_background", "r": N, "g": N, "b": N}
         output_path: 출력 HWPX 파일의 WSL 경로
         output_pdf: 출력 PDF 파일의 WSL 경로 (None이면 PDF 미생성)
-        timeout: 실행 제한 시간 (초)
+        timeout: 전체 실행 상한 (초, None이면 하트비트 워치독만 적용)
+        profile_path: COM 계측 리포트(JSON) 저장 경로 (None이면 계측 안 함)
+        stage: True면 Windows 네이티브 임시 폴더에서 작업 (StagingArea 참고)
 
     Returns:
         bool: 성공 여부
     """
-    win_output = wsl_to_win_path(output_path)
-    ops_json = json.dumps(operations, ensure_ascii=False)
-
-    pdf_line = ""
+    steps = [
+        {"step": STEP_INSERT_OPS, "ops": operations},
+        {"step": STEP_SAVE_HWPX, "path": output_path},
+    ]
     if output_pdf:
-        win_pdf = wsl_to_win_path(output_pdf)
-        pdf_line = f'    hwp.save_as_pdf(r"{win_pdf}")'
-
-    script = f'''\
-import sys, os, json
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from src.hwp_com import HwpController
-operations = json.loads({repr(ops_json)})
-hwp = HwpController(visible=False)
-try:
-    pending_char = None
-    texts_in_para = 0
-    for oi, op in enumerate(operations):
-        cmd = op["op"]
-        if cmd == "insert_text":
-            texts_in_para += 1
-            text = op["text"]
-            hwp.insert_text(text)
-            if pending_char and text:
-                sole = (texts_in_para == 1)
-                if sole:
-                    for j in range(oi + 1, min(oi + 6, len(operations))):
-                        nc = operations[j]["op"]
-                        if nc in ("line_break", "page_break", "set_para_shape"):
-                            break
-                        if nc == "insert_text":
-                            sole = False
-                            break
-                if sole:
-                    hwp._hwp.HAction.Run("MoveParaBegin")
-                    hwp._hwp.HAction.Run("MoveSelParaEnd")
-                    hwp.set_char_shape(**pending_char)
-                    hwp._hwp.HAction.Run("Cancel")
-                    hwp._hwp.HAction.Run("MoveParaEnd")
-                else:
-                    end_pos = hwp._hwp.GetPos()
-                    for _ in range(len(text)):
-                        hwp._hwp.HAction.Run("MoveSelLeft")
-                    hwp.set_char_shape(**pending_char)
-                    hwp._hwp.HAction.Run("Cancel")
-                    hwp._hwp.SetPos(*end_pos)
-        elif cmd == "line_break":
-            texts_in_para = 0
-            hwp.insert_line_break()
-        elif cmd == "set_char_shape":
-            pending_char = {{k: v for k, v in op.items() if k != "op"}}
-        elif cmd == "set_para_shape":
-            texts_in_para = 0
-            kwargs = {{k: v for k, v in op.items() if k != "op"}}
-            hwp.set_para_shape(**kwargs)
-        elif cmd == "insert_table":
-            hwp.insert_table(op["rows"], op["cols"])
-        elif cmd == "fill_table":
-            hwp.fill_table(op["data"])
-    hwp.save_as(r"{win_output}", "HWPX")
-{pdf_line}
-    print("OK", flush=True)
-finally:
-    hwp.quit()
-'''
-    return _run_inline_script(script, timeout=timeout)
+        steps.append({"step": STEP_EXPORT_PDF, "path": output_pdf})
+    return run_job_plan(steps, timeout=timeout, profile_path=profile_path,
+                        stage=stage)
 
 
 def fill_template(hwpx_path, section_ops_list, output_hwpx, output_pdf=None,
-                  timeout=1200):
+                  timeout=None, profile_path=None, stage=False):
     """마커 기반 템플릿 채우기 — 섹션별 순차 실행.
 
-    각 섹션은 다음 순서로 처리된다:
+    각 섹션은 다음 순서로 처리된다 (src/com_jobs.fill_markers):
     1. 마커 텍스트를 찾아 커서 이동
     2. 마커가 포함된 줄 선택 및 삭제
     3. 오퍼레이션 리스트 실행 (텍스트/테이블/서식 삽입)
@@ -301,188 +454,177 @@ def fill_template(hwpx_path, section_ops_list, output_hwpx, output_pdf=None,
         section_ops_list: [{marker: str, ops: [dict]}, ...] 섹션별 오퍼레이션
         output_hwpx: 출력 HWPX 파일의 WSL 경로
         output_pdf: 출력 PDF 파일의 WSL 경로 (None이면 생략)
-        timeout: 실행 제한 시간 (초)
+        timeout: 전체 실행 상한 (초, None이면 하트비트 워치독만 적용)
+        profile_path: COM 계측 리포트(JSON) 저장 경로 (None이면 계측 안 함)
+        stage: True면 Windows 네이티브 임시 폴더에서 작업 (StagingArea 참고)
 
     Returns:
         bool: 성공 여부
     """
-    win_hwpx = wsl_to_win_path(hwpx_path)
-    win_output = wsl_to_win_path(output_hwpx)
+    steps = [
+        {"step": STEP_OPEN, "path": hwpx_path},
+        {"step": STEP_FILL_MARKERS, "sections": section_ops_list,
+         "checkpoint": output_hwpx},
+    ]
+    if output_pdf:
+        steps.append({"step": STEP_EXPORT_PDF, "path": output_pdf})
+    return run_job_plan(steps, timeout=timeout, visible=True,
+                        profile_path=profile_path, stage=stage)
 
-    ops_json = json.dumps(section_ops_list, ensure_ascii=False)
 
-    pdf_line = ""
-    if output_pdf:
-        win_pdf = wsl_to_win_path(output_pdf)
-        pdf_line = f'''
-    print("Saving PDF...", flush=True)
-    hwp.save_as_pdf(r"{win_pdf}")'''
+def delete_page_content(hwpx_path, search_text, output_hwpx, timeout=None,
+                        profile_path=None, stage=False):
+    """특정 텍스트가 포함된 페이지의 내용을 삭제한다.
 
-    script = f'''\
-import sys, os, json, time
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from src.hwp_com import HwpController
+    Args:
+        hwpx_path: HWPX 파일의 WSL 경로
+        search_text: 삭제할 페이지에 포함된 텍스트
+        output_hwpx: 출력 HWPX 파일의 WSL 경로
+        timeout: 전체 실행 상한 (초, None이면 하트비트 워치독만 적용)
+        profile_path: COM 계측 리포트(JSON) 저장 경로 (None이면 계측 안 함)
+        stage: True면 Windows 네이티브 임시 폴더에서 작업 (StagingArea 참고)
 
-section_ops_list = json.loads({repr(ops_json)})
+    Returns:
+        bool: 성공 여부
+    """
+    steps = [
+        {"step": STEP_OPEN, "path": hwpx_path},
+        {"step": STEP_DELETE_TEXT, "search_text": search_text},
+        {"step": STEP_SAVE_HWPX, "path": output_hwpx},
+    ]
+    return run_job_plan(steps, timeout=timeout, profile_path=profile_path,
+                        stage=stage)
 
-hwp = HwpController(visible=True)
-try:
-    hwp.open(r"{win_hwpx}")
-    pages_before = hwp.get_page_count()
-    print(f"Opened: {{pages_before}} pages", flush=True)
-
-    for si, section in enumerate(section_ops_list):
-        marker = section["marker"]
-        ops = section["ops"]
-        print(f"Section {{si+1}}/{{len(section_ops_list)}}: {{marker}} ({{len(ops)}} ops)", flush=True)
-
-        # 1. 문서 처음으로 이동
-        hwp.move_to_start()
-
-        # 2. 마커 찾기
-        found = hwp.find_text(marker)
-        if not found:
-            print(f"  WARNING: marker '{{marker}}' not found, skipping", flush=True)
-            continue
 
-        # 3. 마커가 포함된 줄 선택 및 삭제
-        hwp._hwp.HAction.Run("MoveLineBegin")
-        hwp._hwp.HAction.Run("MoveSelLineEnd")
-        hwp._hwp.HAction.Run("Delete")
+def _profile_snippets(win_profile):
+    """인라인 스크립트용 COM 계측 코드 조각을 생성한다.
 
-        # 3.5. 스타일을 '바탕글'로 리셋 (테이블 스타일 상속 방지)
-        try:
-            hwp._hwp.HAction.GetDefault("Style", hwp._hwp.HParameterSet.HStyle.HSet)
-            hwp._hwp.HParameterSet.HStyle.StyleName = "바탕글"
-            hwp._hwp.HAction.Execute("Style", hwp._hwp.HParameterSet.HStyle.HSet)
-        except Exception:
-            pass  # 스타일 리셋 실패해도 오퍼레이션 실행 계속
-
-        # 4. 오퍼레이션 실행 (post-format 방식)
-        # HWP COM의 CreateAction("InsertText")는 set_char_shape의 입력 서식을
-        # 무시하므로, 텍스트 삽입 후 선택 → 서식 적용 → 커서 복원 방식 사용.
-        # 최적화: 단일 서식 문단은 MoveParaBegin/End (O(1)),
-        #         혼합 서식 문단의 인라인 런은 MoveSelLeft×N (짧은 텍스트).
-        err_count = 0
-        pending_char = None
-        texts_in_para = 0
-        for oi, op in enumerate(ops):
-            cmd = op["op"]
-            try:
-                if cmd == "insert_text":
-                    texts_in_para += 1
-                    text = op["text"]
-                    hwp.insert_text(text)
-                    if pending_char and text:
-                        # 단일 텍스트 문단 여부 판별 (lookahead)
-                        sole = (texts_in_para == 1)
-                        if sole:
-                            for j in range(oi + 1, min(oi + 6, len(ops))):
-                                nc = ops[j]["op"]
-                                if nc in ("line_break", "page_break", "set_para_shape"):
-                                    break
-                                if nc == "insert_text":
-                                    sole = False
-                                    break
-                        if sole:
-                            hwp._hwp.HAction.Run("MoveParaBegin")
-                            hwp._hwp.HAction.Run("MoveSelParaEnd")
-                            hwp.set_char_shape(**pending_char)
-                            hwp._hwp.HAction.Run("Cancel")
-                            hwp._hwp.HAction.Run("MoveParaEnd")
-                        else:
-                            end_pos = hwp._hwp.GetPos()
-                            for _ in range(len(text)):
-                                hwp._hwp.HAction.Run("MoveSelLeft")
-                            hwp.set_char_shape(**pending_char)
-                            hwp._hwp.HAction.Run("Cancel")
-                            hwp._hwp.SetPos(*end_pos)
-                elif cmd == "line_break":
-                    texts_in_para = 0
-                    hwp.insert_line_break()
-                elif cmd == "page_break":
-                    texts_in_para = 0
-                    hwp._hwp.HAction.Run("BreakPage")
-                elif cmd == "set_char_shape":
-                    pending_char = {{k: v for k, v in op.items() if k != "op"}}
-                elif cmd == "set_para_shape":
-                    texts_in_para = 0
-                    kwargs = {{k: v for k, v in op.items() if k != "op"}}
-                    hwp.set_para_shape(**kwargs)
-                elif cmd == "insert_table":
-                    hwp.insert_table(op["rows"], op["cols"])
-                elif cmd == "fill_table":
-                    hwp.fill_table(op["data"])
-                elif cmd == "set_cell_background":
-                    hwp.set_cell_background(op["r"], op["g"], op["b"])
-            except Exception as e:
-                err_count += 1
-                if err_count <= 3:
-                    print(f"  WARNING op#{{oi}} {{cmd}}: {{e}}", flush=True)
-                elif err_count == 4:
-                    print(f"  (suppressing further warnings)", flush=True)
-        if err_count:
-            print(f"  {{err_count}} ops failed in this section", flush=True)
-
-        # 5. 중간 저장
-        hwp.save_as(r"{win_output}", "HWPX")
-        pages_now = hwp.get_page_count()
-        print(f"  Saved ({{pages_now}} pages)", flush=True)
-
-    pages_final = hwp.get_page_count()
-    print(f"Final: {{pages_final}} pages", flush=True)
-{pdf_line}
-    print("OK", flush=True)
-finally:
-    hwp.quit()
-'''
-    return _run_inline_script(script, timeout=timeout)
+    setup은 HwpController 생성 직후(최상위), teardown은 finally 블록의
+    hwp.quit() 직전에 삽입된다. 실패한 실행도 리포트가 남도록 teardown에서
+    JSON을 저장하고 요약을 stdout으로 출력한다 (bridge가 그대로 중계).
 
+    Args:
+        win_profile: 계측 리포트(JSON) 저장 경로의 Windows 경로 (None이면 계측 안 함)
 
-def delete_page_content(hwpx_path, search_text, output_hwpx, timeout=120):
-    """특정 텍스트가 포함된 페이지의 내용을 삭제한다.
+    Returns:
+        tuple: (setup 코드, teardown 코드)
+    """
+    if not win_profile:
+        return "prof = None", ""
+    setup = (
+        "from src.com_profiler import ComProfiler\n"
+        "prof = ComProfiler()\n"
+        "prof.attach(hwp)"
+    )
+    teardown = (
+        "    if prof is not None:\n"
+        f"        prof.write_json(r\"{win_profile}\")\n"
+        "        print(prof.summary_text(), flush=True)"
+    )
+    return setup, teardown
+
+
+def _watch_process(proc, stall_timeout=STALL_TIMEOUT, timeout=None, echo=True):
+    """실행 중인 프로세스의 stdout을 줄 단위로 읽으며 진행 여부를 감시
+
+    stdout 한 줄이 도착할 때마다 진행으로 간주한다. 하트비트 줄
+    ("@@HB <grace> <label>")은 출력하지 않고, 다음 진행까지 허용할 추가
+    대기 시간(grace)만 갱신한다 — PDF 변환처럼 조용히 오래 걸리는 단계는
+    COM 측이 단계 시작 전에 긴 grace를 알린다.
 
     Args:
-        hwpx_path: HWPX 파일의 WSL 경로
-        search_text: 삭제할 페이지에 포함된 텍스트
-        output_hwpx: 출력 HWPX 파일의 WSL 경로
-        timeout: 실행 제한 시간 (초)
+        proc: stdout/stderr가 PIPE인 subprocess.Popen
+        stall_timeout: 진행 없이 허용하는 최대 시간 (초, grace가 더 크면 grace)
+        timeout: 전체 실행 상한 (초, None이면 상한 없음)
+        echo: True면 각 줄을 "[bridge] ..." 형태로 즉시 출력
 
     Returns:
-        bool: 성공 여부
+        tuple: (stdout 줄 리스트, stderr 문자열, 중단 사유)
+            중단 사유는 정상 종료 시 None, 무진행이면 "stall", 상한 초과면 "timeout"
     """
-    win_hwpx = wsl_to_win_path(hwpx_path)
-    win_output = wsl_to_win_path(output_hwpx)
+    line_queue = queue.Queue()
+    stderr_chunks = []
+
+    def pump_stdout():
+        for raw in iter(proc.stdout.readline, b""):
+            line_queue.put(raw)
+        line_queue.put(None)
+
+    def drain_stderr():
+        stderr_chunks.append(proc.stderr.read())
+
+    readers = [
+        threading.Thread(target=pump_stdout, daemon=True),
+        threading.Thread(target=drain_stderr, daemon=True),
+    ]
+    for t in readers:
+        t.start()
+
+    start = last_progress = time.monotonic()
+    grace = 0
+    label = "start"
+    lines = []
+    reason = None
+
+    while True:
+        deadline = last_progress + max(stall_timeout, grace)
+        if timeout is not None:
+            deadline = min(deadline, start + timeout)
+        try:
+            raw = line_queue.get(timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Empty:
+            if timeout is not None and time.monotonic() >= start + timeout:
+                reason = "timeout"
+            else:
+                reason = "stall"
+            break
+        if raw is None:
+            break
+
+        last_progress = time.monotonic()
+        line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+        if line.startswith(HEARTBEAT_PREFIX):
+            parts = line.split(" ", 2)
+            try:
+                grace = float(parts[1])
+            except (IndexError, ValueError):
+                grace = 0
+            label = parts[2] if len(parts) > 2 else label
+            continue
 
-    script = f'''\
-import sys, os
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from src.hwp_com import HwpController
+        lines.append(line)
+        if echo:
+            print(f"[bridge] {line}", flush=True)
 
-hwp = HwpController(visible=False)
-try:
-    hwp.open(r"{win_hwpx}")
-    # 작성요령 텍스트를 찾아 해당 영역 삭제
-    found = hwp.find_text("{search_text}")
-    if found:
-        # 해당 줄의 내용 삭제 (전체 페이지 삭제는 복잡하므로 텍스트만 삭제)
-        hwp._hwp.HAction.Run("MoveLineBegin")
-        hwp._hwp.HAction.Run("MoveSelLineEnd")
-        hwp._hwp.HAction.Run("Delete")
-    hwp.save_as(r"{win_output}", "HWPX")
-    print("OK", flush=True)
-finally:
-    hwp.quit()
-'''
-    return _run_inline_script(script, timeout=timeout)
+    if reason is not None:
+        proc.kill()
+        idle = time.monotonic() - last_progress
+        if reason == "stall":
+            print(f"[bridge] No progress for {idle:.0f}s (last: {label}) — killed",
+                  file=sys.stderr)
+        else:
+            print(f"[bridge] Process timed out after {timeout}s (last: {label})",
+                  file=sys.stderr)
 
+    proc.wait()
+    # cmd.exe만 종료되고 자식이 파이프를 잡고 있을 수 있으므로 무한 대기하지 않는다
+    for t in readers:
+        t.join(timeout=5)
 
-def _run_inline_script(script_code, timeout=120):
+    stderr = b"".join(stderr_chunks).decode("utf-8", errors="replace")
+    return lines, stderr, reason
+
+
+def _run_inline_script(script_code, timeout=None, stall_timeout=STALL_TIMEOUT):
     """인라인 Python 스크립트를 Windows Python으로 실행
 
+    stdout은 도착하는 대로 중계하며, 하트비트 워치독이 stall_timeout 동안
+    진행이 없는 실행(예: 한글 대화상자 대기)을 즉시 종료한다.
+
     Args:
         script_code: 실행할 Python 코드
-        timeout: 실행 제한 시간 (초)
+        timeout: 전체 실행 상한 (초, None이면 상한 없음 — 워치독만 적용)
+        stall_timeout: 진행 없이 허용하는 최대 시간 (초)
 
     Returns:
         bool: 성공 여부 (stdout에 "OK" 포함 시 True)
@@ -502,23 +644,15 @@ def _run_inline_script(script_code, timeout=120):
             stderr=subprocess.PIPE,
         )
 
-        try:
-            stdout_bytes, stderr_bytes = proc.communicate(timeout=timeout)
-        except subprocess.TimeoutExpired:
-            proc.kill()
-            stdout_bytes, stderr_bytes = proc.communicate()
-            print("[bridge] Process timed out", file=sys.stderr)
+        lines, stderr, reason = _watch_process(
+            proc, stall_timeout=stall_timeout, timeout=timeout)
+        if reason is not None:
             return False
 
-        stdout = stdout_bytes.decode("utf-8", errors="replace")
-        stderr = stderr_bytes.decode("utf-8", errors="replace")
-
-        if stdout:
-            print(f"[bridge] {stdout.strip()}")
         if proc.returncode != 0:
             print(f"[bridge] STDERR: {stderr}", file=sys.stderr)
 
-        return "OK" in stdout
+        return "OK" in "\n".join(lines)
     finally:
         try:
             os.unlink(tmp_path)
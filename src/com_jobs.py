@@ -0,0 +1,287 @@
+"""COM 작업 계획(job plan) 실행기 — 한글 세션 하나에서 여러 단계를 순차 실행.
+
+bridge.run_job_plan()이 생성하는 인라인 스크립트가 Windows Python에서
+HwpController와 함께 사용한다. 문서 열기 → 텍스트 교체 → 마커 채우기 →
+저장 → PDF 변환 같은 파이프라인을 한글 실행/문서 열기 1회로 처리한다.
+
+pywin32를 직접 임포트하지 않으므로 WSL 측에서도 단계 상수를 임포트할 수 있다.
+
+단계 형식 (경로는 Windows 경로 — bridge가 변환):
+    {"step": "open", "path": str}
+    {"step": "replace", "replacements": {찾을_텍스트: 바꿀_텍스트}}
+    {"step": "fill_markers", "sections": [{"marker": str, "ops": [dict]}],
+     "checkpoint": str | None}        # 섹션마다 중간 저장할 HWPX 경로
+    {"step": "insert_ops", "ops": [dict]}   # 실패한 오퍼레이션이 있으면 중단
+    {"step": "delete_text", "search_text": str}
+    {"step": "save_hwpx", "path": str}
+    {"step": "export_pdf", "path": str}
+
+Usage (Windows 측):
+    from src.hwp_com import HwpController
+    from src.com_jobs import run_plan
+    with HwpController(visible=False) as hwp:
+        run_plan(hwp, steps)
+"""
+
+import time
+
+STEP_OPEN = 'open'
+STEP_REPLACE = 'replace'
+STEP_FILL_MARKERS = 'fill_markers'
+STEP_INSERT_OPS = 'insert_ops'
+STEP_DELETE_TEXT = 'delete_text'
+STEP_SAVE_HWPX = 'save_hwpx'
+STEP_EXPORT_PDF = 'export_pdf'
+
+# 경로 필드: 입력(읽기) / 출력(쓰기) — bridge의 경로 변환/스테이징에 사용
+INPUT_PATH_FIELDS = {STEP_OPEN: ('path',)}
+OUTPUT_PATH_FIELDS = {
+    STEP_SAVE_HWPX: ('path',),
+    STEP_EXPORT_PDF: ('path',),
+    STEP_FILL_MARKERS: ('checkpoint',),
+}
+
+# 오퍼레이션 실행 중 경고 출력 개수 제한
+MAX_OP_WARNINGS = 3
+
+# 하트비트: bridge 워치독이 진행 여부를 판단하는 stdout 신호
+# 형식: "@@HB <grace초> <label>" — grace는 다음 진행까지 허용할 추가 대기 시간
+HEARTBEAT_PREFIX = '@@HB'
+HEARTBEAT_EVERY_OPS = 25
+
+# 한글 실행(디스패치 재시도 포함)은 첫 출력까지 오래 걸릴 수 있음
+LAUNCH_GRACE = 180
+
+# 단계별 grace (초) — 한 번의 COM 호출이 길게 블록되는 단계만 지정
+STEP_GRACE = {
+    STEP_OPEN: 300,
+    STEP_SAVE_HWPX: 300,
+    STEP_EXPORT_PDF: 600,
+    STEP_REPLACE: 120,
+}
+
+
+def heartbeat(label, grace=0):
+    """워치독에 진행 신호를 보낸다 (stdout 한 줄, 즉시 flush).
+
+    Args:
+        label: 현재 작업 이름 (무진행 종료 시 메시지에 표시)
+        grace: 다음 진행 신호까지 허용할 추가 대기 시간 (초)
+    """
+    print(f"{HEARTBEAT_PREFIX} {grace} {label}", flush=True)
+
+
+def execute_ops(hwp, ops):
+    """COM 오퍼레이션 리스트를 현재 커서 위치에서 실행한다.
+
+    HWP COM의 CreateAction("InsertText")는 set_char_shape의 입력 서식을
+    무시하므로, 텍스트 삽입 후 선택 → 서식 적용 → 커서 복원 방식을 사용한다.
+    최적화: 단일 서식 문단은 MoveParaBegin/End (O(1)),
+            혼합 서식 문단의 인라인 런은 MoveSelLeft×N (짧은 텍스트).
+
+    Args:
+        hwp: HwpController 인스턴스
+        ops: md_to_ops가 생성한 오퍼레이션 리스트
+
+    Returns:
+        int: 실패한 오퍼레이션 수
+    """
+    err_count = 0
+    pending_char = None
+    texts_in_para = 0
+    for oi, op in enumerate(ops):
+        cmd = op["op"]
+        if oi and oi % HEARTBEAT_EVERY_OPS == 0:
+            heartbeat(f"op {oi}/{len(ops)}")
+        try:
+            if cmd == "insert_text":
+                texts_in_para += 1
+                text = op["text"]
+                hwp.insert_text(text)
+                if pending_char and text:
+                    # 단일 텍스트 문단 여부 판별 (lookahead)
+                    sole = (texts_in_para == 1)
+                    if sole:
+                        for j in range(oi + 1, min(oi + 6, len(ops))):
+                            nc = ops[j]["op"]
+                            if nc in ("line_break", "page_break", "set_para_shape"):
+                                break
+                            if nc == "insert_text":
+                                sole = False
+                                break
+                    if sole:
+                        hwp._hwp.HAction.Run("MoveParaBegin")
+                        hwp._hwp.HAction.Run("MoveSelParaEnd")
+                        hwp.set_char_shape(**pending_char)
+                        hwp._hwp.HAction.Run("Cancel")
+                        hwp._hwp.HAction.Run("MoveParaEnd")
+                    else:
+                        end_pos = hwp._hwp.GetPos()
+                        for _ in range(len(text)):
+                            hwp._hwp.HAction.Run("MoveSelLeft")
+                        hwp.set_char_shape(**pending_char)
+                        hwp._hwp.HAction.Run("Cancel")
+                        hwp._hwp.SetPos(*end_pos)
+            elif cmd == "line_break":
+                texts_in_para = 0
+                hwp.insert_line_break()
+            elif cmd == "page_break":
+                texts_in_para = 0
+                hwp._hwp.HAction.Run("BreakPage")
+            elif cmd == "set_char_shape":
+                pending_char = {k: v for k, v in op.items() if k != "op"}
+            elif cmd == "set_para_shape":
+                texts_in_para = 0
+                kwargs = {k: v for k, v in op.items() if k != "op"}
+                hwp.set_para_shape(**kwargs)
+            elif cmd == "insert_table":
+                hwp.insert_table(op["rows"], op["cols"])
+            elif cmd == "fill_table":
+                hwp.fill_table(op["data"])
+            elif cmd == "set_cell_background":
+                hwp.set_cell_background(op["r"], op["g"], op["b"])
+        except Exception as e:
+            err_count += 1
+            if err_count <= MAX_OP_WARNINGS:
+                print(f"  WARNING op#{oi} {cmd}: {e}", flush=True)
+            elif err_count == MAX_OP_WARNINGS + 1:
+                print("  (suppressing further warnings)", flush=True)
+    return err_count
+
+
+def _reset_body_style(hwp):
+    """스타일을 '바탕글'로 리셋 (테이블 스타일 상속 방지)."""
+    try:
+        hwp._hwp.HAction.GetDefault("Style", hwp._hwp.HParameterSet.HStyle.HSet)
+        hwp._hwp.HParameterSet.HStyle.StyleName = "바탕글"
+        hwp._hwp.HAction.Execute("Style", hwp._hwp.HParameterSet.HStyle.HSet)
+    except Exception:
+        pass  # 스타일 리셋 실패해도 오퍼레이션 실행 계속
+
+
+def fill_markers(hwp, sections, checkpoint=None, prof=None):
+    """마커 기반 섹션 채우기 — 섹션별 순차 실행.
+
+    각 섹션은 다음 순서로 처리된다:
+    1. 마커 텍스트를 찾아 커서 이동
+    2. 마커가 포함된 줄 선택 및 삭제
+    3. 오퍼레이션 리스트 실행 (텍스트/테이블/서식 삽입)
+    4. 중간 저장 (checkpoint 지정 시)
+
+    Args:
+        hwp: HwpController 인스턴스
+        sections: [{marker: str, ops: [dict]}, ...]
+        checkpoint: 섹션마다 저장할 HWPX 경로 (None이면 중간 저장 생략)
+        prof: ComProfiler (섹션 라벨 갱신용, 선택)
+    """
+    for si, section in enumerate(sections):
+        marker = section["marker"]
+        ops = section["ops"]
+        print(f"Section {si+1}/{len(sections)}: {marker} ({len(ops)} ops)", flush=True)
+        heartbeat(marker)
+        if prof is not None:
+            prof.section = marker
+
+        hwp.move_to_start()
+        if not hwp.find_text(marker):
+            print(f"  WARNING: marker '{marker}' not found, skipping", flush=True)
+            continue
+
+        hwp._hwp.HAction.Run("MoveLineBegin")
+        hwp._hwp.HAction.Run("MoveSelLineEnd")
+        hwp._hwp.HAction.Run("Delete")
+        _reset_body_style(hwp)
+
+        err_count = execute_ops(hwp, ops)
+        if err_count:
+            print(f"  {err_count} ops failed in this section", flush=True)
+
+        if checkpoint:
+            heartbeat(f"{marker} checkpoint", STEP_GRACE[STEP_SAVE_HWPX])
+            hwp.save_as(checkpoint, "HWPX")
+            print(f"  Saved ({hwp.get_page_count()} pages)", flush=True)
+
+    heartbeat("final page count", STEP_GRACE[STEP_OPEN])
+    print(f"Final: {hwp.get_page_count()} pages", flush=True)
+
+
+def _step_open(hwp, step, prof):
+    start = time.time()
+    hwp.open(step["path"])
+    print(f"Opened: {hwp.get_page_count()} pages ({time.time()-start:.1f}s)", flush=True)
+
+
+def _step_replace(hwp, step, prof):
+    hwp.find_and_replace_all(step["replacements"])
+
+
+def _step_fill_markers(hwp, step, prof):
+    fill_markers(hwp, step["sections"], checkpoint=step.get("checkpoint"), prof=prof)
+
+
+def _step_insert_ops(hwp, step, prof):
+    # create_document 계약 유지: 오퍼레이션 실패 시 저장/PDF 단계로 넘어가지 않음
+    err_count = execute_ops(hwp, step["ops"])
+    if err_count:
+        raise RuntimeError(f"{err_count} ops failed")
+
+
+def _step_delete_text(hwp, step, prof):
+    # 해당 줄의 내용 삭제 (전체 페이지 삭제는 복잡하므로 텍스트만 삭제)
+    if hwp.find_text(step["search_text"]):
+        hwp.select_line()
+        hwp.delete_selection()
+
+
+def _step_save_hwpx(hwp, step, prof):
+    hwp.save_as(step["path"], "HWPX")
+
+
+def _step_export_pdf(hwp, step, prof):
+    print("Saving PDF...", flush=True)
+    start = time.time()
+    hwp.save_as_pdf(step["path"])
+    print(f"PDF saved ({time.time()-start:.1f}s)", flush=True)
+
+
+STEP_HANDLERS = {
+    STEP_OPEN: _step_open,
+    STEP_REPLACE: _step_replace,
+    STEP_FILL_MARKERS: _step_fill_markers,
+    STEP_INSERT_OPS: _step_insert_ops,
+    STEP_DELETE_TEXT: _step_delete_text,
+    STEP_SAVE_HWPX: _step_save_hwpx,
+    STEP_EXPORT_PDF: _step_export_pdf,
+}
+
+
+def validate_plan(steps):
+    """작업 계획의 단계 이름을 검증한다.
+
+    Raises:
+        ValueError: 알 수 없는 단계가 있을 때
+    """
+    for i, step in enumerate(steps):
+        name = step.get("step")
+        if name not in STEP_HANDLERS:
+            raise ValueError(f"Unknown job step #{i}: {name!r}")
+
+
+def run_plan(hwp, steps, prof=None):
+    """작업 계획을 순서대로 실행한다.
+
+    단계에서 발생한 예외는 그대로 전파된다 (이후 단계 중단).
+    각 단계 시작 전에 하트비트를 내보내 bridge 워치독에 진행을 알린다.
+
+    Args:
+        hwp: HwpController 인스턴스
+        steps: 단계 dict 리스트 (모듈 docstring 참고)
+        prof: ComProfiler (선택) — 단계/섹션 라벨로 집계
+    """
+    validate_plan(steps)
+    for step in steps:
+        name = step["step"]
+        if prof is not None:
+            prof.section = name
+        heartbeat(name, STEP_GRACE.get(name, 0))
+        STEP_HANDLERS[name](hwp, step, prof)
@@ -0,0 +1,328 @@
+"""COM 호출 계측 모듈 — HwpController 호출 횟수/지연시간 수집.
+
+Pass 2에서 시간이 어디에 쓰이는지 파악하기 위한 opt-in 계측 레이어.
+HwpController 인스턴스의 공개 메서드와 내부 COM 객체의
+HAction.Run/Execute/GetDefault 호출을 감싸서 호출 횟수, 누적 시간,
+지연시간 히스토그램을 (호출명, 섹션) 단위로 집계한다.
+
+pywin32에 의존하지 않으므로 Windows/WSL 양쪽에서 임포트할 수 있다.
+
+Usage (Windows 측 인라인 스크립트):
+    from src.hwp_com import HwpController
+    from src.com_profiler import ComProfiler
+
+    hwp = HwpController(visible=False)
+    prof = ComProfiler()
+    prof.attach(hwp)
+    prof.section = '##SEC1_CONTENT##'
+    hwp.insert_text('...')
+    prof.write_json('C:\\\\tmp\\\\com_profile.json')
+    print(prof.summary_text())
+"""
+
+import functools
+import json
+import time
+
+# 히스토그램 버킷 상한 (ms) — 마지막 버킷은 상한 없음
+HISTOGRAM_BOUNDS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+# 호출 종류
+KIND_METHOD = 'method'
+KIND_ACTION = 'action'
+KIND_COM = 'com'
+
+# 계측할 HAction 메서드
+HACTION_METHODS = ('Run', 'Execute', 'GetDefault')
+
+# 계측할 COM 객체 직접 호출 메서드 (HParameterSet 등 속성 접근은 제외)
+RAW_COM_METHODS = (
+    'Open', 'Save', 'SaveAs', 'Clear', 'GetPos', 'SetPos', 'GetTextFile',
+    'CreateAction', 'GetFieldList', 'GetFieldText', 'PutFieldText',
+)
+
+GLOBAL_SECTION = '(global)'
+
+
+def _bucket_labels():
+    labels = [f'<={b}ms' for b in HISTOGRAM_BOUNDS_MS]
+    labels.append(f'>{HISTOGRAM_BOUNDS_MS[-1]}ms')
+    return labels
+
+
+class _CallStats:
+    """단일 (호출명, 섹션) 조합의 누적 통계."""
+
+    __slots__ = ('count', 'errors', 'total', 'min', 'max', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.min = None
+        self.max = 0.0
+        self.buckets = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+
+    def add(self, elapsed, failed=False):
+        self.count += 1
+        if failed:
+            self.errors += 1
+        self.total += elapsed
+        if self.min is None or elapsed < self.min:
+            self.min = elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        ms = elapsed * 1000
+        for i, bound in enumerate(HISTOGRAM_BOUNDS_MS):
+            if ms <= bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'total_ms': round(self.total * 1000, 3),
+            'mean_ms': round(self.total * 1000 / self.count, 4) if self.count else 0.0,
+            'min_ms': round((self.min or 0.0) * 1000, 4),
+            'max_ms': round(self.max * 1000, 4),
+            'histogram': dict(zip(_bucket_labels(), self.buckets)),
+        }
+
+
+class ComProfiler:
+    """HwpController 호출 계측기.
+
+    Attributes:
+        section: 현재 섹션 라벨 (None이면 '(global)'로 집계)
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        """
+        Args:
+            clock: 시간 측정 함수 (테스트용 교체 가능)
+        """
+        self._clock = clock
+        self._stats = {}  # (kind, name, section) -> _CallStats
+        self._started = clock()
+        self.section = None
+
+    # --- 기록 ---
+
+    def record(self, kind, name, elapsed, failed=False):
+        """호출 1건을 기록한다.
+
+        Args:
+            kind: 'method', 'action', 'com' 중 하나
+            name: 호출명 (예: 'set_char_shape', 'Run:MoveSelLeft')
+            elapsed: 소요 시간 (초)
+            failed: 예외 발생 여부
+        """
+        section = self.section or GLOBAL_SECTION
+        key = (kind, name, section)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = _CallStats()
+        stats.add(elapsed, failed)
+
+    def wrap(self, kind, name, func):
+        """func 호출을 계측하는 래퍼를 반환한다."""
+        clock = self._clock
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = clock()
+            failed = True
+            try:
+                result = func(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                self.record(kind, name, clock() - start, failed)
+
+        return timed
+
+    # --- 부착 ---
+
+    def attach(self, controller):
+        """HwpController 인스턴스에 계측을 부착한다.
+
+        공개 메서드는 인스턴스 속성으로 덮어써서 계측하고, 내부 COM 객체
+        (controller._hwp)는 HAction 호출을 가로채는 프록시로 교체한다.
+        HwpController 내부 메서드도 self._hwp를 통해 COM을 호출하므로
+        메서드 단위와 액션 단위가 모두 집계된다.
+
+        Args:
+            controller: HwpController 인스턴스
+
+        Returns:
+            controller (체이닝용)
+        """
+        cls = type(controller)
+        for attr in dir(cls):
+            if attr.startswith('_'):
+                continue
+            if isinstance(getattr(cls, attr, None), property):
+                continue
+            method = getattr(controller, attr)
+            if callable(method):
+                setattr(controller, attr, self.wrap(KIND_METHOD, attr, method))
+
+        controller._hwp = _ComProxy(controller._hwp, self)
+        return controller
+
+    # --- 리포트 ---
+
+    def elapsed(self):
+        """계측 시작 이후 경과 시간 (초)."""
+        return self._clock() - self._started
+
+    def report(self):
+        """집계 결과를 dict로 반환한다.
+
+        Returns:
+            dict: {
+                'wall_seconds': float,
+                'calls': [{kind, name, section, count, total_ms, ...}, ...],
+                'by_name': [{kind, name, count, total_ms, ...}, ...],
+                'by_section': {section: {count, total_ms}},
+            }
+            calls/by_name은 total_ms 내림차순.
+        """
+        calls = []
+        by_name = {}
+        by_section = {}
+
+        for (kind, name, section), stats in self._stats.items():
+            entry = {'kind': kind, 'name': name, 'section': section}
+            entry.update(stats.to_dict())
+            calls.append(entry)
+
+            merged = by_name.get((kind, name))
+            if merged is None:
+                merged = by_name[(kind, name)] = _CallStats()
+            _merge_stats(merged, stats)
+
+            # 메서드 시간은 내부 액션 시간을 포함하므로 섹션 합계는 액션/COM 기준
+            if kind != KIND_METHOD:
+                sec = by_section.setdefault(section, {'count': 0, 'total_ms': 0.0})
+                sec['count'] += stats.count
+                sec['total_ms'] = round(sec['total_ms'] + stats.total * 1000, 3)
+
+        by_name_list = []
+        for (kind, name), stats in by_name.items():
+            entry = {'kind': kind, 'name': name}
+            entry.update(stats.to_dict())
+            by_name_list.append(entry)
+
+        calls.sort(key=lambda e: e['total_ms'], reverse=True)
+        by_name_list.sort(key=lambda e: e['total_ms'], reverse=True)
+
+        return {
+            'wall_seconds': round(self.elapsed(), 3),
+            'histogram_bounds_ms': list(HISTOGRAM_BOUNDS_MS),
+            'calls': calls,
+            'by_name': by_name_list,
+            'by_section': by_section,
+        }
+
+    def write_json(self, path):
+        """집계 결과를 JSON 파일로 저장한다.
+
+        Args:
+            path: 저장 경로
+
+        Returns:
+            str: 저장 경로
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+        return path
+
+    def summary_text(self, top=15):
+        """상위 호출 요약 텍스트를 반환한다.
+
+        Args:
+            top: 출력할 최대 항목 수 (누적 시간 기준)
+        """
+        rep = self.report()
+        lines = [
+            f"COM profile: {rep['wall_seconds']:.1f}s wall",
+            f"{'kind':<7} {'name':<32} {'count':>8} {'total_ms':>11} {'mean_ms':>9} {'max_ms':>9}",
+        ]
+        for e in rep['by_name'][:top]:
+            lines.append(
+                f"{e['kind']:<7} {e['name'][:32]:<32} {e['count']:>8} "
+                f"{e['total_ms']:>11.1f} {e['mean_ms']:>9.3f} {e['max_ms']:>9.1f}"
+            )
+        if rep['by_section']:
+            lines.append('sections (action+com time):')
+            for section, sec in sorted(rep['by_section'].items(),
+                                       key=lambda kv: kv[1]['total_ms'], reverse=True):
+                lines.append(f"  {section}: {sec['count']} calls, {sec['total_ms']:.1f} ms")
+        return '\n'.join(lines)
+
+
+def _merge_stats(dst, src):
+    dst.count += src.count
+    dst.errors += src.errors
+    dst.total += src.total
+    if src.min is not None and (dst.min is None or src.min < dst.min):
+        dst.min = src.min
+    dst.max = max(dst.max, src.max)
+    dst.buckets = [a + b for a, b in zip(dst.buckets, src.buckets)]
+
+
+class _HActionProxy:
+    """HAction COM 객체 프록시 — Run/Execute/GetDefault를 액션명별로 계측."""
+
+    def __init__(self, target, profiler):
+        object.__setattr__(self, '_target', target)
+        object.__setattr__(self, '_profiler', profiler)
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if name not in HACTION_METHODS:
+            return attr
+        profiler = self._profiler
+        clock = profiler._clock
+
+        def timed(action, *args):
+            start = clock()
+            failed = True
+            try:
+                result = attr(action, *args)
+                failed = False
+                return result
+            finally:
+                profiler.record(KIND_ACTION, f'{name}:{action}', clock() - start, failed)
+
+        return timed
+
+    def __setattr__(self, name, value):
+        setattr(self._target, name, value)
+
+
+class _ComProxy:
+    """HWPFrame.HwpObject 프록시 — HAction과 주요 직접 호출만 가로챈다."""
+
+    def __init__(self, target, profiler):
+        object.__setattr__(self, '_target', target)
+        object.__setattr__(self, '_profiler', profiler)
+        object.__setattr__(self, '_haction', None)
+
+    def __getattr__(self, name):
+        if name == 'HAction':
+            if self._haction is None:
+                object.__setattr__(self, '_haction',
+                                   _HActionProxy(self._target.HAction, self._profiler))
+            return self._haction
+        attr = getattr(self._target, name)
+        if name in RAW_COM_METHODS:
+            return self._profiler.wrap(KIND_COM, name, attr)
+        return attr
+
+    def __setattr__(self, name, value):
+        setattr(self._target, name, value)
@@ -0,0 +1,124 @@
+"""PDF 비교 스트리밍 리포트 — 페이지 결과를 JSON lines로 즉시 기록.
+
+PdfComparator.compare는 모든 페이지 결과를 메모리에 모았다가 마지막에
+report.json을 쓴다. 긴 문서에서 중간에 중단(Ctrl-C, 충돌)되면 결과가
+모두 사라진다. 스트리밍 모드에서는:
+
+  - pages.jsonl 첫 줄에 비교 설정(헤더), 이후 페이지가 끝날 때마다 한 줄씩
+    추가하고 flush한다.
+  - 재개(resume) 시 헤더(두 PDF의 SHA-256 + 비교 설정)가 같으면 이미 기록된
+    페이지를 건너뛴다. 중단 중 잘린 마지막 줄은 버린다.
+  - 요약 통계(RunningSummary)는 페이지가 추가될 때마다 누적 갱신한다.
+    텍스트 유사도가 상한(text_stage "bound")인 페이지는 텍스트 일치도
+    평균에서 빼고 text_bound_pages로 따로 모은다.
+
+Usage:
+    stream = PageStream('output/compare_report/pages.jsonl', header)
+    done = stream.open(resume=True)        # {페이지: 결과}
+    stream.write(page_result)
+    stream.close()
+"""
+
+import json
+import os
+
+from src.text_similarity import STAGE_BOUND
+
+STREAM_VERSION = 2
+STREAM_NAME = "pages.jsonl"
+
+
+class RunningSummary:
+    """페이지 결과를 하나씩 받아 누적하는 요약 통계."""
+
+    def __init__(self):
+        self.count = 0
+        self.ssim_sum = 0.0
+        self.text_count = 0
+        self.text_sum = 0.0
+        self.text_bound_pages = []
+
+    def add(self, page_result):
+        self.count += 1
+        self.ssim_sum += page_result["ssim"]
+        if page_result.get("text_stage") == STAGE_BOUND:
+            self.text_bound_pages.append(page_result["page"])
+            return
+        self.text_count += 1
+        self.text_sum += 1.0 if page_result["text_match"] else page_result.get("text_similarity", 0.0)
+
+    @property
+    def overall_ssim(self):
+        return self.ssim_sum / self.count if self.count else 0.0
+
+    @property
+    def overall_text_match(self):
+        """상한 판정 페이지를 뺀 텍스트 일치도 평균."""
+        return self.text_sum / self.text_count if self.text_count else 0.0
+
+
+def _read_lines(path):
+    """JSON lines 파일의 유효한 레코드 (잘린/손상된 줄은 무시)."""
+    records = []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+    except OSError:
+        return []
+    return records
+
+
+class PageStream:
+    """pages.jsonl 추가 기록기."""
+
+    def __init__(self, path, header):
+        """
+        Args:
+            path: JSON lines 파일 경로
+            header: 비교 설정 dict (재개 가능 여부 판정에 사용)
+        """
+        self.path = path
+        self.header = dict(header, type="header", version=STREAM_VERSION)
+        self._file = None
+
+    def open(self, resume=False):
+        """파일을 열고 재개할 페이지 결과를 반환한다.
+
+        Returns:
+            dict: {참조 페이지: 결과} (새로 시작하면 빈 dict)
+        """
+        done = {}
+        if resume:
+            records = _read_lines(self.path)
+            if records and records[0] == self.header:
+                for rec in records[1:]:
+                    if rec.get("type") == "page":
+                        rec.pop("type")
+                        done[rec["page"]] = rec
+            elif records:
+                print(f"  스트림 헤더가 달라 처음부터 비교합니다: {self.path}")
+
+        # 유효한 줄만 다시 쓴 뒤 추가 모드로 연다 (잘린 마지막 줄 제거)
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(self.header, ensure_ascii=False) + "\n")
+            for rec in done.values():
+                f.write(json.dumps(dict(rec, type="page"), ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.path)
+        self._file = open(self.path, "a", encoding="utf-8")
+        return done
+
+    def write(self, page_result):
+        """페이지 결과 한 줄을 추가하고 flush한다."""
+        self._file.write(json.dumps(dict(page_result, type="page"), ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -4,11 +4,19 @@ HWPX 파일의 section0.xml과 header.xml을 파싱하여
 문서 구조(커버 페이지, 본문 섹션, 표 등)를 JSON으로 추출한다.
 임의의 HWPX 파일을 --hwpx 인자로 지정할 수 있다.
 
+추출 함수들은 HWPX 경로 또는 ExtractedDocument를 받는다. ExtractedDocument는
+각 XML 파트를 lxml로 한 번만 파싱하고 최상위 단락/표 목록을 캐시하므로,
+여러 추출기를 연달아 실행해도 ZIP을 다시 열거나 다시 파싱하지 않는다.
+
 Usage:
     python3 src/extract_template.py --hwpx ref/test_01.hwpx             # 전체 구조 추출
     python3 src/extract_template.py --hwpx ref/test_01.hwpx --cover     # 커버 페이지만
     python3 src/extract_template.py --hwpx ref/test_01.hwpx --all-tables  # 모든 표 목록
     python3 src/extract_template.py --hwpx ref/새양식.hwpx --generate-template-config -o templates/새양식/
+
+--generate-template-config는 템플릿 레지스트리(src/template_registry.py)를 사용한다.
+출력 디렉토리의 template.json이 같은 내용의 템플릿에서 만들어졌으면(source_sha256)
+수동 보정한 설정을 덮어쓰지 않고 건너뛴다 (--force로 다시 생성).
 """
 
 import zipfile
@@ -18,6 +26,14 @@ import sys
 import os
 from pathlib import Path
 
+# lxml은 ExtractedDocument/스트리밍 추출에만 필요 — NAMESPACES와
+# read_xml_from_hwpx만 쓰는 모듈(page_estimator 등)은 lxml 없이 임포트 가능
+try:
+    from lxml import etree
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
 NAMESPACES = {
     'hp': 'http://www.hancom.co.kr/hwpml/2011/paragraph',
     'hp10': 'http://www.hancom.co.kr/hwpml/2016/paragraph',
@@ -34,7 +50,11 @@ NAMESPACES = {
 for prefix, uri in NAMESPACES.items():
     ET.register_namespace(prefix, uri)
 
-HWPX_PATH = Path(__file__).resolve().parent.parent / 'ref' / 'test_01.hwpx'
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+if str(PROJECT_DIR) not in sys.path:
+    sys.path.insert(0, str(PROJECT_DIR))
+
+HWPX_PATH = PROJECT_DIR / 'ref' / 'test_01.hwpx'
 
 
 def read_xml_from_hwpx(hwpx_path, inner_path):
@@ -44,6 +64,70 @@ def read_xml_from_hwpx(hwpx_path, inner_path):
     return ET.fromstring(data)
 
 
+class ExtractedDocument:
+    """HWPX 파일의 section0.xml/header.xml을 한 번씩만 파싱하여 공유하는 문서 모델.
+
+    파트는 처음 접근할 때 lxml로 파싱하고, 최상위 단락(hp:p)과 전체 표(hp:tbl)
+    목록도 처음 접근할 때 한 번만 만든다.
+    """
+
+    SECTION_PATH = 'Contents/section0.xml'
+    HEADER_PATH = 'Contents/header.xml'
+
+    _parser = etree.XMLParser(huge_tree=True) if HAS_LXML else None
+
+    def __init__(self, hwpx_path):
+        if not HAS_LXML:
+            raise ImportError("ExtractedDocument에는 lxml이 필요합니다 (pip install lxml)")
+        self.path = str(hwpx_path)
+        self._parts = {}
+        self._top_paras = None
+        self._tables = None
+
+    def part(self, inner_path):
+        """ZIP 내부 XML 파트의 lxml root (파트별로 한 번만 파싱)."""
+        root = self._parts.get(inner_path)
+        if root is None:
+            with zipfile.ZipFile(self.path, 'r') as z:
+                data = z.read(inner_path)
+            root = etree.fromstring(data, self._parser)
+            self._parts[inner_path] = root
+        return root
+
+    @property
+    def name(self):
+        return Path(self.path).stem
+
+    @property
+    def section(self):
+        return self.part(self.SECTION_PATH)
+
+    @property
+    def header(self):
+        return self.part(self.HEADER_PATH)
+
+    @property
+    def top_paras(self):
+        """section0의 최상위 hp:p 목록."""
+        if self._top_paras is None:
+            self._top_paras = self.section.findall('hp:p', NAMESPACES)
+        return self._top_paras
+
+    @property
+    def tables(self):
+        """section0의 모든 hp:tbl (문서 순서, 중첩 표 포함)."""
+        if self._tables is None:
+            self._tables = self.section.findall('.//hp:tbl', NAMESPACES)
+        return self._tables
+
+
+def _as_document(source):
+    """HWPX 경로 또는 ExtractedDocument → ExtractedDocument."""
+    if isinstance(source, ExtractedDocument):
+        return source
+    return ExtractedDocument(source)
+
+
 def get_cell_text(tc):
     """hp:tc 요소에서 모든 텍스트를 추출. 줄바꿈은 \\n으로 구분."""
     lines = []
@@ -136,8 +220,7 @@ def extract_table(tbl_elem):
 
 def extract_cover_table(hwpx_path):
     """커버 페이지 표(35x11)를 추출하여 필드 매핑 반환."""
-    root = read_xml_from_hwpx(hwpx_path, 'Contents/section0.xml')
-    top_paras = root.findall('hp:p', NAMESPACES)
+    top_paras = _as_document(hwpx_path).top_paras
 
     # 첫 번째 단락에 커버 표가 있음
     p0 = top_paras[0]
@@ -232,66 +315,48 @@ def _extract_company_list(cell_map, start_row, end_row, has_header=True):
     return companies
 
 
-def extract_body_sections(hwpx_path):
-    """본문 섹션 구조를 추출 (목차 이후의 실제 내용)."""
-    root = read_xml_from_hwpx(hwpx_path, 'Contents/section0.xml')
-    top_paras = root.findall('hp:p', NAMESPACES)
-
-    sections = []
-    current_section = None
-    current_subsection = None
-
-    # 본문은 P36 ("1. 솔루션 구축 개요") 부터 시작
-    # P0-P1: 커버+작성요령, P2: 빈 줄, P3: 목차, P4-P35: TOC 항목
-    for i, p in enumerate(top_paras):
+def _body_records(numbered_paras):
+    """(인덱스, 최상위 hp:p) 시퀀스 → 섹션/서브섹션/표/그림/단락 레코드 (평탄)."""
+    for i, p in numbered_paras:
         text = get_paragraph_text(p)
         para_pr = p.get('paraPrIDRef', '')
-        style = p.get('styleIDRef', '0')
-
-        # 직접 포함된 표/그림 확인
-        has_table = False
-        has_pic = False
-        table_info = None
-        for run in p.findall('hp:run', NAMESPACES):
-            tbl = run.find('hp:tbl', NAMESPACES)
-            if tbl is not None:
-                has_table = True
-                table_info = {
-                    'rowCnt': int(tbl.get('rowCnt', '0')),
-                    'colCnt': int(tbl.get('colCnt', '0')),
-                }
-            if run.find('hp:pic', NAMESPACES) is not None:
-                has_pic = True
 
         # 메인 섹션 헤더 감지 (예: "1. 솔루션 구축 개요")
         if text and _is_main_section_header(text, para_pr):
-            current_section = {
+            yield {
                 'type': 'section',
                 'title': text,
                 'paraIndex': i,
                 'paraPrIDRef': para_pr,
-                'children': [],
             }
-            sections.append(current_section)
-            current_subsection = None
             continue
 
         # 서브섹션 헤더 감지 (예: "1.1 솔루션 개발 배경 및 필요성")
         if text and _is_subsection_header(text, para_pr):
-            current_subsection = {
+            yield {
                 'type': 'subsection',
                 'title': text,
                 'paraIndex': i,
                 'paraPrIDRef': para_pr,
-                'children': [],
             }
-            if current_section:
-                current_section['children'].append(current_subsection)
             continue
 
+        # 직접 포함된 표/그림 확인
+        has_pic = False
+        table_info = None
+        for run in p.findall('hp:run', NAMESPACES):
+            tbl = run.find('hp:tbl', NAMESPACES)
+            if tbl is not None:
+                table_info = {
+                    'rowCnt': int(tbl.get('rowCnt', '0')),
+                    'colCnt': int(tbl.get('colCnt', '0')),
+                }
+            if run.find('hp:pic', NAMESPACES) is not None:
+                has_pic = True
+
         # 일반 콘텐츠
         content_item = None
-        if has_table and table_info:
+        if table_info:
             content_item = {
                 'type': 'table',
                 'paraIndex': i,
@@ -316,13 +381,40 @@ def extract_body_sections(hwpx_path):
             }
 
         if content_item:
+            yield content_item
+
+
+def _nest_records(records):
+    """평탄한 본문 레코드를 섹션 > 서브섹션 > 콘텐츠 트리로 묶는다."""
+    sections = []
+    current_section = None
+    current_subsection = None
+
+    for rec in records:
+        if rec['type'] == 'section':
+            current_section = dict(rec, children=[])
+            sections.append(current_section)
+            current_subsection = None
+        elif rec['type'] == 'subsection':
+            current_subsection = dict(rec, children=[])
+            if current_section:
+                current_section['children'].append(current_subsection)
+        else:
             target = current_subsection if current_subsection else current_section
             if target:
-                target['children'].append(content_item)
+                target['children'].append(rec)
 
     return sections
 
 
+def extract_body_sections(hwpx_path):
+    """본문 섹션 구조를 추출 (목차 이후의 실제 내용)."""
+    # 본문은 P36 ("1. 솔루션 구축 개요") 부터 시작
+    # P0-P1: 커버+작성요령, P2: 빈 줄, P3: 목차, P4-P35: TOC 항목
+    top_paras = _as_document(hwpx_path).top_paras
+    return _nest_records(_body_records(enumerate(top_paras)))
+
+
 def _is_main_section_header(text, para_pr):
     """메인 섹션 헤더인지 판별 (숫자. 으로 시작, 특정 paraPr)."""
     import re
@@ -346,7 +438,7 @@ def _is_subsection_header(text, para_pr):
 
 def extract_styles(hwpx_path):
     """header.xml에서 사용된 스타일 정보를 추출."""
-    root = read_xml_from_hwpx(hwpx_path, 'Contents/header.xml')
+    root = _as_document(hwpx_path).header
 
     result = {
         'fonts': {},
@@ -440,16 +532,16 @@ def extract_styles(hwpx_path):
 
 def extract_document_structure(hwpx_path):
     """HWPX 파일에서 전체 문서 구조를 추출."""
+    doc = _as_document(hwpx_path)
     return {
-        'cover': extract_cover_table(hwpx_path),
-        'sections': extract_body_sections(hwpx_path),
+        'cover': extract_cover_table(doc),
+        'sections': extract_body_sections(doc),
     }
 
 
 def extract_key_tables(hwpx_path):
     """본문의 주요 데이터 표들을 추출 (스키마 정의에 필요한 표)."""
-    root = read_xml_from_hwpx(hwpx_path, 'Contents/section0.xml')
-    top_paras = root.findall('hp:p', NAMESPACES)
+    top_paras = _as_document(hwpx_path).top_paras
 
     key_tables = {}
 
@@ -500,8 +592,9 @@ def _try_extract_table(top_paras, para_idx, name, result_dict):
 
 def generate_sample_data(hwpx_path):
     """참조 문서에서 실제 내용을 추출하여 sample_input.json 형태로 반환."""
-    cover = extract_cover_table(hwpx_path)
-    key_tables = extract_key_tables(hwpx_path)
+    doc = _as_document(hwpx_path)
+    cover = extract_cover_table(doc)
+    key_tables = extract_key_tables(doc)
 
     # 개발 솔루션 목록 (줄바꿈으로 구분)
     sol_text = cover.get('개발솔루션기능', '')
@@ -567,50 +660,101 @@ def generate_sample_data(hwpx_path):
 
 def extract_all_tables(hwpx_path):
     """HWPX 파일에서 모든 표를 추출하여 요약 목록 반환."""
-    root = read_xml_from_hwpx(hwpx_path, 'Contents/section0.xml')
-    tables = root.findall('.//hp:tbl', NAMESPACES)
-
-    result = []
-    for i, tbl in enumerate(tables):
-        row_cnt = int(tbl.get('rowCnt', '0'))
-        col_cnt = int(tbl.get('colCnt', '0'))
-
-        # 첫 번째 셀의 텍스트를 미리보기로 추출
-        first_cell_text = ''
-        first_tc = tbl.find('.//hp:tc', NAMESPACES)
-        if first_tc is not None:
-            first_cell_text = get_cell_text(first_tc)[:50]
-
-        sz = tbl.find('hp:sz', NAMESPACES)
-        width = int(sz.get('width', '0')) if sz is not None else 0
-        height = int(sz.get('height', '0')) if sz is not None else 0
-
-        result.append({
-            'index': i,
-            'rowCnt': row_cnt,
-            'colCnt': col_cnt,
-            'width': width,
-            'height': height,
-            'preview': first_cell_text,
-        })
+    tables = _as_document(hwpx_path).tables
+    return [_table_summary(i, tbl) for i, tbl in enumerate(tables)]
 
-    return result
 
+def _table_summary(index, tbl):
+    """hp:tbl 요소의 크기와 첫 셀 미리보기."""
+    # 첫 번째 셀의 텍스트를 미리보기로 추출
+    first_cell_text = ''
+    first_tc = tbl.find('.//hp:tc', NAMESPACES)
+    if first_tc is not None:
+        first_cell_text = get_cell_text(first_tc)[:50]
+
+    sz = tbl.find('hp:sz', NAMESPACES)
+    width = int(sz.get('width', '0')) if sz is not None else 0
+    height = int(sz.get('height', '0')) if sz is not None else 0
+
+    return {
+        'index': index,
+        'rowCnt': int(tbl.get('rowCnt', '0')),
+        'colCnt': int(tbl.get('colCnt', '0')),
+        'width': width,
+        'height': height,
+        'preview': first_cell_text,
+    }
+
+
+# ---------------------------------------------------------------------------
+# 스트리밍 추출 (iterparse) — 대용량 section0.xml
+# ---------------------------------------------------------------------------
+
+_HP_P_TAG = f'{{{NAMESPACES["hp"]}}}p'
+
+
+def iter_top_paragraphs(hwpx_path):
+    """section0.xml을 iterparse로 읽으며 완성된 최상위 hp:p를 하나씩 내보낸다.
+
+    내보낸 단락은 호출자가 다음 값을 요청하는 시점에 비워지고(clear) 앞선
+    형제 요소와 함께 root에서 제거되므로, 메모리는 가장 큰 단락 하나 크기로
+    유지된다. 요소를 보관하지 말고 필요한 값만 꺼내 써야 한다.
+
+    Yields:
+        tuple: (최상위 단락 인덱스, hp:p lxml Element)
+    """
+    if not HAS_LXML:
+        raise ImportError("스트리밍 추출에는 lxml이 필요합니다 (pip install lxml)")
+    with zipfile.ZipFile(str(hwpx_path), 'r') as z:
+        with z.open(ExtractedDocument.SECTION_PATH) as f:
+            index = 0
+            for _, elem in etree.iterparse(f, events=('end',), tag=_HP_P_TAG,
+                                           huge_tree=True):
+                parent = elem.getparent()
+                if parent is None or parent.getparent() is not None:
+                    continue  # 표 셀 안의 단락 — 최상위 단락과 함께 처리
+                yield index, elem
+                index += 1
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del parent[0]
+                parent.remove(elem)
+
+
+def iter_body_records(hwpx_path):
+    """본문 레코드(섹션/서브섹션/표/그림/단락)를 스트리밍으로 내보낸다.
+
+    extract_body_sections와 같은 레코드를 children 없이 문서 순서대로 반환한다.
+    """
+    return _body_records(iter_top_paragraphs(hwpx_path))
 
-def generate_template_config(hwpx_path, output_dir):
-    """HWPX 파일을 분석하여 template.json과 field_map.json 초안을 생성.
+
+def stream_body_sections(hwpx_path):
+    """extract_body_sections의 스트리밍 버전 (전체 트리를 만들지 않음)."""
+    return _nest_records(iter_body_records(hwpx_path))
+
+
+def iter_all_tables(hwpx_path):
+    """모든 표 요약을 스트리밍으로 내보낸다 (extract_all_tables와 같은 순서/내용)."""
+    index = 0
+    for _, p in iter_top_paragraphs(hwpx_path):
+        for tbl in p.iterfind('.//hp:tbl', NAMESPACES):
+            yield _table_summary(index, tbl)
+            index += 1
+
+
+def analyze_template(hwpx_path):
+    """HWPX 파일을 분석하여 템플릿 설정 초안과 표/스타일 요약을 만든다 (파일 쓰기 없음).
 
     Args:
-        hwpx_path: 분석할 HWPX 파일 경로
-        output_dir: 설정 파일을 저장할 디렉토리
+        hwpx_path: 분석할 HWPX 파일 경로 또는 ExtractedDocument
 
     Returns:
-        dict: 생성 결과 요약
+        dict: template_config, field_map, tables (extract_all_tables),
+              styles (summarize_styles), cover_table_size, empty_cells_found
     """
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
-
-    root = read_xml_from_hwpx(hwpx_path, 'Contents/section0.xml')
-    all_tables = root.findall('.//hp:tbl', NAMESPACES)
+    doc = _as_document(hwpx_path)
+    all_tables = doc.tables
 
     # 가장 큰 표를 커버 테이블 후보로 선택
     cover_idx = 0
@@ -627,10 +771,8 @@ def generate_template_config(hwpx_path, output_dir):
 
     # 커버 테이블에서 빈 셀 위치 분석 → field_map 초안 생성
     entity_blocks = []
+    empty_cells = []
     if cover_tbl is not None:
-        row_cnt = int(cover_tbl.get('rowCnt', '0'))
-        col_cnt = int(cover_tbl.get('colCnt', '0'))
-
         # 셀 맵 구성
         cell_map = {}
         for tr in cover_tbl.findall('hp:tr', NAMESPACES):
@@ -643,7 +785,6 @@ def generate_template_config(hwpx_path, output_dir):
                     cell_map[(r, c)] = text
 
         # 비어있는 셀들을 찾아 field_map 후보 생성
-        empty_cells = []
         for (r, c), text in sorted(cell_map.items()):
             if not text.strip():
                 # 왼쪽 또는 위쪽 셀의 텍스트를 라벨로 사용
@@ -670,36 +811,85 @@ def generate_template_config(hwpx_path, output_dir):
                 'fields': fields,
             })
 
-    # template.json 생성
-    template_name = Path(hwpx_path).stem
+    template_name = doc.name
     template_config = {
         'name': template_name,
         'description': f'{template_name} 템플릿 (자동 생성 — 검토 필요)',
         'cover_table_index': cover_idx,
         'replacements': [],
     }
-
-    template_path = os.path.join(output_dir, 'template.json')
-    with open(template_path, 'w', encoding='utf-8') as f:
-        json.dump(template_config, f, ensure_ascii=False, indent=2)
-
-    # field_map.json 생성
     field_map = {
         'entity_blocks': entity_blocks,
         'company_lists': [],
     }
 
+    return {
+        'template_config': template_config,
+        'field_map': field_map,
+        'tables': extract_all_tables(doc),
+        'styles': summarize_styles(doc),
+        'cover_table_size': f'{cover_tbl.get("rowCnt", "?")}x{cover_tbl.get("colCnt", "?")}' if cover_tbl is not None else 'N/A',
+        'empty_cells_found': len(empty_cells),
+    }
+
+
+def summarize_styles(hwpx_path):
+    """header.xml 스타일 정보의 요약 (글꼴 이름, 속성 개수, 스타일 이름)."""
+    styles = extract_styles(hwpx_path)
+    return {
+        'fonts': {lang: [font['face'] for font in fonts]
+                  for lang, fonts in styles['fonts'].items()},
+        'charProperties': len(styles['charProperties']),
+        'paraProperties': len(styles['paraProperties']),
+        'borderFills': len(styles['borderFills']),
+        'styles': [style['name'] for style in styles['styles']],
+    }
+
+
+def write_template_config(analysis, output_dir):
+    """analyze_template 결과를 template.json과 field_map.json으로 저장한다.
+
+    Returns:
+        tuple: (template.json 경로, field_map.json 경로)
+    """
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    template_path = os.path.join(output_dir, 'template.json')
+    with open(template_path, 'w', encoding='utf-8') as f:
+        json.dump(analysis['template_config'], f, ensure_ascii=False, indent=2)
+
     field_map_path = os.path.join(output_dir, 'field_map.json')
     with open(field_map_path, 'w', encoding='utf-8') as f:
-        json.dump(field_map, f, ensure_ascii=False, indent=2)
+        json.dump(analysis['field_map'], f, ensure_ascii=False, indent=2)
+
+    return template_path, field_map_path
+
+
+def generate_template_config(hwpx_path, output_dir, registry=None):
+    """HWPX 파일을 분석하여 template.json과 field_map.json 초안을 생성.
+
+    Args:
+        hwpx_path: 분석할 HWPX 파일 경로 또는 ExtractedDocument
+        output_dir: 설정 파일을 저장할 디렉토리
+        registry: TemplateRegistry (주어지면 같은 내용의 템플릿은 분석을 생략)
+
+    Returns:
+        dict: 생성 결과 요약
+    """
+    if registry is not None:
+        analysis, _ = registry.ensure(hwpx_path)
+    else:
+        analysis = analyze_template(hwpx_path)
+
+    template_path, field_map_path = write_template_config(analysis, output_dir)
 
     return {
         'template_json': template_path,
         'field_map_json': field_map_path,
-        'total_tables': len(all_tables),
-        'cover_table_index': cover_idx,
-        'cover_table_size': f'{cover_tbl.get("rowCnt", "?")}x{cover_tbl.get("colCnt", "?")}' if cover_tbl is not None else 'N/A',
-        'empty_cells_found': len(empty_cells) if cover_tbl is not None else 0,
+        'total_tables': len(analysis['tables']),
+        'cover_table_index': analysis['template_config']['cover_table_index'],
+        'cover_table_size': analysis['cover_table_size'],
+        'empty_cells_found': analysis['empty_cells_found'],
     }
 
 
@@ -713,6 +903,9 @@ def main():
   # 문서 구조 분석
   python3 src/extract_template.py --hwpx ref/test_01.hwpx --tables
 
+  # 대용량 문서의 본문 구조를 스트리밍으로 추출
+  python3 src/extract_template.py --hwpx ref/대용량.hwpx --sections --stream
+
   # 템플릿 설정 초안 자동 생성
   python3 src/extract_template.py --hwpx ref/새양식.hwpx --generate-template-config -o templates/새양식/
         """,
@@ -733,15 +926,36 @@ def main():
                         help='sample_input.json 생성')
     parser.add_argument('--generate-template-config', action='store_true',
                         help='template.json + field_map.json 초안 자동 생성')
+    parser.add_argument('--force', action='store_true',
+                        help='템플릿이 바뀌지 않았어도 설정 초안을 다시 생성')
+    parser.add_argument('--no-registry', action='store_true',
+                        help='템플릿 레지스트리를 사용하지 않고 매번 분석')
+    parser.add_argument('--stream', action='store_true',
+                        help='--sections/--all-tables를 iterparse 스트리밍으로 추출 (대용량 문서)')
     parser.add_argument('--output', '-o', default=None,
                         help='출력 파일/디렉토리 경로 (기본: stdout)')
 
     args = parser.parse_args()
-    hwpx = args.hwpx
+    hwpx = ExtractedDocument(args.hwpx)
 
     if args.generate_template_config:
         output_dir = args.output or '.'
-        result = generate_template_config(hwpx, output_dir)
+        registry = None
+        if not args.no_registry:
+            from src.template_registry import TemplateRegistry
+            registry = TemplateRegistry()
+        if registry is not None and not args.force:
+            existing_path = os.path.join(output_dir, 'template.json')
+            existing = {}
+            if os.path.exists(existing_path):
+                with open(existing_path, 'r', encoding='utf-8') as f:
+                    existing = json.load(f)
+            if existing.get('source_sha256') == registry.fingerprint(args.hwpx):
+                print(f"템플릿 내용이 바뀌지 않아 기존 설정을 유지합니다: {existing_path}", file=sys.stderr)
+                print(f"  (다시 생성하려면 --force)", file=sys.stderr)
+                return
+        # 레지스트리는 src.extract_template 모듈을 쓰므로 경로로 넘긴다
+        result = generate_template_config(args.hwpx, output_dir, registry=registry)
         print(f"템플릿 설정 파일 생성 완료:", file=sys.stderr)
         print(f"  template.json: {result['template_json']}", file=sys.stderr)
         print(f"  field_map.json: {result['field_map_json']}", file=sys.stderr)
@@ -751,7 +965,12 @@ def main():
         print(f"\n※ 생성된 파일을 수동으로 검토하고 보정하세요.", file=sys.stderr)
         return
 
-    if args.cover:
+    if args.stream and (args.sections or args.all_tables):
+        if args.sections:
+            result = stream_body_sections(args.hwpx)
+        else:
+            result = list(iter_all_tables(args.hwpx))
+    elif args.cover:
         result = extract_cover_table(hwpx)
     elif args.sections:
         result = extract_body_sections(hwpx)
@@ -0,0 +1,36 @@
+"""파일 해시/캐시 디렉토리 공용 헬퍼.
+
+증분 빌드, 파싱 캐시, 래스터 캐시, 템플릿 레지스트리, PDF 비교가 함께
+사용한다. 다른 src 모듈을 임포트하지 않으므로 어느 도구에서든 가볍게
+임포트할 수 있다.
+
+Usage:
+    from src.file_utils import default_cache_dir, file_sha256
+    sha = file_sha256('ref/참조.pdf')         # 없으면 None
+    root = default_cache_dir() / 'raster'     # HWPX_CACHE_DIR 또는 ~/.cache/hwpx_automation
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+CACHE_DIR_ENV = 'HWPX_CACHE_DIR'
+
+
+def file_sha256(path):
+    """파일 내용의 SHA-256 (없으면 None)."""
+    if not os.path.exists(path):
+        return None
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def default_cache_dir():
+    """캐시 디렉토리 (환경변수 HWPX_CACHE_DIR 우선)."""
+    env = os.environ.get(CACHE_DIR_ENV)
+    if env:
+        return Path(env)
+    return Path.home() / '.cache' / 'hwpx_automation'
@@ -9,7 +9,8 @@ Usage:
         --template ../form_to_fillout.hwpx \\
         --md ../business_plan_v2.md \\
         --output output/filled \\
-        [--pass1-only] [--pass2-only] [--no-pdf]
+        [--pass1-only] [--pass2-only] [--no-pdf] [--profile] [--stage]
+        [--incremental] [--no-cache] [--audit]
 """
 
 import argparse
@@ -26,9 +27,13 @@ try:
 except ImportError:
     HAS_LXML = False
 
-from src.md_parser import load_and_parse, strip_markdown, parse_table, get_all_sections
+from src.md_parser import load_document, strip_markdown, parse_table, get_all_sections
 from src.section_mapper import SectionMapper
 from src.md_to_ops import compile_section_ops
+from src.file_utils import file_sha256
+from src.incremental import IncrementalBuild, DEFAULT_STATE_NAME
+from src.parse_cache import ParseCache
+from src.page_estimator import LayoutEstimator
 
 # lxml이 필요한 모듈은 조건부 임포트
 EDITOR_AVAILABLE = False
@@ -125,15 +130,35 @@ def load_content_map():
         return json.load(f)
 
 
+def load_estimator(hwpx_path):
+    """양식 HWPX로 오프라인 페이지 추정기를 만든다 (읽기 실패 시 None)."""
+    try:
+        return LayoutEstimator.from_hwpx(hwpx_path)
+    except (OSError, KeyError, ValueError) as e:
+        print(f"  WARNING: page estimator unavailable ({e})")
+        return None
+
+
+def load_markdown(md_path, build=None, cache=None):
+    """MD 파일을 ParsedDocument로 읽는다 (증분 빌드 > 디스크 캐시 > 전체 파싱)."""
+    if build is not None:
+        return build.load(md_path)
+    if cache is not None:
+        return cache.load_document(md_path)
+    return load_document(md_path)
+
+
 # ── Pass 1: XML 테이블 셀 채우기 ──────────────────────────
 
-def run_pass1(template_path, md_path, output_path):
+def run_pass1(template_path, md_path, output_path, build=None, cache=None):
     """Pass 1: XML 직접 수정으로 양식 테이블 셀을 채운다.
 
     Args:
         template_path: 원본 양식 HWPX 경로
         md_path: business_plan_v2.md 경로
         output_path: 출력 HWPX 경로
+        build: IncrementalBuild (None이면 전체 파싱)
+        cache: ParseCache (None이면 캐시 사용 안 함)
 
     Returns:
         str: 출력 파일 경로
@@ -147,8 +172,8 @@ def run_pass1(template_path, md_path, output_path):
     content_map = load_content_map()
 
     # MD 파싱
-    blocks = load_and_parse(md_path)
-    mapper = SectionMapper(str(DATA_DIR / 'form_content_map.json'), blocks)
+    doc = load_markdown(md_path, build, cache)
+    mapper = SectionMapper(str(DATA_DIR / 'form_content_map.json'), doc)
 
     # 템플릿 복사
     shutil.copy2(template_path, output_path)
@@ -245,14 +270,40 @@ def run_pass1(template_path, md_path, output_path):
     removed = editor.remove_outline_placeholders(start_table=2)
     print(f"[Pass 1] Removed {removed} outline paragraphs")
 
-    # 저장
+    # 저장 (+ 변경 기록: 수정 영역만 감사/비교하도록)
     editor.save(output_path)
+    with open(changes_path(output_path), 'w', encoding='utf-8') as f:
+        json.dump(editor.changes.to_dict(editor.root), f, ensure_ascii=False, indent=2)
+    print(f"[Pass 1] Changes: {editor.changes.counts()}")
     print(f"[Pass 1] Done: {total_cells} cells filled")
     print(f"[Pass 1] Output: {output_path}")
 
     return output_path
 
 
+def changes_path(pass1_output):
+    """Pass 1 변경 기록 JSON 경로 (form_pass1.hwpx → form_pass1.changes.json)."""
+    return os.path.splitext(pass1_output)[0] + '.changes.json'
+
+
+def audit_pass1(pass1_output, limit=10):
+    """Pass 1 결과를 hwpx_audit 기본 검사로 감사한다.
+
+    변경 기록이 있으면 Pass 1이 수정한 하위 트리만 순회한다.
+
+    Returns:
+        bool: 오류(error) 수준 발견 사항이 없으면 True
+    """
+    from src.hwpx_audit import audit_hwpx, load_regions, print_report
+    regions = None
+    if os.path.exists(changes_path(pass1_output)):
+        regions = load_regions(changes_path(pass1_output))
+    report = audit_hwpx(pass1_output, limit=limit, regions=regions)
+    print("[Audit] Pass 1 output:")
+    print_report(report)
+    return report['counts']['error'] == 0
+
+
 def fill_cover_table(editor, config, mapper):
     """표지(T0) 셀 채우기."""
     if 'table_index' not in config:
@@ -755,7 +806,8 @@ def inject_content_markers(editor, content_map):
 
 # ── Pass 2: COM 서술 본문 삽입 ─────────────────────────────
 
-def run_pass2(pass1_output, md_path, output_hwpx, output_pdf=None):
+def run_pass2(pass1_output, md_path, output_hwpx, output_pdf=None,
+              profile_path=None, stage=False, build=None, cache=None):
     """Pass 2: COM으로 마커 위치에 서술 본문을 삽입한다.
 
     Args:
@@ -763,6 +815,11 @@ def run_pass2(pass1_output, md_path, output_hwpx, output_pdf=None):
         md_path: business_plan_v2.md 경로
         output_hwpx: 최종 HWPX 출력 경로
         output_pdf: PDF 출력 경로 (None이면 생략)
+        profile_path: COM 계측 리포트(JSON) 경로 (None이면 계측 안 함)
+        stage: True면 Windows 임시 폴더에 스테이징하여 COM 실행
+        build: IncrementalBuild — 바뀐 섹션만 재컴파일하고, 모든 마커가
+            이전 실행과 같으면 COM 실행을 건너뛴다 (None이면 전체 실행)
+        cache: ParseCache — 같은 MD의 파싱/컴파일 결과 재사용
 
     Returns:
         bool: 성공 여부
@@ -770,11 +827,13 @@ def run_pass2(pass1_output, md_path, output_hwpx, output_pdf=None):
     print("[Pass 2] Preparing COM operations...")
 
     content_map = load_content_map()
-    blocks = load_and_parse(md_path)
-    mapper = SectionMapper(str(DATA_DIR / 'form_content_map.json'), blocks)
+    doc = load_markdown(md_path, build, cache)
+    mapper = SectionMapper(str(DATA_DIR / 'form_content_map.json'), doc,
+                           estimator=load_estimator(pass1_output))
 
     # 섹션별 COM 오퍼레이션 생성
     section_ops_list = []
+    ops_by_section = {}
     for ns in content_map.get('narrative_sections', []):
         marker = ns['marker']
         section_id = ns['md_section']
@@ -784,13 +843,24 @@ def run_pass2(pass1_output, md_path, output_hwpx, output_pdf=None):
             print(f"  WARNING: No blocks for section {section_id}")
             continue
 
-        ops = compile_section_ops(section_blocks, section_id)
+        if build is not None:
+            ops = build.compile_section(section_blocks, section_id)
+        elif cache is not None:
+            ops = cache.section_ops(doc, section_id)
+        else:
+            ops = compile_section_ops(section_blocks, section_id)
         section_ops_list.append({
             'marker': marker,
             'ops': ops,
         })
+        ops_by_section[section_id] = ops
         print(f"  Section {section_id}: {len(section_blocks)} blocks → {len(ops)} ops")
 
+    # 페이지 예산 점검 (COM 실행 전, 오프라인 추정)
+    for b in mapper.check_page_budgets(ops_by_section):
+        flag = "  OVER BUDGET" if b['over'] else ""
+        print(f"  Section {b['section_id']}: ~{b['pages']:.1f} / {b['max_pages']} pages{flag}")
+
     if not section_ops_list:
         print("[Pass 2] No sections to insert. Copying Pass 1 output.")
         shutil.copy2(pass1_output, output_hwpx)
@@ -800,6 +870,18 @@ def run_pass2(pass1_output, md_path, output_hwpx, output_pdf=None):
     print("[Pass 2] Fixing PrintMethod...")
     fix_hwpx_for_pdf(pass1_output)
 
+    pass1_sha = None
+    if build is not None:
+        print(f"[Pass 2] Incremental: {build.summary_text()}")
+        pass1_sha = file_sha256(pass1_output)
+        if build.pass2_up_to_date(pass1_sha, section_ops_list, output_hwpx, output_pdf):
+            print("[Pass 2] No marker changed since last run — keeping", output_hwpx)
+            build.save()
+            return True
+        changed = build.changed_markers(section_ops_list)
+        print(f"[Pass 2] {len(changed)}/{len(section_ops_list)} marker(s) changed: "
+              f"{', '.join(changed)}")
+
     # COM 실행
     print(f"[Pass 2] Executing {len(section_ops_list)} section(s) via COM...")
     success = fill_template(
@@ -807,9 +889,17 @@ def run_pass2(pass1_output, md_path, output_hwpx, output_pdf=None):
         section_ops_list,
         output_hwpx,
         output_pdf=output_pdf,
-        timeout=600,
+        profile_path=profile_path,
+        stage=stage,
     )
 
+    if profile_path and os.path.exists(profile_path):
+        print(f"[Pass 2] COM profile: {profile_path}")
+
+    if success and build is not None:
+        build.record_pass2(pass1_sha, section_ops_list, output_hwpx)
+        build.save()
+
     if success:
         print("[Pass 2] Done!")
     else:
@@ -836,6 +926,16 @@ def main():
                         help='Pass 2(COM)만 실행 (Pass 1 결과 필요)')
     parser.add_argument('--no-pdf', action='store_true',
                         help='PDF 생성 건너뛰기')
+    parser.add_argument('--profile', action='store_true',
+                        help='Pass 2 COM 호출 계측 (출력 디렉토리에 com_profile.json 저장)')
+    parser.add_argument('--stage', action='store_true',
+                        help='Pass 2 입출력을 Windows 임시 폴더에 스테이징 (/mnt 밖 출력 디렉토리 허용)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='바뀐 섹션만 재파싱/재컴파일, 마커가 모두 같으면 Pass 2 생략')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='파싱/컴파일 디스크 캐시 사용 안 함 (HWPX_CACHE_DIR)')
+    parser.add_argument('--audit', action='store_true',
+                        help='Pass 1 결과 감사 (서식 참조·표 구조 등, 오류가 있으면 Pass 2 중단)')
     args = parser.parse_args()
 
     # 출력 디렉토리 생성
@@ -848,16 +948,26 @@ def main():
     pass1_output = str(output_dir / 'form_pass1.hwpx')
     final_output = str(output_dir / 'business_plan_v2_filled.hwpx')
     pdf_output = str(output_dir / 'business_plan_v2_filled.pdf') if not args.no_pdf else None
+    profile_output = str(output_dir / 'com_profile.json') if args.profile else None
+    build = IncrementalBuild(output_dir / DEFAULT_STATE_NAME) if args.incremental else None
+    cache = None if args.no_cache else ParseCache()
 
     if args.pass2_only:
         # Pass 2만 실행 (Pass 1 결과가 이미 있어야 함)
         if not os.path.exists(pass1_output):
             print(f"ERROR: Pass 1 output not found: {pass1_output}")
             sys.exit(1)
-        success = run_pass2(pass1_output, md_path, final_output, pdf_output)
+        success = run_pass2(pass1_output, md_path, final_output, pdf_output,
+                            profile_path=profile_output, stage=args.stage,
+                            build=build, cache=cache)
     elif args.pass1_only:
         # Pass 1만 실행
-        run_pass1(template_path, md_path, pass1_output)
+        run_pass1(template_path, md_path, pass1_output, build=build,
+                  cache=cache)
+        if build is not None:
+            build.save()
+        if args.audit and not audit_pass1(pass1_output):
+            sys.exit(1)
         print(f"\nPass 1 complete. Run Pass 2 with: --pass2-only")
     else:
         # 전체 파이프라인
@@ -866,15 +976,21 @@ def main():
         print("=" * 60)
 
         # Pass 1
-        result = run_pass1(template_path, md_path, pass1_output)
+        result = run_pass1(template_path, md_path, pass1_output, build=build,
+                           cache=cache)
         if result is None:
             print("Pass 1 failed. Aborting.")
             sys.exit(1)
+        if args.audit and not audit_pass1(pass1_output):
+            print("Pass 1 audit failed. Aborting.")
+            sys.exit(1)
 
         print()
 
         # Pass 2
-        success = run_pass2(pass1_output, md_path, final_output, pdf_output)
+        success = run_pass2(pass1_output, md_path, final_output, pdf_output,
+                            profile_path=profile_output, stage=args.stage,
+                            build=build, cache=cache)
         if not success:
             print("\nPass 2 failed. Pass 1 output available at:", pass1_output)
             sys.exit(1)
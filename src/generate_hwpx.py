@@ -40,6 +40,7 @@ from src.bridge import (
     fix_hwpx_for_pdf,
     WIN_PYTHON,
 )
+from src.file_utils import file_sha256
 
 
 def load_input_data(data_path):
@@ -48,11 +49,16 @@ def load_input_data(data_path):
         return json.load(f)
 
 
-def load_template_config(template_dir):
+def load_template_config(template_dir, template_path=None, registry=None):
     """템플릿 설정(template.json) 로드
 
+    template.json의 source_sha256(--generate-template-config가 기록)이 현재
+    템플릿 내용과 다르면 경고한다. 검토되지 않은 자동 생성 설정은 쓰지 않는다.
+
     Args:
         template_dir: template.json이 있는 디렉토리 경로
+        template_path: 템플릿 HWPX 파일 경로 (내용 변경 확인용, 선택)
+        registry: TemplateRegistry (주어지면 색인으로 해시 계산 생략)
 
     Returns:
         dict: 템플릿 설정 (없으면 빈 dict)
@@ -61,7 +67,17 @@ def load_template_config(template_dir):
     if not os.path.exists(config_path):
         return {}
     with open(config_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+        config = json.load(f)
+
+    source_sha = config.get("source_sha256")
+    if source_sha and template_path is not None:
+        if registry is not None:
+            current_sha = registry.fingerprint(template_path)
+        else:
+            current_sha = file_sha256(template_path)
+        if source_sha != current_sha:
+            print(f"      경고: 템플릿 내용이 template.json 생성 이후 바뀌었습니다 — 설정을 다시 검토하세요")
+    return config
 
 
 def build_replacements(data, template_config):
@@ -99,7 +115,7 @@ def build_replacements(data, template_config):
 
 def generate_from_template(template_path, data_path, output_dir,
                            generate_pdf=True, compare_pdf=None,
-                           template_dir=None):
+                           template_dir=None, workers=1):
     """템플릿 기반 HWPX 생성
 
     Args:
@@ -109,6 +125,7 @@ def generate_from_template(template_path, data_path, output_dir,
         generate_pdf: PDF도 생성할지 여부
         compare_pdf: 비교할 참조 PDF 경로 (None이면 비교 안함)
         template_dir: 템플릿 설정 디렉토리 (None이면 cloud_integrated 사용)
+        workers: PDF 비교 프로세스 수 (1이면 순차 비교)
     """
     if template_dir is None:
         template_dir = os.path.join(PROJECT_DIR, "templates", "cloud_integrated")
@@ -128,7 +145,7 @@ def generate_from_template(template_path, data_path, output_dir,
         print(f"      HWPX 복사 및 인쇄설정 수정: {output_hwpx}")
 
         if generate_pdf:
-            success = open_and_save_as_pdf(output_hwpx, output_pdf, timeout=300)
+            success = open_and_save_as_pdf(output_hwpx, output_pdf)
             if success:
                 size = os.path.getsize(output_pdf)
                 print(f"      PDF 생성 성공: {output_pdf} ({size:,} bytes)")
@@ -139,7 +156,7 @@ def generate_from_template(template_path, data_path, output_dir,
         # 데이터 로드
         print(f"[1/4] 입력 데이터 로드 중...")
         data = load_input_data(data_path)
-        template_config = load_template_config(template_dir)
+        template_config = load_template_config(template_dir, template_path)
         cover_table_index = template_config.get("cover_table_index", 0)
 
         # [STEP 2] XML 셀 채우기 (빈 셀에 기업 정보 입력)
@@ -178,7 +195,7 @@ def generate_from_template(template_path, data_path, output_dir,
         if replacements:
             print(f"      템플릿: {output_hwpx}")
             success = open_and_replace(
-                output_hwpx, replacements, output_hwpx, output_pdf, timeout=300
+                output_hwpx, replacements, output_hwpx, output_pdf
             )
             if success:
                 fix_hwpx_for_pdf(output_hwpx)
@@ -194,7 +211,7 @@ def generate_from_template(template_path, data_path, output_dir,
             print(f"      교체할 내용 없음")
             fix_hwpx_for_pdf(output_hwpx)
             if generate_pdf:
-                success = open_and_save_as_pdf(output_hwpx, output_pdf, timeout=300)
+                success = open_and_save_as_pdf(output_hwpx, output_pdf)
                 if not success:
                     print(f"      PDF 생성 실패!")
                     return False
@@ -205,8 +222,10 @@ def generate_from_template(template_path, data_path, output_dir,
         compare_dir = os.path.join(output_dir, "compare_report")
         try:
             from src.pdf_compare import PdfComparator
-            comparator = PdfComparator(compare_pdf, output_pdf, dpi=150)
-            result = comparator.compare(output_dir=compare_dir)
+            from src.raster_cache import RasterCache
+            comparator = PdfComparator(compare_pdf, output_pdf, dpi=150,
+                                       raster_cache=RasterCache())
+            result = comparator.compare(output_dir=compare_dir, workers=workers)
 
             print(f"      참조 페이지: {result['reference_pages']}")
             print(f"      생성 페이지: {result['generated_pages']}")
@@ -217,7 +236,7 @@ def generate_from_template(template_path, data_path, output_dir,
                 print(f"      차이점 리포트: {compare_dir}/")
         except ImportError as e:
             print(f"      PDF 비교 모듈 로드 실패: {e}")
-            print(f"      pip3 install --break-system-packages pymupdf Pillow scikit-image")
+            print(f"      pip3 install --break-system-packages pymupdf Pillow numpy")
         except Exception as e:
             print(f"      PDF 비교 중 오류: {e}")
     else:
@@ -260,6 +279,8 @@ def main():
                         help="템플릿 설정 디렉토리 (template.json, field_map.json 위치)")
     parser.add_argument("--compare", "-c", default=None,
                         help="비교할 참조 PDF 경로")
+    parser.add_argument("--workers", "-j", type=int, default=1,
+                        help="PDF 비교 프로세스 수 (기본: 1, 0이면 CPU 코어 수)")
 
     args = parser.parse_args()
 
@@ -281,6 +302,7 @@ def main():
         generate_pdf=generate_pdf,
         compare_pdf=args.compare,
         template_dir=args.template_dir,
+        workers=args.workers or os.cpu_count() or 1,
     )
 
     sys.exit(0 if success else 1)
@@ -0,0 +1,470 @@
+"""HWPX 감사 엔진 — 한 번 파싱, 한 번 순회, 등록된 검사로 요소 분배.
+
+루트의 audit_section0.py, audit_crossrefs.py, audit_hwpx_content.py 등은
+검사마다 ZIP을 다시 열고 section0/header를 다시 파싱하여 트리 전체를 따로
+순회한다 (audit_hwpx_content는 모든 요소의 부모 dict까지 만든다). 이 모듈은:
+
+  - 파일마다 ZIP을 한 번 열어 section0.xml/header.xml을 lxml로 한 번씩 파싱
+  - section0 트리를 한 번만 순회하며 요소 태그별로 등록된 검사에 분배
+    (부모는 lxml getparent(), 위치는 발견 시에만 getpath()로 계산)
+  - 여러 파일을 프로세스 풀로 병렬 감사 (audit_files)
+  - regions(XPath 목록, HwpxEditor.changes.paths())가 주어지면 그 하위
+    트리만 순회 — 편집 후 검증 비용이 편집 크기에 비례
+
+검사는 AuditCheck를 상속하고 @register_check로 등록한다:
+  - tags: 받을 요소 태그 (None이면 모든 요소, ()이면 요소를 받지 않음)
+  - begin(ctx) → visit(elem, ctx) (순회 중) → finish(ctx)
+  - 발견 사항은 ctx.report(check, level, message, elem)로 보고
+
+내장 검사: declaration, crossrefs, empty_runs, nesting, required_attrs, markers
+(markers는 Pass 2 이후 남은 ##마커##를 찾는 검사로, 기본 검사에는 없다)
+
+Usage:
+    python3 src/hwpx_audit.py output/filled/form_pass1.hwpx
+    python3 src/hwpx_audit.py output/*.hwpx -j 4 --checks all --json audit.json
+    python3 src/hwpx_audit.py output/filled/form_pass1.hwpx --changes output/filled/form_pass1.changes.json
+
+    from src.hwpx_audit import audit_hwpx
+    report = audit_hwpx('output/filled/form_pass1.hwpx')
+    report['counts']['error']
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+from lxml import etree
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_DIR not in sys.path:
+    sys.path.insert(0, PROJECT_DIR)
+
+from src.extract_template import NAMESPACES
+
+SECTION_PATH = 'Contents/section0.xml'
+HEADER_PATH = 'Contents/header.xml'
+
+ERROR = 'error'
+WARNING = 'warning'
+INFO = 'info'
+LEVELS = (ERROR, WARNING, INFO)
+
+# 검사별로 보관할 발견 사항 수 (개수는 모두 센다)
+DEFAULT_FINDING_LIMIT = 50
+
+HP = NAMESPACES['hp']
+HH = NAMESPACES['hh']
+TAG_P = f'{{{HP}}}p'
+TAG_RUN = f'{{{HP}}}run'
+TAG_T = f'{{{HP}}}t'
+TAG_TBL = f'{{{HP}}}tbl'
+TAG_TR = f'{{{HP}}}tr'
+TAG_TC = f'{{{HP}}}tc'
+TAG_SUBLIST = f'{{{HP}}}subList'
+
+_parser = etree.XMLParser(huge_tree=True)
+
+
+class AuditContext:
+    """파일 하나의 감사 상태 (파싱된 파트와 발견 사항)."""
+
+    def __init__(self, path, names, section_bytes, section, header,
+                 limit=DEFAULT_FINDING_LIMIT):
+        self.path = path
+        self.names = names
+        self.section_bytes = section_bytes
+        self.section = section
+        self.header = header
+        self.limit = limit
+        self.findings = []
+        self.counts = {}  # (검사, 수준) → 개수
+        self._tree = section.getroottree() if section is not None else None
+
+    def location(self, elem):
+        """요소의 XPath 위치 (예: /hs:sec/hp:p[3]/hp:run/hp:tbl)."""
+        if elem is None or self._tree is None:
+            return None
+        return self._tree.getpath(elem)
+
+    def report(self, check, level, message, elem=None):
+        key = (check, level)
+        n = self.counts.get(key, 0)
+        self.counts[key] = n + 1
+        if n < self.limit:
+            self.findings.append({
+                'check': check,
+                'level': level,
+                'message': message,
+                'location': self.location(elem),
+            })
+
+
+class AuditCheck:
+    """감사 검사 기반 클래스."""
+
+    name = None
+    tags = ()
+
+    def begin(self, ctx):
+        pass
+
+    def visit(self, elem, ctx):
+        pass
+
+    def finish(self, ctx):
+        pass
+
+
+CHECKS = {}
+
+
+def register_check(cls):
+    """AuditCheck 하위 클래스를 이름으로 등록한다 (데코레이터)."""
+    CHECKS[cls.name] = cls
+    return cls
+
+
+@register_check
+class DeclarationCheck(AuditCheck):
+    """XML 선언: 큰따옴표, standalone="yes" (한글이 요구하는 형식)."""
+
+    name = 'declaration'
+
+    def begin(self, ctx):
+        head = ctx.section_bytes[:200]
+        if not head.startswith(b'<?xml'):
+            ctx.report(self.name, ERROR, 'XML 선언 없음')
+            return
+        decl = head[:head.find(b'?>') + 2]
+        if b'"' not in decl:
+            ctx.report(self.name, ERROR, f'XML 선언이 작은따옴표 사용: {decl!r}')
+        elif b'standalone="yes"' not in decl:
+            ctx.report(self.name, ERROR, f'standalone="yes" 없음: {decl!r}')
+
+
+@register_check
+class CrossRefCheck(AuditCheck):
+    """section0의 서식 참조(charPr/paraPr/style/borderFill)가 header.xml에 정의되어 있는지."""
+
+    name = 'crossrefs'
+    tags = (TAG_P, TAG_RUN, TAG_TC, TAG_TBL)
+
+    # 요소 태그 → [(속성, header 정의 태그)]
+    REFS = {
+        TAG_P: [('paraPrIDRef', 'paraPr'), ('styleIDRef', 'style')],
+        TAG_RUN: [('charPrIDRef', 'charPr')],
+        TAG_TC: [('borderFillIDRef', 'borderFill')],
+        TAG_TBL: [('borderFillIDRef', 'borderFill')],
+    }
+
+    def begin(self, ctx):
+        self.defined = {}
+        self.missing = {}  # (속성, 값) → [첫 요소, 개수]
+        if ctx.header is None:
+            ctx.report(self.name, ERROR, f'{HEADER_PATH} 없음 — 참조를 확인할 수 없음')
+            return
+        kinds = {kind for refs in self.REFS.values() for _, kind in refs}
+        for kind in kinds:
+            self.defined[kind] = set()
+        for elem in ctx.header.iter(*(f'{{{HH}}}{kind}' for kind in kinds)):
+            self.defined[etree.QName(elem).localname].add(elem.get('id'))
+
+    def visit(self, elem, ctx):
+        if not self.defined:
+            return
+        for attr, kind in self.REFS[elem.tag]:
+            value = elem.get(attr)
+            if value is None or value in self.defined[kind]:
+                continue
+            entry = self.missing.get((attr, value))
+            if entry is None:
+                self.missing[(attr, value)] = [elem, 1]
+            else:
+                entry[1] += 1
+
+    def finish(self, ctx):
+        for (attr, value), (elem, count) in sorted(self.missing.items(),
+                                                   key=lambda item: item[0]):
+            ctx.report(self.name, ERROR,
+                       f'{attr}="{value}"가 header.xml에 없음 ({count}곳)', elem)
+
+
+@register_check
+class EmptyRunCheck(AuditCheck):
+    """자식 요소가 하나도 없는 hp:run."""
+
+    name = 'empty_runs'
+    tags = (TAG_RUN,)
+
+    def visit(self, elem, ctx):
+        if len(elem) == 0:
+            ctx.report(self.name, WARNING,
+                       f'빈 hp:run (charPrIDRef={elem.get("charPrIDRef", "?")})', elem)
+
+
+@register_check
+class NestingCheck(AuditCheck):
+    """중첩 hp:p, 표 구조 (rowCnt = hp:tr 수, hp:tc > hp:subList > hp:p)."""
+
+    name = 'nesting'
+    tags = (TAG_P, TAG_TBL, TAG_TC)
+
+    def visit(self, elem, ctx):
+        tag = elem.tag
+        if tag == TAG_P:
+            parent = elem.getparent()
+            if parent is not None and parent.tag == TAG_P:
+                ctx.report(self.name, ERROR, 'hp:p 안에 hp:p', elem)
+        elif tag == TAG_TBL:
+            rows = sum(1 for child in elem if child.tag == TAG_TR)
+            row_cnt = elem.get('rowCnt')
+            if row_cnt is not None and row_cnt.isdigit() and int(row_cnt) != rows:
+                ctx.report(self.name, ERROR,
+                           f'rowCnt={row_cnt}인데 hp:tr {rows}개', elem)
+        else:
+            sublists = [child for child in elem if child.tag == TAG_SUBLIST]
+            if not sublists:
+                ctx.report(self.name, ERROR, 'hp:tc에 hp:subList 없음', elem)
+            elif not any(child.tag == TAG_P for sl in sublists for child in sl):
+                ctx.report(self.name, ERROR, 'hp:subList에 hp:p 없음', elem)
+
+
+@register_check
+class RequiredAttrsCheck(AuditCheck):
+    """필수 속성 (hp:p paraPrIDRef, hp:run charPrIDRef, hp:tbl rowCnt/colCnt)."""
+
+    name = 'required_attrs'
+    REQUIRED = {
+        TAG_P: ('paraPrIDRef',),
+        TAG_RUN: ('charPrIDRef',),
+        TAG_TBL: ('rowCnt', 'colCnt'),
+    }
+    tags = tuple(REQUIRED)
+
+    def visit(self, elem, ctx):
+        for attr in self.REQUIRED[elem.tag]:
+            if attr not in elem.attrib:
+                ctx.report(self.name, ERROR,
+                           f'{etree.QName(elem).localname}에 {attr} 없음', elem)
+
+
+@register_check
+class MarkerCheck(AuditCheck):
+    """남은 ##마커## (Pass 2가 채우지 못한 삽입 지점)."""
+
+    name = 'markers'
+    tags = (TAG_T,)
+    MARKER_RE = re.compile(r'##\w+##')
+
+    def visit(self, elem, ctx):
+        text = elem.text
+        if text and '##' in text:
+            for marker in self.MARKER_RE.findall(text):
+                ctx.report(self.name, WARNING, f'남은 마커 {marker}', elem)
+
+
+DEFAULT_CHECKS = ('declaration', 'crossrefs', 'empty_runs', 'nesting', 'required_attrs')
+
+
+def _load_parts(path):
+    """ZIP을 한 번 열어 (멤버 목록, section0 바이트, header 바이트 또는 None)."""
+    with zipfile.ZipFile(path, 'r') as z:
+        names = z.namelist()
+        section_bytes = z.read(SECTION_PATH)
+        header_bytes = z.read(HEADER_PATH) if HEADER_PATH in names else None
+    return names, section_bytes, header_bytes
+
+
+def _region_roots(ctx, regions):
+    """XPath 영역 목록 → 겹치지 않는 하위 트리 루트 (문서 순서 무관).
+
+    손으로 쓴 --changes 파일도 받을 수 있도록, 잘못된 XPath는 parse 오류로
+    보고하고 건너뛰며, 다른 영역 안에 포함된 노드는 한 번만 순회하도록 뺀다.
+    """
+    ns = dict(NAMESPACES)
+    ns.update((prefix, uri) for prefix, uri in ctx.section.nsmap.items() if prefix)
+    found = []
+    for path in regions:
+        try:
+            nodes = ctx.section.xpath(path, namespaces=ns)
+        except etree.XPathError as e:
+            ctx.report('parse', ERROR, f'영역 XPath 오류 {path!r}: {e}')
+            continue
+        if isinstance(nodes, list):
+            found.extend(node for node in nodes if isinstance(node, etree._Element))
+
+    selected = set(found)
+    roots = []
+    seen = set()
+    for node in found:
+        if node in seen:
+            continue
+        seen.add(node)
+        if not any(ancestor in selected for ancestor in node.iterancestors()):
+            roots.append(node)
+    return roots
+
+
+def _iter_regions(ctx, regions):
+    """XPath로 지정한 하위 트리들의 요소 (겹치는 영역은 한 번만)."""
+    for root in _region_roots(ctx, regions):
+        yield from root.iter(tag=etree.Element)
+
+
+def load_regions(changes_path):
+    """HwpxEditor 변경 기록 JSON(ChangeSet.to_dict)에서 수정 영역 XPath 목록."""
+    with open(changes_path, 'r', encoding='utf-8') as f:
+        return json.load(f).get('regions', [])
+
+
+def _summarize(ctx, regions=None):
+    counts = {level: 0 for level in LEVELS}
+    by_check = {}
+    for (check, level), n in ctx.counts.items():
+        counts[level] += n
+        by_check.setdefault(check, {})[level] = n
+    return {
+        'path': ctx.path,
+        'counts': counts,
+        'by_check': by_check,
+        'findings': ctx.findings,
+        'regions': None if regions is None else len(regions),
+    }
+
+
+def audit_hwpx(path, checks=DEFAULT_CHECKS, limit=DEFAULT_FINDING_LIMIT, regions=None):
+    """HWPX 파일 하나를 감사한다.
+
+    Args:
+        path: HWPX 파일 경로
+        checks: 검사 이름 목록 (CHECKS에 등록된 이름)
+        limit: 검사·수준별로 보관할 발견 사항 수
+        regions: 순회할 하위 트리 XPath 목록 (None이면 section0 전체)
+
+    Returns:
+        dict: path, counts ({수준: 개수}), by_check, findings, regions (영역 수)
+    """
+    instances = [CHECKS[name]() for name in checks]
+    try:
+        names, section_bytes, header_bytes = _load_parts(path)
+        section = etree.fromstring(section_bytes, _parser)
+        header = etree.fromstring(header_bytes, _parser) if header_bytes is not None else None
+    except (OSError, KeyError, zipfile.BadZipFile, etree.XMLSyntaxError) as e:
+        ctx = AuditContext(path, [], b'', None, None, limit)
+        ctx.report('parse', ERROR, f'{type(e).__name__}: {e}')
+        return _summarize(ctx, regions)
+
+    ctx = AuditContext(path, names, section_bytes, section, header, limit)
+    for check in instances:
+        check.begin(ctx)
+
+    # 태그 → 검사 분배표 (tags=None인 검사는 모든 요소)
+    dispatch = {}
+    every = [check for check in instances if check.tags is None]
+    for check in instances:
+        for tag in check.tags or ():
+            dispatch.setdefault(tag, []).append(check)
+
+    if dispatch or every:
+        if regions is None:
+            elements = section.iter(tag=etree.Element)
+        else:
+            elements = _iter_regions(ctx, regions)
+        for elem in elements:
+            for check in dispatch.get(elem.tag, ()):
+                check.visit(elem, ctx)
+            for check in every:
+                check.visit(elem, ctx)
+
+    for check in instances:
+        check.finish(ctx)
+    return _summarize(ctx, regions)
+
+
+def _audit_one(args):
+    path, checks, limit, regions = args
+    return audit_hwpx(path, checks, limit, regions)
+
+
+def audit_files(paths, checks=DEFAULT_CHECKS, workers=1, limit=DEFAULT_FINDING_LIMIT,
+                regions=None):
+    """여러 HWPX 파일을 감사한다 (workers > 1이면 프로세스 병렬).
+
+    Args:
+        regions: {경로: XPath 목록} (없는 파일은 전체 순회)
+
+    Returns:
+        list[dict]: 입력 순서대로 audit_hwpx 결과
+    """
+    regions = regions or {}
+    jobs = [(path, tuple(checks), limit, regions.get(path)) for path in paths]
+    if workers <= 1 or len(jobs) <= 1:
+        return [_audit_one(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        return list(pool.map(_audit_one, jobs))
+
+
+def print_report(report, file=None):
+    """감사 결과를 사람이 읽을 수 있게 출력한다."""
+    out = file or sys.stdout
+    counts = report['counts']
+    status = 'FAIL' if counts[ERROR] else 'OK'
+    scope = f" (수정 영역 {report['regions']}개)" if report.get('regions') is not None else ''
+    print(f"[{status}] {report['path']}{scope}: 오류 {counts[ERROR]}, 경고 {counts[WARNING]}, "
+          f"정보 {counts[INFO]}", file=out)
+    for check, by_level in sorted(report['by_check'].items()):
+        summary = ', '.join(f'{level} {n}' for level, n in sorted(by_level.items()))
+        print(f"    {check}: {summary}", file=out)
+    for finding in report['findings']:
+        if finding['level'] == INFO:
+            continue
+        loc = f" @ {finding['location']}" if finding['location'] else ''
+        print(f"      - [{finding['level']}] {finding['check']}: {finding['message']}{loc}",
+              file=out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HWPX section0.xml 감사 (단일 파싱·단일 순회)')
+    parser.add_argument('hwpx', nargs='+', help='감사할 HWPX 파일')
+    parser.add_argument('--checks', default=','.join(DEFAULT_CHECKS),
+                        help=f"쉼표로 구분한 검사 이름 또는 'all' (등록: {', '.join(CHECKS)})")
+    parser.add_argument('--workers', '-j', type=int, default=1,
+                        help='병렬 프로세스 수 (0이면 CPU 수)')
+    parser.add_argument('--limit', type=int, default=DEFAULT_FINDING_LIMIT,
+                        help='검사·수준별로 출력할 발견 사항 수')
+    parser.add_argument('--changes', default=None,
+                        help='HwpxEditor 변경 기록 JSON — 수정 영역만 감사 (파일 하나일 때)')
+    parser.add_argument('--json', default=None,
+                        help='결과를 JSON 파일로 저장')
+    args = parser.parse_args()
+
+    checks = list(CHECKS) if args.checks == 'all' else [c.strip() for c in args.checks.split(',') if c.strip()]
+    unknown = [c for c in checks if c not in CHECKS]
+    if unknown:
+        parser.error(f"알 수 없는 검사: {', '.join(unknown)}")
+    workers = args.workers or os.cpu_count() or 1
+    regions = None
+    if args.changes:
+        if len(args.hwpx) != 1:
+            parser.error('--changes는 HWPX 파일 하나와 함께 사용하세요')
+        regions = {args.hwpx[0]: load_regions(args.changes)}
+
+    reports = audit_files(args.hwpx, checks, workers=workers, limit=args.limit,
+                          regions=regions)
+    for report in reports:
+        print_report(report)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(reports, f, ensure_ascii=False, indent=2)
+        print(f"결과를 {args.json}에 저장했습니다.", file=sys.stderr)
+
+    sys.exit(1 if any(r['counts'][ERROR] for r in reports) else 0)
+
+
+if __name__ == '__main__':
+    main()
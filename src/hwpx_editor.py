@@ -3,11 +3,17 @@
 lxml을 사용하여 모든 네임스페이스 선언을 보존하면서
 표 셀의 텍스트를 추가/변경할 수 있다.
 
+편집기는 수정한 요소와 수정 종류를 editor.changes(ChangeSet)에 기록한다.
+검증/비교 도구는 changes.paths(editor.root)로 얻은 수정된 하위 트리만
+확인하면 되므로 비용이 편집 크기에 비례한다.
+
 Usage:
     editor = HwpxEditor('ref/test_01.hwpx')
     table = editor.get_table(0)          # 첫 번째 표
     editor.set_cell_text(table, 6, 3, '홍길동')  # row=6, col=3에 텍스트 설정
     editor.save('output.hwpx')
+    editor.changes.counts()              # {'text_set': 1, 'linesegarray_removed': 1}
+    editor.changes.paths(editor.root)    # ['/hs:sec/hp:p[1]/hp:run/hp:tbl/hp:tr[7]/hp:tc[2]']
 """
 
 import os
@@ -41,6 +47,106 @@ NAMESPACES = {
 
 HP_NS = NAMESPACES['hp']
 
+# 수정 종류 (ChangeSet 기록 단위)
+CHANGE_TEXT_SET = 'text_set'                          # hp:tc 텍스트 교체
+CHANGE_LINESEG_REMOVED = 'linesegarray_removed'       # hp:p의 linesegarray 제거
+CHANGE_PARAGRAPH_INSERTED = 'paragraph_inserted'      # 새 hp:p 삽입
+CHANGE_PARAGRAPH_REMOVED = 'paragraph_removed'        # hp:p 제거 (요소는 분리됨)
+CHANGE_CTRL_REMOVED = 'ctrl_removed'                  # hp:ctrl 제거 (메모 필드)
+
+
+class ChangeSet:
+    """HwpxEditor가 수정한 요소와 수정 종류의 기록.
+
+    각 항목은 (종류, 요소, 부모)이다. 제거 종류(paragraph_removed,
+    ctrl_removed)의 요소는 트리에서 분리된 상태이며 부모는 제거 당시의
+    부모 요소이다.
+    """
+
+    def __init__(self):
+        self._entries = []
+
+    def record(self, kind, elem, parent=None):
+        self._entries.append((kind, elem, parent))
+
+    def clear(self):
+        self._entries = []
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def counts(self):
+        """{종류: 기록 수}"""
+        result = {}
+        for kind, _, _ in self._entries:
+            result[kind] = result.get(kind, 0) + 1
+        return result
+
+    def elements(self, kind):
+        """해당 종류로 기록된 요소 (기록 순서, 중복 제거)."""
+        seen = set()
+        result = []
+        for k, elem, _ in self._entries:
+            if k == kind and elem not in seen:
+                seen.add(elem)
+                result.append(elem)
+        return result
+
+    def dirty_roots(self, root):
+        """root 아래에서 다시 검사해야 할 최소 하위 트리 목록 (문서 순서).
+
+        ctrl_removed는 제거 당시의 부모(hp:run)를, 나머지는 요소 자신을
+        수정 영역으로 본다. paragraph_removed는 남은 내용이 없으므로 제외한다.
+        다른 수정 영역의 하위 요소와 이후 트리에서 분리된 요소도 제외한다.
+        """
+        candidates = []
+        seen = set()
+        for kind, elem, parent in self._entries:
+            if kind == CHANGE_PARAGRAPH_REMOVED:
+                continue
+            target = parent if kind == CHANGE_CTRL_REMOVED else elem
+            if target is not None and target not in seen:
+                seen.add(target)
+                candidates.append(target)
+
+        result = []
+        for elem in candidates:
+            ancestors = list(elem.iterancestors())
+            top = ancestors[-1] if ancestors else elem
+            if top is not root:
+                continue  # 분리된 하위 트리
+            if any(a in seen for a in ancestors):
+                continue  # 상위 수정 영역에 포함
+            result.append(elem)
+        result.sort(key=_document_order_key)
+        return result
+
+    def paths(self, root):
+        """dirty_roots의 XPath 목록 (lxml getpath 형식)."""
+        tree = root.getroottree()
+        return [tree.getpath(elem) for elem in self.dirty_roots(root)]
+
+    def to_dict(self, root):
+        """JSON 저장용 요약: 종류별 수와 수정 영역 XPath."""
+        return {
+            'counts': self.counts(),
+            'regions': self.paths(root),
+        }
+
+
+def _document_order_key(elem):
+    """루트부터의 형제 인덱스 경로 (문서 순서 정렬 키)."""
+    key = []
+    child = elem
+    for parent in elem.iterancestors():
+        key.append(parent.index(child))
+        child = parent
+    key.reverse()
+    return key
+
 
 class HwpxEditor:
     """HWPX ZIP 내부의 section0.xml을 수정하는 편집기."""
@@ -66,6 +172,7 @@ class HwpxEditor:
         self._xml_decl = m.group(1) if m else HWPX_XML_DECL
 
         self.root = etree.fromstring(section_data)
+        self.changes = ChangeSet()
 
     def get_table(self, index=0):
         """N번째 hp:tbl 요소를 반환한다.
@@ -137,7 +244,8 @@ class HwpxEditor:
             # linesegarray를 새 텍스트에 맞게 보정:
             # 텍스트가 바뀌면 기존 lineseg의 textpos가 유효하지 않을 수 있다.
             # 첫 번째 lineseg(textpos=0)만 남기고 나머지는 제거한다.
-            self._remove_linesegarray(para)
+            if self._remove_linesegarray(para):
+                self.changes.record(CHANGE_LINESEG_REMOVED, para)
 
         # 첫 번째 단락의 첫 번째 run에 텍스트 삽입
         p = paragraphs[0]
@@ -159,6 +267,7 @@ class HwpxEditor:
         t_elem = etree.SubElement(run, f'{{{HP_NS}}}t')
         t_elem.text = text
 
+        self.changes.record(CHANGE_TEXT_SET, tc)
         return True
 
     @staticmethod
@@ -169,10 +278,15 @@ class HwpxEditor:
         기존 값이 유효하지 않게 된다. 제거하면 한컴오피스가 문서를
         열 때 자동으로 재계산한다. (원본 문서에도 linesegarray 없는
         단락이 다수 존재하며 정상 처리된다.)
+
+        Returns:
+            bool: 제거했으면 True
         """
         lsa = p_elem.find('hp:linesegarray', NAMESPACES)
-        if lsa is not None:
-            p_elem.remove(lsa)
+        if lsa is None:
+            return False
+        p_elem.remove(lsa)
+        return True
 
     def _find_nearby_char_pr_id(self, table, row_addr, col_addr):
         """인접 셀의 charPrIDRef를 찾아 반환한다 (fallback: "0")."""
@@ -233,7 +347,9 @@ class HwpxEditor:
             # fieldEnd ctrl 먼저 제거 (인덱스 밀림 방지)
             if end_ctrl is not None:
                 parent.remove(end_ctrl)
+                self.changes.record(CHANGE_CTRL_REMOVED, end_ctrl, parent)
             parent.remove(ctrl)
+            self.changes.record(CHANGE_CTRL_REMOVED, ctrl, parent)
             count += 1
 
         # 2단계: 다른 run/paragraph에 남은 orphan fieldEnd ctrl 정리.
@@ -247,6 +363,7 @@ class HwpxEditor:
                     parent = ctrl.getparent()
                     if parent is not None:
                         parent.remove(ctrl)
+                        self.changes.record(CHANGE_CTRL_REMOVED, ctrl, parent)
 
         return count
 
@@ -312,6 +429,7 @@ class HwpxEditor:
         # hs:sec 레벨에서 앵커 문단 바로 뒤에 삽입
         p_index = list(sec_root).index(wrapper_p)
         sec_root.insert(p_index + 1, new_p)
+        self.changes.record(CHANGE_PARAGRAPH_INSERTED, new_p)
         return True
 
     def remove_outline_placeholders(self, start_table=2, end_table=None):
@@ -380,6 +498,7 @@ class HwpxEditor:
 
         for p in to_remove:
             sec.remove(p)
+            self.changes.record(CHANGE_PARAGRAPH_REMOVED, p, sec)
 
         return len(to_remove)
 
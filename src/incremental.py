@@ -0,0 +1,187 @@
+"""증분 빌드 — 바뀐 마크다운 섹션만 재파싱/재컴파일한다.
+
+이전 실행의 상태(JSON)에 다음을 보관한다:
+  - 조각(chunk) 해시 → 파싱된 블록: H1 경계로 자른 텍스트 조각 단위
+  - 섹션 ID → (블록 해시, 컴파일된 오퍼레이션): compile_section_ops 결과
+  - 마커 → 오퍼레이션 해시 + Pass 1 결과 해시: Pass 2 생략 판정용
+
+같은 조각은 다시 파싱하지 않고, 블록이 바뀌지 않은 섹션은 이전
+오퍼레이션을 재사용한다. 모든 마커의 오퍼레이션과 Pass 1 결과가 이전
+실행과 같고 출력 파일이 남아 있으면 Pass 2(COM)를 건너뛸 수 있다.
+
+Usage:
+    from src.incremental import IncrementalBuild
+    build = IncrementalBuild('output/filled/.incremental_state.json')
+    doc = build.load('business_plan_v2.md')
+    ops = build.compile_section(doc.section_blocks('1'), '1')
+    build.save()
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from src.file_utils import file_sha256
+from src.md_parser import (
+    PARSER_VERSION, ParsedDocument, chunk_boundaries, parse_markdown_chunk,
+)
+from src.md_to_ops import COMPILER_VERSION, compile_section_ops
+
+# 상태 형식이 바뀌면 올린다 (파서/컴파일러 버전도 함께 비교)
+STATE_VERSION = 1
+_VERSION_KEY = [STATE_VERSION, PARSER_VERSION, COMPILER_VERSION]
+
+DEFAULT_STATE_NAME = '.incremental_state.json'
+
+
+def _sha256_text(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _digest(obj):
+    """JSON 직렬화 가능한 객체의 내용 해시."""
+    data = json.dumps(obj, ensure_ascii=False, sort_keys=True,
+                      separators=(',', ':'))
+    return _sha256_text(data)
+
+
+def _empty_state():
+    return {'version': _VERSION_KEY, 'chunks': {}, 'sections': {}, 'pass2': None}
+
+
+class IncrementalBuild:
+    """섹션 해시 기반 증분 파싱/컴파일 상태."""
+
+    def __init__(self, state_path):
+        """
+        Args:
+            state_path: 상태 JSON 경로 (없으면 빈 상태로 시작)
+        """
+        self.state_path = str(state_path)
+        self.state = self._load()
+        self._chunks_used = {}
+        self.stats = {
+            'chunks_parsed': 0,
+            'chunks_reused': 0,
+            'sections_compiled': 0,
+            'sections_reused': 0,
+        }
+
+    def _load(self):
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return _empty_state()
+        if state.get('version') != _VERSION_KEY:
+            return _empty_state()
+        return state
+
+    # ── 파싱 ──────────────────────────────────────────────
+
+    def _parse_chunk(self, text):
+        key = _sha256_text(text)
+        entry = self._chunks_used.get(key) or self.state['chunks'].get(key)
+        if entry is None:
+            blocks, open_code = parse_markdown_chunk(text)
+            entry = {'blocks': blocks, 'open_code': open_code}
+            self.stats['chunks_parsed'] += 1
+        else:
+            self.stats['chunks_reused'] += 1
+        self._chunks_used[key] = entry
+        return entry
+
+    def parse(self, text):
+        """마크다운 텍스트를 조각 단위로 파싱한다 (바뀐 조각만 재파싱).
+
+        Returns:
+            ParsedDocument: parse_markdown(text)와 같은 블록의 문서
+        """
+        lines = text.split('\n')
+        blocks = []
+        start = 0
+        for end in chunk_boundaries(lines) + [len(lines)]:
+            entry = self._parse_chunk('\n'.join(lines[start:end]))
+            if entry['open_code'] and end != len(lines):
+                continue  # 경계 후보가 코드 블록 안 — 다음 후보까지 확장
+            blocks.extend(entry['blocks'])
+            start = end
+        return ParsedDocument(blocks)
+
+    def load(self, md_path):
+        """마크다운 파일을 읽어 parse()한다."""
+        return self.parse(Path(md_path).read_text(encoding='utf-8'))
+
+    # ── 컴파일 ────────────────────────────────────────────
+
+    def compile_section(self, blocks, section_id):
+        """섹션 블록을 컴파일한다 (블록이 그대로면 이전 결과 재사용).
+
+        Returns:
+            list[dict]: compile_section_ops(blocks, section_id) 결과
+        """
+        digest = _digest(blocks)
+        cached = self.state['sections'].get(section_id)
+        if cached is not None and cached['digest'] == digest:
+            self.stats['sections_reused'] += 1
+            return cached['ops']
+        ops = compile_section_ops(blocks, section_id)
+        self.state['sections'][section_id] = {'digest': digest, 'ops': ops}
+        self.stats['sections_compiled'] += 1
+        return ops
+
+    # ── Pass 2 ────────────────────────────────────────────
+
+    @staticmethod
+    def _marker_digests(section_ops_list):
+        return {s['marker']: _digest(s['ops']) for s in section_ops_list}
+
+    def changed_markers(self, section_ops_list):
+        """이전 Pass 2 이후 오퍼레이션이 바뀐 마커 목록."""
+        previous = (self.state.get('pass2') or {}).get('markers', {})
+        current = self._marker_digests(section_ops_list)
+        return [m for m, d in current.items() if previous.get(m) != d]
+
+    def pass2_up_to_date(self, pass1_sha, section_ops_list, output_hwpx,
+                         output_pdf=None):
+        """이전 Pass 2 출력을 그대로 쓸 수 있는지 판정한다.
+
+        마커가 채워지면 양식에서 사라지므로 일부 마커만 다시 채울 수는
+        없다. 모든 마커가 그대로이고 입력(Pass 1 결과)도 같을 때만 생략한다.
+        """
+        prev = self.state.get('pass2')
+        if not prev or prev.get('pass1_sha') != pass1_sha:
+            return False
+        if prev.get('markers') != self._marker_digests(section_ops_list):
+            return False
+        if file_sha256(output_hwpx) != prev.get('output_sha'):
+            return False
+        if output_pdf and not os.path.exists(output_pdf):
+            return False
+        return True
+
+    def record_pass2(self, pass1_sha, section_ops_list, output_hwpx):
+        """성공한 Pass 2의 입력/출력 해시를 기록한다."""
+        self.state['pass2'] = {
+            'pass1_sha': pass1_sha,
+            'markers': self._marker_digests(section_ops_list),
+            'output_sha': file_sha256(output_hwpx),
+        }
+
+    # ── 저장 ──────────────────────────────────────────────
+
+    def save(self):
+        """상태를 저장한다 (이번 실행에서 쓰인 조각만 유지)."""
+        if self._chunks_used:
+            self.state['chunks'] = self._chunks_used
+        os.makedirs(os.path.dirname(os.path.abspath(self.state_path)), exist_ok=True)
+        tmp_path = self.state_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.state_path)
+
+    def summary_text(self):
+        s = self.stats
+        return (f"chunks parsed {s['chunks_parsed']}, reused {s['chunks_reused']}; "
+                f"sections compiled {s['sections_compiled']}, reused {s['sections_reused']}")
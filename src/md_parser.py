@@ -7,13 +7,21 @@ Usage:
     from md_parser import parse_markdown, parse_table, extract_section_blocks
 
     blocks = parse_markdown(md_text)
+    for block in parse_markdown_iter(open(md_path, encoding='utf-8')):  # 스트리밍
+        ...
     rows = parse_table(table_block['lines'])
     section_blocks = extract_section_blocks(blocks, '1. 과제의 필요성', '2. 관련 현황')
+
+    doc = load_document(md_path)          # 섹션 인덱스를 한 번만 계산
+    sec1 = doc.section_blocks('1')
 """
 
 import re
-from pathlib import Path
+from functools import lru_cache
+
 
+# 블록 출력 형식이 바뀌면 올린다 — 캐시 무효화 키
+PARSER_VERSION = 1
 
 # ── Block types ───────────────────────────────────────────────
 BLOCK_CODE = 'code'
@@ -25,123 +33,230 @@ BLOCK_HR = 'hr'
 BLOCK_PARAGRAPH = 'paragraph'
 
 
-def parse_markdown(text):
-    """마크다운 텍스트를 블록 리스트로 파싱한다.
+# ── Line tokenizer ────────────────────────────────────────────
+# 각 줄은 한 번만 분류된다: (원문, strip 결과, 종류, 문단 종료 여부, 매치)
 
-    블록 타입:
-      - code: {'type': 'code', 'content': str}
-      - table: {'type': 'table', 'lines': [str]}
-      - header: {'type': 'header', 'level': int, 'text': str}
-      - blockquote: {'type': 'blockquote', 'content': str}
-      - list: {'type': 'list', 'items': [{'indent': int, 'text': str}]}
-      - hr: {'type': 'hr'}
-      - paragraph: {'type': 'paragraph', 'text': str}
+_HEADER_RE = re.compile(r'^(#{1,6})\s+(.*)')
+_LIST_RE = re.compile(r'^[\s]*[-*]\s')
+_HR_RE = re.compile(r'^---+$')
 
-    Returns:
-        list[dict]: 파싱된 블록 리스트
+_K_FENCE = 0
+_K_HEADER = 1
+_K_QUOTE = 2
+_K_LIST = 3
+_K_HR = 4
+_K_BLANK = 5
+_K_HTML = 6
+_K_TEXT = 7
+
+
+def _classify(line):
+    """한 줄을 토큰 튜플로 분류한다 (파일에서 읽은 줄의 개행 제거 포함).
+
+    strip 결과의 첫 글자로 분기하므로 정규식은 후보 줄에서만 실행된다.
     """
-    lines = text.split('\n')
-    blocks = []
-    i = 0
+    if line.endswith('\n'):
+        line = line[:-1]
+    s = line.strip()
+    if not s:
+        return (line, s, _K_BLANK, True, None)
+
+    c = s[0]
+    if c == '`' and s.startswith('```'):
+        return (line, s, _K_FENCE, True, None)
+    if c == '#':
+        m = _HEADER_RE.match(line)
+        return (line, s, _K_HEADER if m else _K_TEXT, True, m)
+    if c == '>':
+        return (line, s, _K_QUOTE, True, None)
+    if c == '-' or c == '*':
+        m = _LIST_RE.match(line)
+        if m:
+            return (line, s, _K_LIST, True, m)
+        if c == '-' and _HR_RE.match(s):
+            return (line, s, _K_HR, True, None)
+        return (line, s, _K_TEXT, False, None)
+    if c == '<':
+        return (line, s, _K_HTML, True, None)
+    return (line, s, _K_TEXT, c == '|', None)
+
 
-    while i < len(lines):
-        line = lines[i]
+def _iter_lines(f):
+    """파일 줄을 str.split('\\n')과 같은 경계로 반환한다 (끝 개행 뒤 빈 줄 포함)."""
+    line = ''
+    for line in f:
+        yield line
+    if not line or line.endswith('\n'):
+        yield ''
+
+
+def parse_markdown_iter(source):
+    """마크다운을 한 번의 선형 패스로 파싱하며 블록을 하나씩 반환한다.
+
+    한 줄 앞보기(테이블 구분선 확인)만 사용하므로 파일 객체를 넘기면
+    전체 텍스트를 메모리에 올리지 않고 읽는 대로 블록을 내보낸다.
+
+    Args:
+        source: 마크다운 문자열 또는 줄 iterable (예: 텍스트 모드 파일 객체)
+
+    Yields:
+        dict: parse_markdown()과 동일한 형식의 블록
+    """
+    return _iter_blocks(source, None)
+
+
+def _iter_blocks(source, status):
+    """parse_markdown_iter() 본체. status dict가 주어지면 닫히지 않은
+    코드 블록으로 입력이 끝났을 때 status['open_code'] = True를 기록한다."""
+    if isinstance(source, str):
+        source = source.split('\n')
+    else:
+        source = _iter_lines(source)
+    tokens = map(_classify, source)
+    cur = next(tokens, None)
+    nxt = next(tokens, None)
+
+    while cur is not None:
+        line, s, kind = cur[0], cur[1], cur[2]
 
         # Code block
-        if line.strip().startswith('```'):
+        if kind == _K_FENCE:
             code_lines = []
-            lang = line.strip()[3:].strip()
-            i += 1
-            while i < len(lines) and not lines[i].strip().startswith('```'):
-                code_lines.append(lines[i])
-                i += 1
-            blocks.append({
+            lang = s[3:].strip()
+            cur, nxt = nxt, next(tokens, None)
+            while cur is not None and cur[2] != _K_FENCE:
+                code_lines.append(cur[0])
+                cur, nxt = nxt, next(tokens, None)
+            if cur is None and status is not None:
+                status['open_code'] = True
+            yield {
                 'type': BLOCK_CODE,
                 'content': '\n'.join(code_lines),
                 'lang': lang,
-            })
-            i += 1
+            }
+            cur, nxt = nxt, next(tokens, None)
             continue
 
         # Table
-        if '|' in line and i + 1 < len(lines) and '---' in lines[i + 1]:
+        if '|' in line and nxt is not None and '---' in nxt[0]:
             table_lines = []
-            while i < len(lines) and '|' in lines[i]:
-                table_lines.append(lines[i])
-                i += 1
-            blocks.append({'type': BLOCK_TABLE, 'lines': table_lines})
+            while cur is not None and '|' in cur[0]:
+                table_lines.append(cur[0])
+                cur, nxt = nxt, next(tokens, None)
+            yield {'type': BLOCK_TABLE, 'lines': table_lines}
             continue
 
         # Header
-        m = re.match(r'^(#{1,6})\s+(.*)', line)
-        if m:
-            level = len(m.group(1))
-            blocks.append({
+        if kind == _K_HEADER:
+            m = cur[4]
+            yield {
                 'type': BLOCK_HEADER,
-                'level': level,
+                'level': len(m.group(1)),
                 'text': m.group(2),
-            })
-            i += 1
+            }
+            cur, nxt = nxt, next(tokens, None)
             continue
 
         # Blockquote
-        if line.strip().startswith('>'):
+        if kind == _K_QUOTE:
             quote_lines = []
-            while i < len(lines) and lines[i].strip().startswith('>'):
-                quote_lines.append(lines[i].strip().lstrip('>').strip())
-                i += 1
-            blocks.append({
+            while cur is not None and cur[1].startswith('>'):
+                quote_lines.append(cur[1].lstrip('>').strip())
+                cur, nxt = nxt, next(tokens, None)
+            yield {
                 'type': BLOCK_BLOCKQUOTE,
                 'content': '\n'.join(quote_lines),
-            })
+            }
             continue
 
         # Bullet list
-        if re.match(r'^[\s]*[-*]\s', line):
+        if kind == _K_LIST:
             list_items = []
-            while i < len(lines) and re.match(r'^[\s]*[-*]\s', lines[i]):
-                indent = len(lines[i]) - len(lines[i].lstrip())
-                item_text = re.sub(r'^[\s]*[-*]\s', '', lines[i])
-                list_items.append({'indent': indent, 'text': item_text})
-                i += 1
-            blocks.append({'type': BLOCK_LIST, 'items': list_items})
+            while cur is not None and cur[2] == _K_LIST:
+                item_line = cur[0]
+                indent = len(item_line) - len(item_line.lstrip())
+                list_items.append({'indent': indent,
+                                   'text': item_line[cur[4].end():]})
+                cur, nxt = nxt, next(tokens, None)
+            yield {'type': BLOCK_LIST, 'items': list_items}
             continue
 
         # Horizontal rule
-        if re.match(r'^---+$', line.strip()):
-            blocks.append({'type': BLOCK_HR})
-            i += 1
+        if kind == _K_HR:
+            yield {'type': BLOCK_HR}
+            cur, nxt = nxt, next(tokens, None)
             continue
 
-        # Empty line
-        if line.strip() == '':
-            i += 1
-            continue
-
-        # Skip HTML tags
-        if line.strip().startswith('<'):
-            i += 1
+        # Empty line / HTML tags
+        if kind == _K_BLANK or kind == _K_HTML:
+            cur, nxt = nxt, next(tokens, None)
             continue
 
         # Regular paragraph (merge consecutive non-empty lines)
         para_lines = [line]
-        i += 1
-        while (i < len(lines) and lines[i].strip()
-               and not lines[i].strip().startswith('#')
-               and not lines[i].strip().startswith('|')
-               and not lines[i].strip().startswith('```')
-               and not lines[i].strip().startswith('>')
-               and not re.match(r'^[\s]*[-*]\s', lines[i])
-               and not re.match(r'^---+$', lines[i].strip())
-               and not lines[i].strip().startswith('<')):
-            para_lines.append(lines[i])
-            i += 1
-        blocks.append({
+        cur, nxt = nxt, next(tokens, None)
+        while cur is not None and not cur[3]:
+            para_lines.append(cur[0])
+            cur, nxt = nxt, next(tokens, None)
+        yield {
             'type': BLOCK_PARAGRAPH,
             'text': ' '.join(para_lines),
-        })
+        }
+
+
+def parse_markdown(text):
+    """마크다운 텍스트를 블록 리스트로 파싱한다.
+
+    블록 타입:
+      - code: {'type': 'code', 'content': str}
+      - table: {'type': 'table', 'lines': [str]}
+      - header: {'type': 'header', 'level': int, 'text': str}
+      - blockquote: {'type': 'blockquote', 'content': str}
+      - list: {'type': 'list', 'items': [{'indent': int, 'text': str}]}
+      - hr: {'type': 'hr'}
+      - paragraph: {'type': 'paragraph', 'text': str}
+
+    Returns:
+        list[dict]: 파싱된 블록 리스트
+    """
+    return list(parse_markdown_iter(text))
+
+
+# ── Chunked parsing (증분 파싱용) ─────────────────────────────
+# '# ' H1 줄은 코드 블록 밖이면 항상 블록 경계다: 문단/인용/목록은 '#' 줄에서
+# 끝나고, '|'가 없으면 테이블도 끝난다. '---'가 없으면 앞 줄의 테이블 판정
+# (앞보기)에도 영향을 주지 않는다. 따라서 이런 줄에서 자른 조각을 따로
+# 파싱해 이어붙이면 전체 파싱과 같다 — 코드 블록 안인 경우만 예외.
+
+_CHUNK_BOUNDARY_RE = re.compile(r'^#\s')
+
+
+def chunk_boundaries(lines):
+    """조각 경계 후보 줄 번호를 반환한다 (첫 줄 제외).
+
+    후보가 코드 블록 안에 있을 수 있으므로, 앞 조각이 닫히지 않은 코드
+    블록으로 끝나면(parse_markdown_chunk 참고) 그 후보는 건너뛴다.
+
+    Args:
+        lines: text.split('\\n') 결과
+
+    Returns:
+        list[int]: 후보 줄 번호 리스트
+    """
+    return [i for i, line in enumerate(lines)
+            if i and _CHUNK_BOUNDARY_RE.match(line)
+            and '|' not in line and '---' not in line]
+
 
-    return blocks
+def parse_markdown_chunk(text):
+    """조각 하나를 파싱하고 코드 블록이 열린 채 끝났는지 함께 반환한다.
+
+    Returns:
+        tuple: (list[dict] 블록 리스트, bool 닫히지 않은 코드 블록 여부)
+    """
+    status = {}
+    blocks = list(_iter_blocks(text, status))
+    return blocks, status.get('open_code', False)
 
 
 def parse_table(table_lines):
@@ -162,31 +277,107 @@ def parse_table(table_lines):
     return rows
 
 
-def parse_inline(text):
-    """마크다운 인라인 서식을 파싱하여 run 리스트로 반환한다.
+# ── Inline formatting ─────────────────────────────────────────
+# 같은 문자열(표 셀, 요약 필드 등)이 반복해서 들어오므로 결과를 LRU로 캐시한다.
 
-    Returns:
-        list[dict]: [{'text': str, 'bold': bool, 'italic': bool}, ...]
+INLINE_CACHE_SIZE = 4096
+
+
+def _split_inline(text):
+    """re.split(r'(\\*\\*\\*.*?\\*\\*\\*|\\*\\*.*?\\*\\*|\\*.*?\\*)', text)와 같은 결과.
+
+    '*' 위치에서만 *** → ** → * 순으로 닫는 구분자를 찾는다 (줄바꿈은
+    넘지 않음 — 정규식의 '.'과 동일).
     """
-    parts = re.split(r'(\*\*\*.*?\*\*\*|\*\*.*?\*\*|\*.*?\*)', text)
+    parts = []
+    last = 0
+    pos = text.find('*')
+    while pos >= 0:
+        nl = text.find('\n', pos)
+        limit = nl if nl >= 0 else len(text)
+        end = -1
+        for delim in ('***', '**', '*'):
+            if text.startswith(delim, pos):
+                j = text.find(delim, pos + len(delim), limit)
+                if j >= 0:
+                    end = j + len(delim)
+                    break
+        if end < 0:
+            pos = text.find('*', pos + 1)
+            continue
+        parts.append(text[last:pos])
+        parts.append(text[pos:end])
+        last = end
+        pos = text.find('*', end)
+    parts.append(text[last:])
+    return parts
+
+
+@lru_cache(maxsize=INLINE_CACHE_SIZE)
+def _inline_runs(text):
     runs = []
-    for part in parts:
+    for part in _split_inline(text):
         if not part:
             continue
         if part.startswith('***') and part.endswith('***'):
-            runs.append({'text': part[3:-3], 'bold': True, 'italic': True})
+            runs.append((part[3:-3], True, True))
         elif part.startswith('**') and part.endswith('**'):
-            runs.append({'text': part[2:-2], 'bold': True, 'italic': False})
+            runs.append((part[2:-2], True, False))
         elif part.startswith('*') and part.endswith('*'):
-            runs.append({'text': part[1:-1], 'bold': False, 'italic': True})
+            runs.append((part[1:-1], False, True))
         else:
-            runs.append({'text': part, 'bold': False, 'italic': False})
-    return runs
+            runs.append((part, False, False))
+    return tuple(runs)
 
 
+def parse_inline(text):
+    """마크다운 인라인 서식을 파싱하여 run 리스트로 반환한다.
+
+    Returns:
+        list[dict]: [{'text': str, 'bold': bool, 'italic': bool}, ...]
+    """
+    return [{'text': t, 'bold': b, 'italic': i} for t, b, i in _inline_runs(text)]
+
+
+def _star_run(text, pos):
+    end = pos
+    while end < len(text) and text[end] == '*':
+        end += 1
+    return end - pos
+
+
+@lru_cache(maxsize=INLINE_CACHE_SIZE)
 def strip_markdown(text):
-    """마크다운 인라인 서식을 제거하여 일반 텍스트로 반환한다."""
-    return re.sub(r'\*{1,3}(.*?)\*{1,3}', r'\1', text)
+    """마크다운 인라인 서식을 제거하여 일반 텍스트로 반환한다.
+
+    re.sub(r'\\*{1,3}(.*?)\\*{1,3}', r'\\1', text)와 같은 결과를 한 번의
+    스캔으로 만든다.
+    """
+    pos = text.find('*')
+    if pos < 0:
+        return text
+    out = []
+    last = 0
+    while pos >= 0:
+        nl = text.find('\n', pos)
+        limit = nl if nl >= 0 else len(text)
+        match = None
+        # 여는 '*'는 최대 3개부터 줄여 가며, 내용은 가장 짧게 (정규식 백트래킹 순서)
+        for k in range(min(3, _star_run(text, pos)), 0, -1):
+            j = text.find('*', pos + k, limit)
+            if j >= 0:
+                match = (pos + k, j, j + min(3, _star_run(text, j)))
+                break
+        if match is None:
+            pos = text.find('*', pos + 1)
+            continue
+        start, stop, end = match
+        out.append(text[last:pos])
+        out.append(text[start:stop])
+        last = end
+        pos = text.find('*', end)
+    out.append(text[last:])
+    return ''.join(out)
 
 
 # ── Section extraction ────────────────────────────────────────
@@ -205,6 +396,7 @@ SECTION_PATTERNS = [
 ]
 
 
+@lru_cache(maxsize=256)
 def detect_section(header_text):
     """H1 헤더 텍스트에서 섹션 ID를 반환한다.
 
@@ -220,61 +412,123 @@ def detect_section(header_text):
     return None
 
 
+class ParsedDocument:
+    """파싱된 문서 — 블록 리스트와 H1 섹션 인덱스.
+
+    섹션 인덱스는 생성 시 한 번만 계산된다 (H1마다 detect_section 1회).
+    각 섹션은 블록 리스트의 (start, end) 범위로 기록되며, 섹션 조회는
+    전체 재스캔 없이 해당 범위의 슬라이스를 반환한다.
+
+    블록 리스트처럼 순회/인덱싱할 수 있다. 생성 후 blocks를 수정하면
+    인덱스가 맞지 않으므로 수정하지 않는다.
+    """
+
+    def __init__(self, blocks):
+        """
+        Args:
+            blocks: parse_markdown() 결과
+        """
+        self.blocks = blocks
+        # 원본 마크다운 SHA-256 (ParseCache가 채움, 없으면 None)
+        self.source_sha = None
+        # [(section_id, start, end)] — 감지된 H1 헤더 다음 블록부터 다음 감지 H1 전까지
+        self.ranges = []
+        self._views = {}
+
+        current = None
+        for i, block in enumerate(blocks):
+            if block['type'] == BLOCK_HEADER and block.get('level') == 1:
+                detected = detect_section(block['text'])
+                if detected:
+                    if current is not None:
+                        self.ranges.append((current[0], current[1], i))
+                    current = (detected, i + 1)
+        if current is not None:
+            self.ranges.append((current[0], current[1], len(blocks)))
+
+        self.section_index = {}
+        for section_id, start, end in self.ranges:
+            self.section_index.setdefault(section_id, []).append((start, end))
+
+    def __iter__(self):
+        return iter(self.blocks)
+
+    def __len__(self):
+        return len(self.blocks)
+
+    def __getitem__(self, index):
+        return self.blocks[index]
+
+    def section_ids(self):
+        """문서에 등장한 섹션 ID (첫 등장 순서)."""
+        return list(self.section_index)
+
+    def section_blocks(self, section_id):
+        """섹션의 블록 리스트 (같은 섹션이 여러 번 나오면 이어붙임).
+
+        호출마다 새 리스트를 반환하므로 호출자가 수정해도 캐시에 영향이 없다.
+
+        Returns:
+            list[dict]: 블록 리스트 (없으면 빈 리스트)
+        """
+        view = self._views.get(section_id)
+        if view is None:
+            spans = self.section_index.get(section_id, ())
+            view = tuple(b for start, end in spans for b in self.blocks[start:end])
+            self._views[section_id] = view
+        return list(view)
+
+    def sections(self):
+        """get_all_sections()와 같은 형식의 dict를 반환한다."""
+        return {sid: self.section_blocks(sid) for sid in self.section_index}
+
+    def extract(self, start_section_id, end_section_id=None):
+        """extract_section_blocks()와 같은 결과를 인덱스로 계산한다.
+
+        시작 섹션의 첫 등장부터, 같은 섹션 헤더가 연속되는 동안의 범위를
+        이어붙인다. 다른 섹션 헤더(종료 섹션 포함)에서 끝난다.
+        """
+        result = []
+        capturing = False
+        for section_id, start, end in self.ranges:
+            if section_id == start_section_id:
+                capturing = True
+                result.extend(self.blocks[start:end])
+            elif capturing:
+                break
+        return result
+
+
+def _as_document(blocks):
+    if isinstance(blocks, ParsedDocument):
+        return blocks
+    return ParsedDocument(blocks)
+
+
 def extract_section_blocks(blocks, start_section_id, end_section_id=None):
     """특정 섹션의 블록들을 추출한다.
 
     Args:
-        blocks: parse_markdown() 결과
+        blocks: parse_markdown() 결과 또는 ParsedDocument (인덱스 재사용)
         start_section_id: 시작 섹션 ID ('1', '2', ..., 'summary', 'appendix')
         end_section_id: 종료 섹션 ID (None이면 끝까지)
 
     Returns:
         list[dict]: 해당 섹션의 블록 리스트 (시작 H1 헤더 제외)
     """
-    result = []
-    capturing = False
-
-    for block in blocks:
-        if block['type'] == BLOCK_HEADER and block.get('level') == 1:
-            section = detect_section(block['text'])
-            if section == start_section_id:
-                capturing = True
-                continue
-            if capturing and end_section_id and section == end_section_id:
-                break
-            if capturing and section is not None and section != start_section_id:
-                break
-
-        if capturing:
-            result.append(block)
-
-    return result
+    return _as_document(blocks).extract(start_section_id, end_section_id)
 
 
 def get_all_sections(blocks):
     """전체 블록에서 섹션별로 분리한다.
 
+    Args:
+        blocks: parse_markdown() 결과 또는 ParsedDocument (인덱스 재사용)
+
     Returns:
         dict: {section_id: [blocks]}
     """
-    sections = {}
-    current_section = None
-
-    for block in blocks:
-        if block['type'] == BLOCK_HEADER and block.get('level') == 1:
-            detected = detect_section(block['text'])
-            if detected:
-                current_section = detected
-                if current_section not in sections:
-                    sections[current_section] = []
-                continue
-
-        if current_section:
-            if current_section not in sections:
-                sections[current_section] = []
-            sections[current_section].append(block)
-
-    return sections
+    return _as_document(blocks).sections()
 
 
 def load_and_parse(md_path):
@@ -286,5 +540,17 @@ def load_and_parse(md_path):
     Returns:
         list[dict]: 파싱된 블록 리스트
     """
-    text = Path(md_path).read_text(encoding='utf-8')
-    return parse_markdown(text)
+    with open(md_path, encoding='utf-8') as f:
+        return list(parse_markdown_iter(f))
+
+
+def load_document(md_path):
+    """마크다운 파일을 읽어 섹션 인덱스가 있는 ParsedDocument로 반환한다.
+
+    Args:
+        md_path: 마크다운 파일 경로
+
+    Returns:
+        ParsedDocument: 블록 리스트 + 섹션 인덱스
+    """
+    return ParsedDocument(load_and_parse(md_path))
@@ -15,6 +15,9 @@ Usage:
 import re
 from src.md_parser import parse_table, parse_inline, strip_markdown
 
+# 컴파일 결과(오퍼레이션 형식/상수)가 바뀌면 올린다 — 캐시 무효화 키
+COMPILER_VERSION = 1
+
 # ── 색상 상수 (BGR 변환은 COM 측에서 처리) ─────────────────
 COLOR_BLACK = 0x000000
 COLOR_GREEN = 0x003070    # #007030 → BGR: 0x300070
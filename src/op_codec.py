@@ -0,0 +1,178 @@
+"""COM 오퍼레이션 압축 표현 — 브릿지 전송용 op 테이블 + 문자열 테이블.
+
+md_to_ops의 오퍼레이션은 {'op': 'set_char_shape', 'font': ..., 'size': ...}
+형태의 dict이다. 큰 계획서는 이런 dict가 수만 개이고 같은 키/값
+('set_char_shape', '바탕', 'left' 등)이 반복되어 브릿지 스크립트에 실리는
+JSON이 커진다.
+
+이 모듈은 오퍼레이션을 고정 필드 순서의 행(row)으로 바꾼다:
+    {'op': 'set_char_shape', 'font': '바탕', 'size': 10}
+      → [1, 0, 10]            # [op 코드, font(문자열 인덱스), size]
+문자열 값은 계획 전체가 공유하는 문자열 테이블의 인덱스로 저장되며,
+행 끝의 None은 생략된다. 스키마에 없는 op/필드나 타입이 다른 값은 원래
+dict 그대로 전달된다 (create_document 등에 임의 op 허용).
+
+전송 형식(encode_plan): JSON → zlib → bytes. 복원(decode_plan) 결과는
+원래 단계 리스트와 같다. 양쪽(WSL/Windows)에서 같은 모듈을 사용한다.
+
+Usage:
+    from src.op_codec import encode_plan, decode_plan
+    data = encode_plan(steps)      # WSL
+    steps = decode_plan(data)      # Windows (com_jobs)
+"""
+
+import json
+import zlib
+
+WIRE_VERSION = 1
+
+# op 이름 → 필드 순서 (md_to_ops의 _*_op 생성자와 같은 순서)
+OP_FIELDS = {
+    'insert_text': ('text',),
+    'set_char_shape': ('font', 'size', 'bold', 'italic', 'color', 'underline'),
+    'set_para_shape': ('align', 'line_spacing', 'space_before', 'space_after',
+                       'indent_left', 'first_line_indent'),
+    'line_break': (),
+    'page_break': (),
+    'insert_table': ('rows', 'cols'),
+    'fill_table': ('data',),
+    'set_cell_background': ('r', 'g', 'b'),
+}
+OP_NAMES = tuple(OP_FIELDS)
+OP_CODES = {name: code for code, name in enumerate(OP_NAMES)}
+
+# 문자열 테이블로 인코딩하는 필드 ('data'는 문자열 2차원 리스트)
+STRING_FIELDS = frozenset({'text', 'font', 'align'})
+MATRIX_FIELDS = frozenset({'data'})
+
+
+class StringTable:
+    """문자열 → 인덱스 테이블 (첫 등장 순서)."""
+
+    __slots__ = ('strings', '_index')
+
+    def __init__(self):
+        self.strings = []
+        self._index = {}
+
+    def intern(self, s):
+        idx = self._index.get(s)
+        if idx is None:
+            idx = self._index[s] = len(self.strings)
+            self.strings.append(s)
+        return idx
+
+
+def _encode_op(op, table):
+    """op dict 하나를 행으로 인코딩 (스키마 밖이면 None)."""
+    fields = OP_FIELDS.get(op.get('op'))
+    if fields is None or len(op) - 1 > len(fields):
+        return None
+    row = [OP_CODES[op['op']]]
+    used = 1
+    for field in fields:
+        if field not in op:
+            row.append(None)
+            continue
+        value = op[field]
+        used += 1
+        if field in STRING_FIELDS:
+            if not isinstance(value, str):
+                return None
+            value = table.intern(value)
+        elif field in MATRIX_FIELDS:
+            # 행은 반드시 리스트 — 문자열 행은 글자로 쪼개지므로 원본 유지
+            if not isinstance(value, (list, tuple)) or not all(
+                    isinstance(r, (list, tuple)) and all(isinstance(c, str) for c in r)
+                    for r in value):
+                return None
+            value = [[table.intern(c) for c in r] for r in value]
+        elif value is None:
+            return None  # None 값과 생략된 필드를 구분할 수 없음
+        row.append(value)
+    if used != len(op):
+        return None  # 스키마에 없는 필드 포함
+    while row[-1] is None:
+        row.pop()
+    return row
+
+
+def encode_ops(ops, table):
+    """오퍼레이션 리스트를 행 리스트로 인코딩한다.
+
+    Args:
+        ops: md_to_ops 오퍼레이션 리스트
+        table: 공유 StringTable
+
+    Returns:
+        list: 행(list) 또는 원본 dict의 리스트
+    """
+    rows = []
+    for op in ops:
+        row = _encode_op(op, table)
+        rows.append(op if row is None else row)
+    return rows
+
+
+def decode_ops(rows, strings):
+    """encode_ops()의 역변환.
+
+    Args:
+        rows: encode_ops() 결과
+        strings: 문자열 테이블 리스트
+
+    Returns:
+        list[dict]: 오퍼레이션 리스트
+    """
+    ops = []
+    for row in rows:
+        if isinstance(row, dict):
+            ops.append(row)
+            continue
+        name = OP_NAMES[row[0]]
+        op = {'op': name}
+        for field, value in zip(OP_FIELDS[name], row[1:]):
+            if value is None:
+                continue
+            if field in STRING_FIELDS:
+                value = strings[value]
+            elif field in MATRIX_FIELDS:
+                value = [[strings[c] for c in r] for r in value]
+            op[field] = value
+        ops.append(op)
+    return ops
+
+
+def _map_plan_ops(steps, func):
+    """단계 리스트의 'ops'(insert_ops)와 sections[].ops(fill_markers)에 func 적용."""
+    result = []
+    for step in steps:
+        step = dict(step)
+        if 'ops' in step:
+            step['ops'] = func(step['ops'])
+        if 'sections' in step:
+            step['sections'] = [dict(s, ops=func(s['ops'])) for s in step['sections']]
+        result.append(step)
+    return result
+
+
+def encode_plan(steps):
+    """작업 계획을 압축 전송 형식(bytes)으로 인코딩한다."""
+    table = StringTable()
+    encoded = _map_plan_ops(steps, lambda ops: encode_ops(ops, table))
+    payload = {'v': WIRE_VERSION, 'strings': table.strings, 'steps': encoded}
+    data = json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+    return zlib.compress(data.encode('utf-8'), 9)
+
+
+def decode_plan(data):
+    """encode_plan()의 역변환.
+
+    Raises:
+        ValueError: 전송 형식 버전이 다를 때
+    """
+    payload = json.loads(zlib.decompress(data).decode('utf-8'))
+    if payload.get('v') != WIRE_VERSION:
+        raise ValueError(f"Unsupported plan wire version: {payload.get('v')!r}")
+    strings = payload['strings']
+    return _map_plan_ops(payload['steps'], lambda rows: decode_ops(rows, strings))
@@ -0,0 +1,126 @@
+"""페이지 정렬 — 참조/생성 PDF의 페이지 수가 다를 때 대응 페이지 찾기.
+
+생성 PDF에 페이지가 하나 늘거나 줄면 i번째끼리 비교하는 방식은 그 뒤
+모든 페이지가 어긋난다. 페이지마다 싼 서명(텍스트 해시, 텍스트 SimHash,
+저해상도 평균 해시)을 만들고, 서명 간 거리로 전역 서열 정렬
+(Needleman-Wunsch)을 해서 대응 쌍과 삽입/삭제 페이지를 구한다.
+
+  - 텍스트가 같은(비어 있지 않은) 페이지: 비용 0
+  - 그 외: (SimHash 해밍 비율 + 평균 해시 해밍 비율) / 2 (0.0 ~ 1.0)
+    셀 몇 개만 채워진 페이지는 둘 다 작고, 다른 페이지는 SimHash가 ~0.5
+  - 삽입/삭제: gap_cost — 비용이 2 * gap_cost보다 큰 쌍은 짝짓지 않는다
+
+Usage:
+    from src.page_align import PageSignature, align_pages
+    pairs = align_pages(ref_sigs, gen_sigs)   # [(ref_page|None, gen_page|None), ...]
+"""
+
+import hashlib
+import re
+
+import numpy as np
+
+HASH_SIZE = 16
+SHINGLE_SIZE = 3
+DEFAULT_GAP_COST = 0.25
+
+_WS_RE = re.compile(r"\s+")
+
+
+def text_hash(text):
+    """공백을 무시한 텍스트 해시 (빈 텍스트면 None)."""
+    normalized = _WS_RE.sub("", text)
+    if not normalized:
+        return None
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+def text_simhash(text):
+    """공백을 무시한 문자 3-gram의 64비트 SimHash (bool 배열, 빈 텍스트면 None)."""
+    normalized = _WS_RE.sub("", text)
+    if not normalized:
+        return None
+    shingles = {normalized[i:i + SHINGLE_SIZE]
+                for i in range(max(1, len(normalized) - SHINGLE_SIZE + 1))}
+    digests = b"".join(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest()
+                       for s in shingles)
+    bits = np.unpackbits(np.frombuffer(digests, dtype=np.uint8)).reshape(-1, 64)
+    return bits.sum(axis=0) * 2 > len(shingles)
+
+
+def average_hash(arr):
+    """HASH_SIZE x HASH_SIZE로 줄인 그레이스케일 배열의 평균 해시 (bool 배열)."""
+    arr = np.asarray(arr, dtype=np.float32)
+    return (arr > arr.mean()).ravel()
+
+
+class PageSignature:
+    """페이지 하나의 정렬용 서명."""
+
+    __slots__ = ("page", "text_hash", "simhash", "image_hash")
+
+    def __init__(self, page, text, image_hash):
+        """
+        Args:
+            page: 1-based 페이지 번호
+            text: 페이지 텍스트
+            image_hash: average_hash() 결과
+        """
+        self.page = page
+        self.text_hash = text_hash(text)
+        self.simhash = text_simhash(text)
+        self.image_hash = image_hash
+
+    def distance(self, other):
+        """0.0(같음) ~ 1.0(완전히 다름)"""
+        if self.text_hash is not None and self.text_hash == other.text_hash:
+            return 0.0
+        if self.simhash is None and other.simhash is None:
+            text_dist = 0.0
+        elif self.simhash is None or other.simhash is None:
+            text_dist = 1.0
+        else:
+            text_dist = _hamming_ratio(self.simhash, other.simhash)
+        return (text_dist + _hamming_ratio(self.image_hash, other.image_hash)) / 2
+
+
+def _hamming_ratio(bits1, bits2):
+    return float(np.count_nonzero(bits1 != bits2)) / bits1.size
+
+
+def align_pages(ref_sigs, gen_sigs, gap_cost=DEFAULT_GAP_COST):
+    """서명 리스트를 전역 정렬한다.
+
+    Returns:
+        list[tuple]: (참조 페이지, 생성 페이지) 순서대로. 삭제된 참조 페이지는
+                     (page, None), 삽입된 생성 페이지는 (None, page)
+    """
+    n, m = len(ref_sigs), len(gen_sigs)
+    cost = np.zeros((n + 1, m + 1), dtype=np.float64)
+    cost[:, 0] = np.arange(n + 1) * gap_cost
+    cost[0, :] = np.arange(m + 1) * gap_cost
+    for i in range(1, n + 1):
+        ref = ref_sigs[i - 1]
+        for j in range(1, m + 1):
+            cost[i, j] = min(
+                cost[i - 1, j - 1] + ref.distance(gen_sigs[j - 1]),
+                cost[i - 1, j] + gap_cost,
+                cost[i, j - 1] + gap_cost,
+            )
+
+    # 역추적 (동률이면 짝짓기 우선)
+    pairs = []
+    i, j = n, m
+    while i > 0 or j > 0:
+        if i > 0 and j > 0 and np.isclose(
+                cost[i, j], cost[i - 1, j - 1] + ref_sigs[i - 1].distance(gen_sigs[j - 1])):
+            pairs.append((ref_sigs[i - 1].page, gen_sigs[j - 1].page))
+            i, j = i - 1, j - 1
+        elif i > 0 and np.isclose(cost[i, j], cost[i - 1, j] + gap_cost):
+            pairs.append((ref_sigs[i - 1].page, None))
+            i -= 1
+        else:
+            pairs.append((None, gen_sigs[j - 1].page))
+            j -= 1
+    pairs.reverse()
+    return pairs
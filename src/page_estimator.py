@@ -0,0 +1,284 @@
+"""오프라인 페이지 추정기 — COM 없이 오퍼레이션 리스트의 줄/페이지 수를 근사.
+
+양식 HWPX의 header.xml(바탕글 charPr/paraPr)에서 기본 글자 크기·장평·자간·
+줄간격을, section0.xml의 hp:pagePr에서 용지/여백을 읽어 본문 영역을 구한다.
+md_to_ops 오퍼레이션(set_char_shape/set_para_shape/insert_text/line_break/
+insert_table/fill_table ...)을 순서대로 흉내 내어 문단별 줄 수와 높이를 누적한다.
+
+글꼴 파일 없이 계산하므로 폭은 근사값이다:
+  - 한글/한자/전각: 글자 크기 × 장평(hangul)
+  - 공백: 글자 크기 × 0.5
+  - 그 외(라틴/숫자/기호): 글자 크기 × 0.55 × 장평(latin)
+실제 한글 조판과 수 % 차이가 날 수 있으므로 예산 초과 경고용이다.
+
+Usage:
+    from src.page_estimator import LayoutEstimator
+    est = LayoutEstimator.from_hwpx('output/filled/form_pass1.hwpx')
+    result = est.estimate_ops(ops)          # {'lines', 'height', 'pages'}
+"""
+
+import math
+
+from src.extract_template import NAMESPACES, read_xml_from_hwpx
+
+HWPUNIT_PER_MM = 283.46
+HWPUNIT_PER_PT = 100
+
+# 글자 폭 근사 (글자 크기 대비)
+WIDE_CHAR_EM = 1.0
+SPACE_EM = 0.5
+NARROW_CHAR_EM = 0.55
+
+# 표 셀 안쪽 여백 (좌우/상하 합, HwpUnit) — 한글 기본 셀 여백 1.8mm/0.5mm
+TABLE_CELL_PAD_X = int(2 * 1.8 * HWPUNIT_PER_MM)
+TABLE_CELL_PAD_Y = int(2 * 0.5 * HWPUNIT_PER_MM)
+
+
+def _is_wide(ch):
+    """전각(한글/한자/전각 기호) 여부."""
+    code = ord(ch)
+    return (0x1100 <= code <= 0x11FF or 0x2E80 <= code <= 0xA4CF
+            or 0xAC00 <= code <= 0xD7A3 or 0xF900 <= code <= 0xFAFF
+            or 0xFF00 <= code <= 0xFF60 or 0x3000 <= code <= 0x303F)
+
+
+class PageGeometry:
+    """용지 크기와 여백 (HwpUnit)."""
+
+    def __init__(self, width=59528, height=84188, left=8504, right=8504,
+                 top=5668, bottom=4252, header=4252, footer=4252):
+        self.width = width
+        self.height = height
+        self.left = left
+        self.right = right
+        self.top = top
+        self.bottom = bottom
+        self.header = header
+        self.footer = footer
+
+    @property
+    def body_width(self):
+        return self.width - self.left - self.right
+
+    @property
+    def body_height(self):
+        return self.height - self.top - self.bottom - self.header - self.footer
+
+    @classmethod
+    def from_section_xml(cls, root):
+        """section0.xml root의 첫 hp:pagePr에서 읽는다 (없으면 A4 기본값)."""
+        page = root.find('.//hp:pagePr', NAMESPACES)
+        if page is None:
+            return cls()
+        geo = cls()
+        width = int(page.get('width', geo.width))
+        height = int(page.get('height', geo.height))
+        # 가로 방향(NARROWLY)이면 폭/높이 교환
+        if page.get('landscape') == 'NARROWLY':
+            width, height = height, width
+        geo.width, geo.height = width, height
+        margin = page.find('hp:margin', NAMESPACES)
+        if margin is not None:
+            for side in ('left', 'right', 'top', 'bottom', 'header', 'footer'):
+                setattr(geo, side, int(margin.get(side, getattr(geo, side))))
+        return geo
+
+
+class FontMetrics:
+    """바탕글 기준 글자 크기·장평·자간·줄간격."""
+
+    def __init__(self, size_pt=10.0, hangul_ratio=100, latin_ratio=100,
+                 hangul_spacing=0, latin_spacing=0, line_spacing=160):
+        self.size_pt = size_pt
+        self.hangul_ratio = hangul_ratio
+        self.latin_ratio = latin_ratio
+        self.hangul_spacing = hangul_spacing
+        self.latin_spacing = latin_spacing
+        self.line_spacing = line_spacing
+
+    @classmethod
+    def from_header_xml(cls, root):
+        """header.xml root에서 '바탕글' 스타일(없으면 id 0)의 charPr/paraPr을 읽는다."""
+        metrics = cls()
+        char_id, para_id = '0', '0'
+        for style in root.findall('.//hh:style', NAMESPACES):
+            if style.get('name') == '바탕글' or style.get('id') == '0':
+                char_id = style.get('charPrIDRef', char_id)
+                para_id = style.get('paraPrIDRef', para_id)
+                if style.get('name') == '바탕글':
+                    break
+
+        for cp in root.findall('.//hh:charPr', NAMESPACES):
+            if cp.get('id') != char_id:
+                continue
+            metrics.size_pt = int(cp.get('height', 1000)) / HWPUNIT_PER_PT
+            ratio = cp.find('hh:ratio', NAMESPACES)
+            if ratio is not None:
+                metrics.hangul_ratio = int(ratio.get('hangul', 100))
+                metrics.latin_ratio = int(ratio.get('latin', 100))
+            spacing = cp.find('hh:spacing', NAMESPACES)
+            if spacing is not None:
+                metrics.hangul_spacing = int(spacing.get('hangul', 0))
+                metrics.latin_spacing = int(spacing.get('latin', 0))
+            break
+
+        for pp in root.findall('.//hh:paraPr', NAMESPACES):
+            if pp.get('id') != para_id:
+                continue
+            # hp:switch 안에 여러 벌이 있을 수 있음 — 첫 PERCENT 값 사용
+            for ls in pp.iter('{%s}lineSpacing' % NAMESPACES['hh']):
+                if ls.get('type', 'PERCENT') == 'PERCENT':
+                    metrics.line_spacing = int(ls.get('value', metrics.line_spacing))
+                    break
+            break
+        return metrics
+
+    def char_width(self, ch, size_pt):
+        """글자 하나의 근사 폭 (HwpUnit)."""
+        em = size_pt * HWPUNIT_PER_PT
+        if ch == ' ':
+            return em * SPACE_EM
+        if _is_wide(ch):
+            return em * WIDE_CHAR_EM * (self.hangul_ratio + self.hangul_spacing) / 100
+        return em * NARROW_CHAR_EM * (self.latin_ratio + self.latin_spacing) / 100
+
+    def line_height(self, size_pt, line_spacing=None):
+        """줄 높이 (HwpUnit) — 글자 크기 × 줄간격(%)."""
+        spacing = self.line_spacing if line_spacing is None else line_spacing
+        return size_pt * HWPUNIT_PER_PT * spacing / 100
+
+
+class LayoutEstimator:
+    """오퍼레이션 리스트 / 텍스트의 줄·페이지 수 근사기."""
+
+    def __init__(self, geometry=None, metrics=None):
+        self.geometry = geometry or PageGeometry()
+        self.metrics = metrics or FontMetrics()
+
+    @classmethod
+    def from_hwpx(cls, hwpx_path):
+        """양식 HWPX에서 용지/여백과 바탕글 서식을 읽어 생성한다."""
+        header = read_xml_from_hwpx(hwpx_path, 'Contents/header.xml')
+        section = read_xml_from_hwpx(hwpx_path, 'Contents/section0.xml')
+        return cls(PageGeometry.from_section_xml(section),
+                   FontMetrics.from_header_xml(header))
+
+    # ── 텍스트 ────────────────────────────────────────────
+
+    def _wrap(self, text, width, size_pt):
+        """줄바꿈 위치 리스트를 반환한다 (각 줄의 끝 인덱스, 글자 단위 줄넘김)."""
+        breaks = []
+        x = 0.0
+        for i, ch in enumerate(text):
+            w = self.metrics.char_width(ch, size_pt)
+            if x + w > width and x > 0:
+                breaks.append(i)
+                x = 0.0
+                if ch == ' ':
+                    continue  # 줄 첫 공백은 폭에 넣지 않음
+            x += w
+        breaks.append(len(text))
+        return breaks
+
+    def text_lines(self, text, width=None, size_pt=None):
+        """텍스트가 차지하는 줄 수 ('\\n'은 강제 줄바꿈).
+
+        Args:
+            text: 일반 텍스트
+            width: 줄 폭 (HwpUnit, None이면 본문 폭)
+            size_pt: 글자 크기 (None이면 바탕글 크기)
+        """
+        width = width or self.geometry.body_width
+        size_pt = size_pt or self.metrics.size_pt
+        return sum(len(self._wrap(line, width, size_pt))
+                   for line in text.split('\n'))
+
+    def lines_in_height(self, height, size_pt=None, line_spacing=None):
+        """주어진 높이(HwpUnit)에 들어가는 줄 수."""
+        size_pt = size_pt or self.metrics.size_pt
+        return max(1, int(height // self.metrics.line_height(size_pt, line_spacing)))
+
+    # ── 오퍼레이션 ────────────────────────────────────────
+
+    def estimate_ops(self, ops):
+        """오퍼레이션 리스트의 줄 수/높이/페이지 수를 추정한다.
+
+        Args:
+            ops: md_to_ops 오퍼레이션 리스트
+
+        Returns:
+            dict: {'lines': int, 'height': int(HwpUnit), 'pages': float}
+        """
+        geo = self.geometry
+        body_height = geo.body_height
+        size = self.metrics.size_pt
+        para = {'line_spacing': self.metrics.line_spacing, 'space_before': 0,
+                'space_after': 0, 'indent_left': 0, 'first_line_indent': 0}
+        texts = []
+        para_size = size
+        total_lines = 0
+        height = 0.0
+        table = None  # (rows, cols) — fill_table 대기 중인 표
+
+        def flush_table():
+            nonlocal table, height, total_lines
+            if table is not None:
+                rows = table[0]
+                height += rows * (self.metrics.line_height(size) + TABLE_CELL_PAD_Y)
+                total_lines += rows
+                table = None
+
+        def flush_para():
+            nonlocal texts, height, total_lines, para_size
+            text = ''.join(texts)
+            width = geo.body_width - para['indent_left']
+            lines = self.text_lines(text, max(width, 1), para_size) if text else 1
+            height += (para['space_before'] + para['space_after']
+                       + lines * self.metrics.line_height(para_size, para['line_spacing']))
+            total_lines += lines
+            texts = []
+            para_size = size
+
+        for op in ops:
+            cmd = op['op']
+            if cmd != 'fill_table':
+                flush_table()
+            if cmd == 'set_char_shape':
+                size = op.get('size', size)
+                if not texts:
+                    para_size = size
+            elif cmd == 'set_para_shape':
+                for key in para:
+                    if op.get(key) is not None:
+                        para[key] = op[key]
+            elif cmd == 'insert_text':
+                texts.append(op['text'])
+                para_size = max(para_size, size)
+            elif cmd == 'line_break':
+                flush_para()
+            elif cmd == 'page_break':
+                if texts:
+                    flush_para()
+                height = math.ceil(height / body_height) * body_height
+            elif cmd == 'insert_table':
+                if texts:
+                    flush_para()
+                table = (op['rows'], op['cols'])
+            elif cmd == 'fill_table' and table is not None:
+                rows, cols = table
+                cell_width = max(geo.body_width / max(cols, 1) - TABLE_CELL_PAD_X, 1)
+                for row in op['data'][:rows]:
+                    lines = max([self.text_lines(str(c), cell_width, size)
+                                 for c in row] or [1])
+                    height += lines * self.metrics.line_height(size) + TABLE_CELL_PAD_Y
+                    total_lines += lines
+                table = None
+        flush_table()
+        if texts:
+            flush_para()
+
+        return {
+            'lines': total_lines,
+            'height': int(height),
+            'pages': round(height / body_height, 2),
+        }
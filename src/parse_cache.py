@@ -0,0 +1,155 @@
+"""파싱/컴파일 결과 디스크 캐시 — 마크다운 내용 해시 기반.
+
+load_and_parse()와 compile_section_ops()는 마크다운 텍스트와 파서/컴파일러
+버전만으로 결과가 정해진다. 같은 계획서로 여러 번 실행할 때(Pass 1, Pass 2,
+재실행) 파싱/컴파일을 반복하지 않도록 결과를 디스크에 보관한다.
+
+키:
+  - 블록:   (마크다운 SHA-256, PARSER_VERSION)
+  - 오퍼레이션: (마크다운 SHA-256, 섹션 ID, PARSER_VERSION, COMPILER_VERSION)
+
+저장 형식은 pickle + zlib (JSON보다 작고 빠름). 캐시 디렉토리의 총 크기가
+max_bytes를 넘으면 가장 오래 사용하지 않은 파일부터 삭제한다 (LRU — 읽을
+때마다 mtime 갱신). 캐시 디렉토리는 사용자 로컬 경로이며, 손상된 항목은
+무시하고 다시 계산한다.
+
+Usage:
+    from src.parse_cache import ParseCache
+    cache = ParseCache()                      # HWPX_CACHE_DIR 또는 ~/.cache/hwpx_automation
+    doc = cache.load_document('business_plan_v2.md')
+    ops = cache.section_ops(doc, '1')
+"""
+
+import hashlib
+import os
+import pickle
+import zlib
+from pathlib import Path
+
+from src.file_utils import default_cache_dir
+from src.md_parser import PARSER_VERSION, ParsedDocument, parse_markdown
+from src.md_to_ops import COMPILER_VERSION, compile_section_ops
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+CACHE_SUFFIX = '.bin'
+
+
+class ParseCache:
+    """마크다운 블록/섹션 오퍼레이션의 크기 제한 LRU 디스크 캐시."""
+
+    def __init__(self, root=None, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+            root: 캐시 디렉토리 (None이면 default_cache_dir())
+            max_bytes: 캐시 파일 총 크기 상한 (바이트)
+        """
+        self.root = Path(root) if root is not None else default_cache_dir()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    # ── 저수준 ────────────────────────────────────────────
+
+    def _path(self, *parts):
+        key = hashlib.sha256('\0'.join(map(str, parts)).encode('utf-8')).hexdigest()
+        return self.root / (key + CACHE_SUFFIX)
+
+    def _get(self, path):
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.loads(zlib.decompress(f.read()))
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, zlib.error, pickle.UnpicklingError, EOFError,
+                AttributeError, ImportError, IndexError, TypeError, ValueError):
+            # 손상된 항목 또는 이전 클래스 구조로 저장된 pickle → 미스
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)  # LRU: 최근 사용 시각 갱신
+        except OSError:
+            pass
+        self.hits += 1
+        return value
+
+    def _put(self, path, value):
+        data = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            # 프로세스별 임시 파일 — 같은 키를 동시에 써도 찢어진 pickle이 교체되지 않음
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            return  # 캐시 쓰기 실패는 무시 (결과는 이미 계산됨)
+        self.evict()
+
+    def evict(self):
+        """총 크기가 max_bytes 이하가 될 때까지 오래된 항목을 삭제한다.
+
+        Returns:
+            int: 삭제한 파일 수
+        """
+        try:
+            entries = [(e.stat().st_mtime, e.stat().st_size, e.path)
+                       for e in os.scandir(self.root)
+                       if e.is_file() and e.name.endswith(CACHE_SUFFIX)]
+        except OSError:
+            return 0
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+    # ── 공개 API ──────────────────────────────────────────
+
+    def parse(self, text):
+        """마크다운 텍스트를 파싱한다 (캐시 적중 시 파싱 생략).
+
+        Returns:
+            ParsedDocument: source_sha가 채워진 문서
+        """
+        sha = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        path = self._path('blocks', sha, PARSER_VERSION)
+        blocks = self._get(path)
+        if blocks is None:
+            blocks = parse_markdown(text)
+            self._put(path, blocks)
+        doc = ParsedDocument(blocks)
+        doc.source_sha = sha
+        return doc
+
+    def load_document(self, md_path):
+        """마크다운 파일을 읽어 parse()한다."""
+        return self.parse(Path(md_path).read_text(encoding='utf-8'))
+
+    def section_ops(self, doc, section_id):
+        """섹션을 컴파일한다 (캐시 적중 시 컴파일 생략).
+
+        Args:
+            doc: parse()/load_document()가 반환한 ParsedDocument
+            section_id: 섹션 ID
+
+        Returns:
+            list[dict]: compile_section_ops(doc.section_blocks(section_id), section_id)
+        """
+        blocks = doc.section_blocks(section_id)
+        if doc.source_sha is None:
+            return compile_section_ops(blocks, section_id)
+        path = self._path('ops', doc.source_sha, section_id,
+                          PARSER_VERSION, COMPILER_VERSION)
+        ops = self._get(path)
+        if ops is None:
+            ops = compile_section_ops(blocks, section_id)
+            self._put(path, ops)
+        return ops
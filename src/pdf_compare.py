@@ -1,36 +1,196 @@
 """PDF 비교 검증 모듈
 
 두 PDF 파일을 페이지별로 시각적/텍스트 비교하여 유사도를 측정합니다.
-- SSIM (구조적 유사도)
+- SSIM (구조적 유사도, ssim_kernels의 float32 NumPy 구현)
 - 픽셀 차이 비율
 - 텍스트 내용 일치도
+
+workers > 1이면 페이지를 연속 구간(chunk)으로 나눠 여러 프로세스에서
+비교한다. 각 워커는 자체 fitz 문서 핸들을 열며, 결과는 페이지 순서로
+합쳐진다.
+
+raster_cache(RasterCache)를 주면 참조 PDF의 렌더링 결과를 디스크에
+보관해 다음 실행부터는 생성 PDF 쪽만 렌더링한다.
+
+coarse_dpi를 주면 먼저 저해상도로 비교하고, SSIM이 accept_ssim 이상이고
+텍스트가 일치하는 페이지는 그대로 통과시킨다. 나머지 페이지만 dpi로
+다시 렌더링해 비교한다. 페이지 결과의 "decided_dpi"에 판정 해상도가
+기록된다. 조기 통과 페이지의 SSIM은 저해상도 값이므로 overall_ssim을
+dpi 단독 비교 결과와 비교할 수 없다 (기본값은 사용 안 함).
+
+SSIM이 DIFF_IMAGE_SSIM 미만인 페이지는 비교에 쓴 참조 배열과 차이
+마스크를 크기 제한 버퍼에 보관해, 리포트 생성 시 다시 렌더링하지 않고
+PNG 인코딩만 한다.
+
+tile_size를 주면(기본 128px) 페이지를 타일로 나눠 픽셀이 다른 타일만
+SSIM을 계산한다 (결과는 전체 페이지 SSIM과 같음). 바뀐 타일이 있는
+페이지는 타일별 SSIM 히트맵을 결과("tile_heatmap")에 남긴다.
+
+stream=True면 페이지 결과를 output_dir/pages.jsonl에 끝나는 즉시 한 줄씩
+기록하고(compare_stream), resume=True면 같은 설정의 기존 기록에서 끝난
+페이지를 건너뛴다.
+
+텍스트 유사도는 text_similarity의 단계별 엔진(일치 → 상한 → 줄·문자
+2단계 정렬)으로 계산한다. 문자 구성 상한이 DEFAULT_BOUND_BELOW 미만인
+페이지는 정렬을 생략하고 상한 값을 "bound" 단계로 기록한다. 이 페이지는
+overall_text_match 평균에서 빼고 "text_bound_pages"에 따로 보고한다.
+페이지 결과에는 텍스트가 다른 페이지만 원문을 담는다 (리포트의
+text_diff_page_N.txt).
+
+두 PDF의 페이지 수가 다르면 page_align으로 페이지 서명(텍스트 해시 +
+저해상도 평균 해시)을 정렬해 대응 페이지끼리만 비교하고, 삽입/삭제된
+페이지를 리포트에 기록한다.
 """
 import fitz  # PyMuPDF
 from PIL import Image
 import numpy as np
-from skimage.metrics import structural_similarity as ssim
 import os
 import json
 import io
 import difflib
+import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# 프로젝트 루트를 path에 추가 (python3 src/pdf_compare.py 실행 지원)
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_DIR not in sys.path:
+    sys.path.insert(0, PROJECT_DIR)
+
+from src.compare_stream import STREAM_NAME, PageStream, RunningSummary
+from src.file_utils import file_sha256
+from src import ssim_kernels
+from src.page_align import HASH_SIZE, PageSignature, align_pages, average_hash
+from src.text_similarity import DEFAULT_BOUND_BELOW, STAGE_EXACT, text_similarity
+
+# diff 이미지를 생성하는 SSIM 기준 (이 값 미만인 페이지)
+DIFF_IMAGE_SSIM = 0.95
+
+# 저해상도 조기 통과 기준 (DIFF_IMAGE_SSIM보다 충분히 높게)
+DEFAULT_ACCEPT_SSIM = 0.98
+
+# diff 이미지용 배열 버퍼 상한 (바이트, 150 DPI A4 한 페이지 ≈ 4.3MB)
+DEFAULT_DIFF_BUFFER_BYTES = 256 * 1024 * 1024
+
+# 페이지 정렬 서명용 렌더링 해상도
+SIGNATURE_DPI = 12
+
+# 워커당 chunk 수 (페이지별 비용 편차를 흡수하기 위한 분할 배수)
+CHUNKS_PER_WORKER = 4
+
+
+def _compare_chunk(options, pairs):
+    """워커 프로세스: 자체 문서 핸들로 (참조, 생성) 페이지 쌍 목록을 비교한다."""
+    options = dict(options)
+    ref_sha = options.pop("reference_sha", None)
+    comparator = PdfComparator(**options)
+    comparator._ref_sha = ref_sha  # 부모가 계산한 해시 재사용 (chunk마다 재해시 방지)
+    try:
+        results = [comparator.compare_page(ref, gen) for ref, gen in pairs]
+        return results, comparator._diff_buffer.drain()
+    finally:
+        comparator._close_docs()
+
+
+def _split_chunks(items, n_chunks):
+    """목록을 순서를 유지한 n_chunks개의 연속 구간으로 나눈다."""
+    n_chunks = max(1, min(n_chunks, len(items)))
+    size, extra = divmod(len(items), n_chunks)
+    chunks = []
+    start = 0
+    for i in range(n_chunks):
+        end = start + size + (1 if i < extra else 0)
+        chunks.append(items[start:end])
+        start = end
+    return chunks
+
+
+def _heat_char(score):
+    """타일 SSIM → 히트맵 문자 ('.' = 1.0, '9' ~ '0')"""
+    if score >= 1.0:
+        return "."
+    return str(max(0, min(9, int(score * 10))))
+
+
+class _DiffBuffer:
+    """페이지 → (참조 배열, 차이 마스크) 버퍼. 상한을 넘으면 오래된 것부터 버림."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries = OrderedDict()
+
+    def put(self, page_num, arr_ref, mask):
+        self.pop(page_num)
+        size = arr_ref.nbytes + mask.nbytes
+        if size > self.max_bytes:
+            return
+        self._entries[page_num] = (arr_ref, mask)
+        self.nbytes += size
+        while self.nbytes > self.max_bytes:
+            _, (old_ref, old_mask) = self._entries.popitem(last=False)
+            self.nbytes -= old_ref.nbytes + old_mask.nbytes
+
+    def pop(self, page_num):
+        entry = self._entries.pop(page_num, None)
+        if entry is not None:
+            self.nbytes -= entry[0].nbytes + entry[1].nbytes
+        return entry
+
+    def drain(self):
+        """모든 항목을 (페이지, 참조 배열, 마스크) 리스트로 꺼낸다."""
+        items = [(page, ref, mask) for page, (ref, mask) in self._entries.items()]
+        self._entries.clear()
+        self.nbytes = 0
+        return items
 
 
 class PdfComparator:
     """두 PDF 파일을 페이지별로 비교"""
 
-    def __init__(self, reference_pdf, generated_pdf, dpi=150):
+    def __init__(self, reference_pdf, generated_pdf, dpi=150, raster_cache=None,
+                 coarse_dpi=None, accept_ssim=DEFAULT_ACCEPT_SSIM,
+                 diff_buffer_bytes=DEFAULT_DIFF_BUFFER_BYTES,
+                 tile_size=ssim_kernels.TILE_SIZE):
         """
         Args:
             reference_pdf: 참조(원본) PDF 경로
             generated_pdf: 생성된 PDF 경로
             dpi: 비교용 이미지 해상도
+            raster_cache: 참조 PDF 래스터 캐시 (RasterCache, None이면 사용 안 함)
+            coarse_dpi: 1차 저해상도 비교 DPI (None이면 dpi로만 비교)
+            accept_ssim: 저해상도 SSIM이 이 값 이상이면 dpi 비교 생략
+            diff_buffer_bytes: diff 이미지용 배열 버퍼 상한 (바이트)
+            tile_size: 변경 타일 검출 타일 크기 (px, None이면 페이지 전체 SSIM)
         """
         self.reference_pdf = reference_pdf
         self.generated_pdf = generated_pdf
         self.dpi = dpi
+        self.raster_cache = raster_cache
+        self.coarse_dpi = coarse_dpi if coarse_dpi and coarse_dpi < dpi else None
+        self.accept_ssim = accept_ssim
+        self._diff_buffer = _DiffBuffer(diff_buffer_bytes)
+        self.tile_size = tile_size
+        self._ref_sha = None
         self._ref_doc = None
         self._gen_doc = None
 
+    def _worker_options(self):
+        """워커 프로세스에서 같은 설정의 비교기를 만들기 위한 인자 (+ 참조 PDF 해시)."""
+        if self.raster_cache is not None and self._ref_sha is None:
+            self._ref_sha = file_sha256(self.reference_pdf)
+        return {
+            "reference_pdf": self.reference_pdf,
+            "generated_pdf": self.generated_pdf,
+            "dpi": self.dpi,
+            "raster_cache": self.raster_cache,
+            "coarse_dpi": self.coarse_dpi,
+            "accept_ssim": self.accept_ssim,
+            "diff_buffer_bytes": self._diff_buffer.max_bytes,
+            "tile_size": self.tile_size,
+            "reference_sha": self._ref_sha,
+        }
+
     def _open_docs(self):
         if self._ref_doc is None:
             self._ref_doc = fitz.open(self.reference_pdf)
@@ -45,44 +205,69 @@ class PdfComparator:
             self._gen_doc.close()
             self._gen_doc = None
 
-    def compare(self, output_dir=None, pages=None, threshold=0.90):
+    def compare(self, output_dir=None, pages=None, threshold=0.90, workers=1,
+                stream=False, resume=False):
         """전체 비교 수행
 
         Args:
             output_dir: 리포트 출력 디렉토리 (None이면 리포트 생성 안 함)
             pages: 비교할 페이지 범위 (1-based), 예: (1, 5) -> 1~5페이지
+                   (지정하면 페이지 정렬 없이 같은 번호끼리 비교)
             threshold: PASS 기준 SSIM 값
+            workers: 비교 프로세스 수 (1이면 현재 프로세스에서 순차 비교)
+            stream: True면 output_dir/pages.jsonl에 페이지 결과를 즉시 기록
+            resume: True면 기존 pages.jsonl에서 끝난 페이지를 건너뜀 (stream 포함)
 
         Returns:
             dict: 비교 결과
         """
         self._open_docs()
+        page_stream = None
         try:
             ref_pages = len(self._ref_doc)
             gen_pages = len(self._gen_doc)
 
+            alignment = None
             if pages:
                 start, end = pages
                 start = max(1, start)
                 end = min(end, ref_pages, gen_pages)
                 page_range = range(start, end + 1)
+                pairs = [(n, n) for n in page_range]
+            elif ref_pages != gen_pages:
+                print(f"  페이지 수 불일치 ({ref_pages} vs {gen_pages}) — 페이지 정렬 중...")
+                aligned = self.align_pages()
+                pairs = [(r, g) for r, g in aligned if r is not None and g is not None]
+                alignment = {
+                    "deleted_pages": [r for r, g in aligned if g is None],
+                    "inserted_pages": [g for r, g in aligned if r is None],
+                }
+                page_range = [r for r, _ in pairs]
             else:
-                comparable = min(ref_pages, gen_pages)
-                page_range = range(1, comparable + 1)
-
-            page_results = []
-            ssim_values = []
-            text_matches = []
-
-            for page_num in page_range:
-                print(f"  비교 중: 페이지 {page_num}/{page_range[-1]}...", end="\r")
-                page_result = self.compare_page(page_num)
-                page_results.append(page_result)
-                ssim_values.append(page_result["ssim"])
-                text_matches.append(1.0 if page_result["text_match"] else page_result.get("text_similarity", 0.0))
-
-            overall_ssim = float(np.mean(ssim_values)) if ssim_values else 0.0
-            overall_text_match = float(np.mean(text_matches)) if text_matches else 0.0
+                page_range = range(1, ref_pages + 1)
+                pairs = [(n, n) for n in page_range]
+
+            summary = RunningSummary()
+            on_result = summary.add
+            done = {}
+            if output_dir and (stream or resume):
+                page_stream = PageStream(os.path.join(output_dir, STREAM_NAME),
+                                         self._stream_header(pages))
+                done = page_stream.open(resume)
+                if done:
+                    print(f"  재개: {len(done)}개 페이지 기록 있음 — 나머지만 비교")
+                for page_result in done.values():
+                    summary.add(page_result)
+                on_result = lambda p: self._stream_result(p, page_stream, summary, output_dir)
+
+            todo = [pair for pair in pairs if pair[0] not in done]
+            page_results = self._compare_pages(todo, workers, on_result)
+            page_results = sorted(
+                [done[r] for r, _ in pairs if r in done] + page_results,
+                key=lambda p: p["page"])
+
+            overall_ssim = summary.overall_ssim
+            overall_text_match = summary.overall_text_match
 
             result = {
                 "reference_pdf": os.path.abspath(self.reference_pdf),
@@ -94,8 +279,14 @@ class PdfComparator:
                 "pages": page_results,
                 "overall_ssim": round(overall_ssim, 4),
                 "overall_text_match": round(overall_text_match, 4),
+                "text_bound_pages": sorted(summary.text_bound_pages),
                 "threshold": threshold,
                 "pass": overall_ssim >= threshold,
+                "coarse_dpi": self.coarse_dpi,
+                "coarse_accepted": sum(1 for p in page_results
+                                       if p["decided_dpi"] != self.dpi),
+                "alignment": alignment,
+                "tile_size": self.tile_size,
             }
 
             print()  # newline after \r progress
@@ -105,47 +296,160 @@ class PdfComparator:
 
             return result
         finally:
+            if page_stream is not None:
+                page_stream.close()
             self._close_docs()
 
-    def compare_page(self, page_num):
+    def _stream_header(self, pages):
+        """스트림 재개 판정용 비교 설정 (두 PDF 내용 + 결과에 영향 주는 옵션)"""
+        if self._ref_sha is None:
+            self._ref_sha = file_sha256(self.reference_pdf)
+        return {
+            "reference_sha": self._ref_sha,
+            "generated_sha": file_sha256(self.generated_pdf),
+            "dpi": self.dpi,
+            "coarse_dpi": self.coarse_dpi,
+            "accept_ssim": self.accept_ssim,
+            "tile_size": self.tile_size,
+            "pages": list(pages) if pages else None,
+        }
+
+    def _stream_result(self, page_result, page_stream, summary, output_dir):
+        """스트림 모드 페이지 결과 처리: 텍스트 diff를 바로 쓰고 원문 없이 기록"""
+        if "ref_text" in page_result:
+            self.write_text_diff(page_result, os.path.join(
+                output_dir, f"text_diff_page_{page_result['page']:03d}.txt"))
+            page_result.pop("ref_text")
+            page_result.pop("gen_text")
+        page_stream.write(page_result)
+        summary.add(page_result)
+
+    def _compare_pages(self, pairs, workers=1, on_result=None):
+        """(참조, 생성) 페이지 쌍 비교 (workers > 1이면 프로세스 병렬). 참조 페이지 순서로 반환.
+
+        on_result: 페이지 결과가 나올 때마다 호출 (병렬이면 chunk 단위로 도착)
+        """
+        if not pairs:
+            return []
+        if workers <= 1 or len(pairs) == 1:
+            results = []
+            for ref_page, gen_page in pairs:
+                print(f"  비교 중: 페이지 {ref_page}/{pairs[-1][0]}...", end="\r")
+                page_result = self.compare_page(ref_page, gen_page)
+                if on_result is not None:
+                    on_result(page_result)
+                results.append(page_result)
+            return results
+
+        chunks = _split_chunks(pairs, workers * CHUNKS_PER_WORKER)
+        options = self._worker_options()
+        results = []
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            futures = [
+                pool.submit(_compare_chunk, options, chunk)
+                for chunk in chunks
+            ]
+            for future in as_completed(futures):
+                chunk_results, diff_entries = future.result()
+                if on_result is not None:
+                    for page_result in chunk_results:
+                        on_result(page_result)
+                results.extend(chunk_results)
+                for entry in diff_entries:
+                    self._diff_buffer.put(*entry)
+                print(f"  비교 중: {len(results)}/{len(pairs)} 페이지 "
+                      f"(워커 {workers}개)...", end="\r")
+        results.sort(key=lambda p: p["page"])
+        return results
+
+    def compare_page(self, page_num, gen_page=None):
         """단일 페이지 비교 (1-based page number)
 
+        Args:
+            page_num: 참조 PDF 페이지 번호
+            gen_page: 생성 PDF 페이지 번호 (None이면 page_num과 같음)
+
         Returns:
             dict: 페이지 비교 결과
         """
         self._open_docs()
-
-        # 이미지 비교
-        img_ref = self.page_to_image(self._ref_doc, page_num)
-        img_gen = self.page_to_image(self._gen_doc, page_num)
-
-        # 크기 맞추기 (더 큰 쪽에 맞춤)
-        img_ref, img_gen = self._match_sizes(img_ref, img_gen)
-
-        ssim_val = self.compute_ssim(img_ref, img_gen)
-        pixel_diff = self.compute_pixel_diff(img_ref, img_gen)
+        gen_page = gen_page or page_num
 
         # 텍스트 비교
-        text_result = self.compare_text(page_num)
-
-        return {
+        text_result = self.compare_text(page_num, gen_page)
+
+        # 이미지 비교: 저해상도에서 확실히 같으면 조기 통과
+        decided_dpi = None
+        if self.coarse_dpi and text_result["match"]:
+            ssim_val, pixel_diff, tiles = self._compare_images(page_num, self.coarse_dpi, gen_page)
+            if ssim_val >= self.accept_ssim:
+                decided_dpi = self.coarse_dpi
+        if decided_dpi is None:
+            ssim_val, pixel_diff, tiles = self._compare_images(page_num, self.dpi, gen_page)
+            decided_dpi = self.dpi
+
+        result = {
             "page": page_num,
             "ssim": round(ssim_val, 4),
             "pixel_diff_percent": round(pixel_diff, 2),
             "text_match": text_result["match"],
             "text_similarity": round(text_result["similarity"], 4),
+            "text_stage": text_result["stage"],
+            "decided_dpi": decided_dpi,
         }
+        if gen_page != page_num:
+            result["generated_page"] = gen_page
+        if tiles is not None:
+            changed, heatmap = tiles
+            result["changed_tiles"] = changed
+            if changed:
+                result["tile_heatmap"] = np.round(heatmap, 3).tolist()
+        # 원문은 텍스트가 다른 페이지만 보관 (리포트의 텍스트 diff용)
+        if not text_result["match"]:
+            result["ref_text"] = text_result["ref_text"]
+            result["gen_text"] = text_result["gen_text"]
+        return result
+
+    def _compare_images(self, page_num, dpi, gen_page=None):
+        """지정 해상도로 렌더링해 (SSIM, 픽셀 차이 비율, 타일 정보)를 계산
+
+        타일 정보는 (바뀐 타일 수, 히트맵 배열) — tile_size가 없으면 None
+        """
+        img_ref = self.reference_image(page_num, dpi=dpi)
+        img_gen = self.page_to_image(self._gen_doc, gen_page or page_num, dpi=dpi)
 
-    def page_to_image(self, doc, page_num, auto_rotate=True):
+        # 크기 맞추기 (더 큰 쪽에 맞춤)
+        img_ref, img_gen = self._match_sizes(img_ref, img_gen)
+        arr_ref = np.asarray(img_ref)
+        arr_gen = np.asarray(img_gen)
+
+        # SSIM과 차이 마스크를 같은 버퍼에서 계산
+        tiles = None
+        if self.tile_size:
+            ssim_val, mask, heatmap, changed = ssim_kernels.compare_arrays_tiled(
+                arr_ref, arr_gen, self.tile_size)
+            tiles = (changed, heatmap)
+        else:
+            ssim_val, mask = ssim_kernels.compare_arrays(arr_ref, arr_gen)
+        pixel_diff = ssim_kernels.diff_percent(mask)
+
+        # 리포트에서 diff 이미지를 만들 페이지는 배열을 보관
+        if dpi == self.dpi and ssim_val < DIFF_IMAGE_SSIM:
+            self._diff_buffer.put(page_num, arr_ref, mask)
+
+        return ssim_val, pixel_diff, tiles
+
+    def page_to_image(self, doc, page_num, auto_rotate=True, dpi=None):
         """PDF 페이지를 PIL Image (grayscale)로 변환
 
         Args:
             doc: fitz.Document 객체
             page_num: 1-based 페이지 번호
             auto_rotate: True면 landscape 페이지를 portrait로 자동 회전
+            dpi: 렌더링 해상도 (None이면 self.dpi)
         """
         page = doc.load_page(page_num - 1)  # 0-based
-        zoom = self.dpi / 72.0
+        zoom = (dpi or self.dpi) / 72.0
         mat = fitz.Matrix(zoom, zoom)
         pix = page.get_pixmap(matrix=mat, colorspace=fitz.csGRAY)
         img = Image.frombytes("L", [pix.width, pix.height], pix.samples)
@@ -156,6 +460,23 @@ class PdfComparator:
 
         return img
 
+    def reference_image(self, page_num, auto_rotate=True, dpi=None):
+        """참조 PDF 페이지 이미지 (raster_cache가 있으면 캐시 우선)"""
+        dpi = dpi or self.dpi
+        if self.raster_cache is None:
+            return self.page_to_image(self._ref_doc, page_num, auto_rotate, dpi)
+
+        if self._ref_sha is None:
+            self._ref_sha = file_sha256(self.reference_pdf)
+        key = (self._ref_sha, page_num, dpi, auto_rotate)
+        arr = self.raster_cache.get(*key)
+        if arr is not None:
+            return Image.fromarray(np.asarray(arr), "L")
+
+        img = self.page_to_image(self._ref_doc, page_num, auto_rotate, dpi)
+        self.raster_cache.put(*key, np.asarray(img))
+        return img
+
     def _match_sizes(self, img1, img2):
         """두 이미지 크기를 맞춤 (더 큰 쪽 기준으로 리사이즈)"""
         if img1.size == img2.size:
@@ -176,10 +497,7 @@ class PdfComparator:
         Returns:
             float: 0.0 ~ 1.0 사이 값 (1.0 = 동일)
         """
-        arr1 = np.array(img1)
-        arr2 = np.array(img2)
-        score, _ = ssim(arr1, arr2, full=True)
-        return float(score)
+        return ssim_kernels.ssim(img1, img2)
 
     def compute_pixel_diff(self, img1, img2):
         """픽셀 차이 비율 계산
@@ -187,53 +505,76 @@ class PdfComparator:
         Returns:
             float: 차이 비율 (0.0% ~ 100.0%)
         """
-        arr1 = np.array(img1, dtype=np.float32)
-        arr2 = np.array(img2, dtype=np.float32)
-        diff = np.abs(arr1 - arr2)
-        # 임계값 10 이상의 차이만 "다른 픽셀"로 카운트
-        diff_pixels = np.sum(diff > 10)
-        total_pixels = arr1.size
-        return float(diff_pixels / total_pixels * 100)
-
-    def compare_text(self, page_num):
+        return ssim_kernels.diff_percent(self.diff_mask(img1, img2))
+
+    def diff_mask(self, img1, img2):
+        """픽셀 값 차이가 ssim_kernels.PIXEL_DIFF_LEVEL보다 큰 위치의 bool 배열"""
+        return ssim_kernels.diff_mask(img1, img2)
+
+    def compare_text(self, page_num, gen_page=None):
         """페이지의 텍스트 내용 비교
 
         Args:
             page_num: 1-based 페이지 번호
+            gen_page: 생성 PDF 페이지 번호 (None이면 page_num과 같음)
 
         Returns:
-            dict: {"match": bool, "similarity": float, "ref_text": str, "gen_text": str}
+            dict: {"match": bool, "similarity": float, "stage": str}
+                  불일치면 "ref_text", "gen_text"도 포함.
+                  stage가 "bound"면 similarity는 상한 값
         """
         self._open_docs()
 
         ref_text = self._ref_doc.load_page(page_num - 1).get_text().strip()
-        gen_text = self._gen_doc.load_page(page_num - 1).get_text().strip()
-
-        if ref_text == gen_text:
-            return {"match": True, "similarity": 1.0, "ref_text": ref_text, "gen_text": gen_text}
+        gen_text = self._gen_doc.load_page((gen_page or page_num) - 1).get_text().strip()
+
+        similarity, stage = text_similarity(ref_text, gen_text,
+                                            bound_below=DEFAULT_BOUND_BELOW)
+        if stage == STAGE_EXACT:
+            return {"match": True, "similarity": 1.0, "stage": stage}
+        return {"match": False, "similarity": similarity, "stage": stage,
+                "ref_text": ref_text, "gen_text": gen_text}
+
+    def page_signatures(self, doc):
+        """문서의 모든 페이지 정렬 서명 (텍스트 해시 + 저해상도 평균 해시)"""
+        signatures = []
+        for page_num in range(1, len(doc) + 1):
+            text = doc.load_page(page_num - 1).get_text()
+            img = self.page_to_image(doc, page_num, dpi=SIGNATURE_DPI)
+            small = img.resize((HASH_SIZE, HASH_SIZE), Image.BOX)
+            signatures.append(PageSignature(page_num, text, average_hash(small)))
+        return signatures
+
+    def align_pages(self):
+        """참조/생성 페이지를 서명으로 정렬
 
-        similarity = difflib.SequenceMatcher(None, ref_text, gen_text).ratio()
-        return {"match": False, "similarity": similarity, "ref_text": ref_text, "gen_text": gen_text}
+        Returns:
+            list[tuple]: (참조 페이지|None, 생성 페이지|None) — page_align.align_pages
+        """
+        self._open_docs()
+        return align_pages(self.page_signatures(self._ref_doc),
+                           self.page_signatures(self._gen_doc))
 
-    def generate_diff_image(self, page_num, output_path):
+    def generate_diff_image(self, page_num, output_path, gen_page=None):
         """차이점을 시각화한 이미지 생성
 
         빨간색으로 차이 영역을 표시한 이미지를 저장합니다.
+        compare_page가 보관한 배열이 있으면 다시 렌더링하지 않습니다.
         """
-        self._open_docs()
-
-        img_ref = self.page_to_image(self._ref_doc, page_num)
-        img_gen = self.page_to_image(self._gen_doc, page_num)
-        img_ref, img_gen = self._match_sizes(img_ref, img_gen)
-
-        arr_ref = np.array(img_ref, dtype=np.float32)
-        arr_gen = np.array(img_gen, dtype=np.float32)
-        diff = np.abs(arr_ref - arr_gen)
+        entry = self._diff_buffer.pop(page_num)
+        if entry is not None:
+            arr_ref, mask = entry
+        else:
+            self._open_docs()
+            img_ref = self.reference_image(page_num)
+            img_gen = self.page_to_image(self._gen_doc, gen_page or page_num)
+            img_ref, img_gen = self._match_sizes(img_ref, img_gen)
+            arr_ref = np.asarray(img_ref)
+            mask = self.diff_mask(img_ref, img_gen)
 
         # 참조 이미지를 RGB로 변환하고 차이 부분을 빨간색으로 표시
         rgb_ref = np.stack([arr_ref] * 3, axis=-1).astype(np.uint8)
 
-        mask = diff > 10
         rgb_ref[mask, 0] = 255  # R
         rgb_ref[mask, 1] = 0    # G
         rgb_ref[mask, 2] = 0    # B
@@ -247,10 +588,18 @@ class PdfComparator:
 
         - report.json: 상세 비교 결과
         - summary.txt: 요약
-        - diff_page_N.png: 차이점 이미지 (SSIM < 0.95인 페이지만)
+        - diff_page_N.png: 차이점 이미지 (SSIM < DIFF_IMAGE_SSIM인 페이지만)
         """
         os.makedirs(output_dir, exist_ok=True)
 
+        # 텍스트 불일치 페이지의 diff (report.json에는 원문 제외)
+        text_diff_count = 0
+        for p in result.get("pages", []):
+            if "ref_text" in p:
+                self.write_text_diff(p, os.path.join(
+                    output_dir, f"text_diff_page_{p['page']:03d}.txt"))
+                text_diff_count += 1
+
         # report.json (텍스트 필드 제외)
         report_data = dict(result)
         for p in report_data.get("pages", []):
@@ -272,30 +621,55 @@ class PdfComparator:
             f.write(f"참조 페이지 수: {result['reference_pages']}\n")
             f.write(f"생성 페이지 수: {result['generated_pages']}\n")
             f.write(f"페이지 수 일치: {'예' if result['page_count_match'] else '아니오'}\n")
-            f.write(f"비교한 페이지 수: {result['compared_pages']}\n\n")
+            f.write(f"비교한 페이지 수: {result['compared_pages']}\n")
+            alignment = result.get("alignment")
+            if alignment:
+                f.write(f"삭제된 참조 페이지: {alignment['deleted_pages'] or '없음'}\n")
+                f.write(f"삽입된 생성 페이지: {alignment['inserted_pages'] or '없음'}\n")
+            f.write("\n")
             f.write(f"전체 SSIM 평균: {result['overall_ssim']:.4f}\n")
             f.write(f"전체 텍스트 일치도: {result['overall_text_match']:.4f}\n")
+            if result["text_bound_pages"]:
+                f.write(f"텍스트 상한 판정 페이지 (일치도 평균 제외): "
+                        f"{result['text_bound_pages']}\n")
             f.write(f"PASS 기준: {result['threshold']}\n")
-            f.write(f"결과: {'PASS' if result['pass'] else 'FAIL'}\n\n")
+            f.write(f"결과: {'PASS' if result['pass'] else 'FAIL'}\n")
+            if result.get("coarse_dpi"):
+                f.write(f"저해상도({result['coarse_dpi']} DPI) 조기 통과: "
+                        f"{result['coarse_accepted']}/{result['compared_pages']} 페이지\n")
+            f.write("\n")
 
             f.write("-" * 60 + "\n")
             f.write(f"{'페이지':>6} | {'SSIM':>8} | {'픽셀차이%':>8} | {'텍스트일치':>8} | {'텍스트유사도':>10}\n")
             f.write("-" * 60 + "\n")
             for p in result["pages"]:
+                label = str(p["page"])
+                if "generated_page" in p:
+                    label += f"→{p['generated_page']}"
                 f.write(
-                    f"{p['page']:>6} | {p['ssim']:>8.4f} | {p['pixel_diff_percent']:>8.2f} | "
+                    f"{label:>6} | {p['ssim']:>8.4f} | {p['pixel_diff_percent']:>8.2f} | "
                     f"{'일치' if p['text_match'] else '불일치':>8} | {p['text_similarity']:>10.4f}\n"
                 )
             f.write("-" * 60 + "\n")
 
-        # 차이점 이미지 생성 (SSIM < 0.95인 페이지)
-        self._open_docs()
+            # 타일 히트맵 (바뀐 타일이 있는 페이지)
+            heat_pages = [p for p in result["pages"] if p.get("tile_heatmap")]
+            if heat_pages:
+                f.write(f"\n타일 히트맵 ({result['tile_size']}px 타일, "
+                        f"'.' = 동일, 9 = SSIM 0.9 이상 ... 0 = 0.1 미만)\n")
+                for p in heat_pages:
+                    f.write(f"\n페이지 {p['page']} (변경 타일 {p['changed_tiles']}개, "
+                            f"{p['decided_dpi']} DPI)\n")
+                    for row in p["tile_heatmap"]:
+                        f.write("  " + "".join(_heat_char(v) for v in row) + "\n")
+
+        # 차이점 이미지 생성 (SSIM < DIFF_IMAGE_SSIM인 페이지)
         diff_count = 0
         for p in result["pages"]:
-            if p["ssim"] < 0.95:
+            if p["ssim"] < DIFF_IMAGE_SSIM:
                 diff_path = os.path.join(output_dir, f"diff_page_{p['page']:03d}.png")
                 try:
-                    self.generate_diff_image(p["page"], diff_path)
+                    self.generate_diff_image(p["page"], diff_path, p.get("generated_page"))
                     diff_count += 1
                 except Exception as e:
                     print(f"  경고: 페이지 {p['page']} diff 이미지 생성 실패: {e}")
@@ -304,6 +678,21 @@ class PdfComparator:
         print(f"  - report.json, summary.txt")
         if diff_count > 0:
             print(f"  - diff 이미지 {diff_count}개")
+        if text_diff_count > 0:
+            print(f"  - 텍스트 diff {text_diff_count}개")
+
+    def write_text_diff(self, page_result, output_path):
+        """텍스트 불일치 페이지의 줄 단위 unified diff 저장"""
+        diff = difflib.unified_diff(
+            page_result["ref_text"].splitlines(),
+            page_result["gen_text"].splitlines(),
+            fromfile=f"reference p{page_result['page']}",
+            tofile=f"generated p{page_result['page']}",
+            lineterm="",
+        )
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(diff) + "\n")
+        return output_path
 
 
 def parse_pages(pages_str):
@@ -320,6 +709,7 @@ def parse_pages(pages_str):
 def main():
     """CLI 인터페이스"""
     import argparse
+    from src.raster_cache import RasterCache
 
     parser = argparse.ArgumentParser(description="PDF 비교 검증")
     parser.add_argument("reference", help="참조 PDF 경로")
@@ -328,24 +718,60 @@ def main():
     parser.add_argument("--dpi", type=int, default=150, help="비교 해상도 (기본: 150)")
     parser.add_argument("--threshold", type=float, default=0.90, help="PASS 기준 SSIM (기본: 0.90)")
     parser.add_argument("--pages", help="비교할 페이지 범위 (예: 1-5)")
+    parser.add_argument("--workers", "-j", type=int, default=1,
+                        help="병렬 비교 프로세스 수 (기본: 1, 0이면 CPU 코어 수)")
+    parser.add_argument("--coarse-dpi", type=int, default=None,
+                        help="1차 저해상도 비교 DPI (기본: 사용 안 함, 예: 50)")
+    parser.add_argument("--accept-ssim", type=float, default=DEFAULT_ACCEPT_SSIM,
+                        help=f"저해상도 조기 통과 SSIM (기본: {DEFAULT_ACCEPT_SSIM})")
+    parser.add_argument("--tile-size", type=int, default=ssim_kernels.TILE_SIZE,
+                        help=f"변경 타일 검출 타일 크기 px (기본: {ssim_kernels.TILE_SIZE}, 0이면 페이지 전체 SSIM)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="참조 PDF 래스터 캐시 사용 안 함")
+    parser.add_argument("--stream", action="store_true",
+                        help=f"페이지 결과를 {STREAM_NAME}에 즉시 기록")
+    parser.add_argument("--resume", action="store_true",
+                        help=f"기존 {STREAM_NAME}에서 끝난 페이지를 건너뛰고 이어서 비교 (--stream 포함)")
     args = parser.parse_args()
 
     pages = parse_pages(args.pages)
+    workers = args.workers or os.cpu_count() or 1
 
     print(f"PDF 비교 시작")
     print(f"  참조: {args.reference}")
     print(f"  생성: {args.generated}")
     if pages:
         print(f"  페이지: {pages[0]}~{pages[1]}")
+    if workers > 1:
+        print(f"  워커: {workers}")
     print()
 
-    comparator = PdfComparator(args.reference, args.generated, dpi=args.dpi)
-    result = comparator.compare(output_dir=args.output, pages=pages, threshold=args.threshold)
+    raster_cache = None if args.no_cache else RasterCache()
+    comparator = PdfComparator(args.reference, args.generated, dpi=args.dpi,
+                               raster_cache=raster_cache,
+                               coarse_dpi=args.coarse_dpi or None,
+                               accept_ssim=args.accept_ssim,
+                               tile_size=args.tile_size or None)
+    try:
+        result = comparator.compare(output_dir=args.output, pages=pages,
+                                    threshold=args.threshold, workers=workers,
+                                    stream=args.stream, resume=args.resume)
+    except KeyboardInterrupt:
+        print("\n중단됨.")
+        if args.stream or args.resume:
+            print(f"  --resume으로 다시 실행하면 {os.path.join(args.output, STREAM_NAME)}에서 이어서 비교합니다.")
+        sys.exit(130)
 
     print()
     print(f"전체 SSIM: {result['overall_ssim']:.4f}")
     print(f"전체 텍스트 일치도: {result['overall_text_match']:.4f}")
+    if result["text_bound_pages"]:
+        print(f"텍스트 상한 판정 페이지 (일치도 평균 제외): {result['text_bound_pages']}")
     print(f"결과: {'PASS' if result['pass'] else 'FAIL'} (기준: {args.threshold})")
+    if result["coarse_dpi"]:
+        print(f"저해상도 조기 통과: {result['coarse_accepted']}/{result['compared_pages']} 페이지")
+    if raster_cache is not None and workers <= 1:
+        print(f"래스터 캐시: hit {raster_cache.hits}, miss {raster_cache.misses}")
 
 
 if __name__ == "__main__":
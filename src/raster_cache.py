@@ -0,0 +1,104 @@
+"""참조 PDF 래스터 캐시 — 렌더링한 그레이스케일 페이지 배열의 디스크 캐시.
+
+검증 실행마다 pdf_compare는 참조 PDF를 다시 렌더링하지만, 참조 PDF는
+실행 간에 바뀌지 않는다. 렌더링 결과(uint8 2차원 배열)를 .npy 파일로
+보관하고 읽을 때는 메모리 매핑하여, 같은 참조로 반복 비교할 때는 생성
+PDF 쪽만 렌더링하도록 한다.
+
+키: (PDF SHA-256, 페이지, DPI, 회전)
+  - 회전: page_to_image의 auto_rotate 여부 (landscape → portrait 회전 적용)
+
+캐시 디렉토리의 총 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은
+파일부터 삭제한다 (LRU — 읽을 때마다 mtime 갱신). 여러 워커 프로세스가
+같은 디렉토리를 써도 되도록 임시 파일에 쓴 뒤 교체한다.
+
+Usage:
+    from src.raster_cache import RasterCache
+    cache = RasterCache()                 # HWPX_CACHE_DIR/raster 또는 ~/.cache/hwpx_automation/raster
+    arr = cache.get(sha, 1, 150, True)    # 없으면 None
+    cache.put(sha, 1, 150, True, arr)
+"""
+
+import os
+from pathlib import Path
+
+import numpy as np
+
+from src.file_utils import default_cache_dir
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+CACHE_SUFFIX = '.npy'
+
+
+class RasterCache:
+    """페이지 래스터(.npy)의 크기 제한 LRU 디스크 캐시."""
+
+    def __init__(self, root=None, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+            root: 캐시 디렉토리 (None이면 default_cache_dir()/raster)
+            max_bytes: 캐시 파일 총 크기 상한 (바이트)
+        """
+        self.root = Path(root) if root is not None else default_cache_dir() / 'raster'
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, pdf_sha, page_num, dpi, rotate):
+        return self.root / f"{pdf_sha}_p{page_num:04d}_d{dpi}_r{int(bool(rotate))}{CACHE_SUFFIX}"
+
+    def get(self, pdf_sha, page_num, dpi, rotate):
+        """캐시된 페이지 배열 (읽기 전용 메모리 맵). 없거나 손상되면 None."""
+        path = self._path(pdf_sha, page_num, dpi, rotate)
+        try:
+            arr = np.load(path, mmap_mode='r', allow_pickle=False)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)  # LRU: 최근 사용 시각 갱신
+        except OSError:
+            pass
+        self.hits += 1
+        return arr
+
+    def put(self, pdf_sha, page_num, dpi, rotate, arr):
+        """페이지 배열을 저장한다 (쓰기 실패는 무시)."""
+        path = self._path(pdf_sha, page_num, dpi, rotate)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                np.save(f, np.ascontiguousarray(arr, dtype=np.uint8), allow_pickle=False)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+        self.evict()
+
+    def evict(self):
+        """총 크기가 max_bytes 이하가 될 때까지 오래된 항목을 삭제한다.
+
+        Returns:
+            int: 삭제한 파일 수
+        """
+        try:
+            entries = [(e.stat().st_mtime, e.stat().st_size, e.path)
+                       for e in os.scandir(self.root)
+                       if e.is_file() and e.name.endswith(CACHE_SUFFIX)]
+        except OSError:
+            return 0
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
@@ -16,7 +16,7 @@ from pathlib import Path
 
 from src.md_parser import (
     parse_markdown, parse_table, strip_markdown,
-    extract_section_blocks, get_all_sections, detect_section,
+    extract_section_blocks, detect_section, ParsedDocument,
     BLOCK_HEADER, BLOCK_PARAGRAPH, BLOCK_TABLE, BLOCK_LIST,
     BLOCK_BLOCKQUOTE, BLOCK_CODE,
 )
@@ -25,17 +25,21 @@ from src.md_parser import (
 class SectionMapper:
     """MD 콘텐츠를 양식 위치에 매핑하는 매퍼."""
 
-    def __init__(self, config_path, blocks):
+    def __init__(self, config_path, blocks, estimator=None):
         """
         Args:
             config_path: form_content_map.json 경로
-            blocks: parse_markdown() 결과
+            blocks: parse_markdown() 결과 또는 ParsedDocument
+            estimator: page_estimator.LayoutEstimator (줄/페이지 예산 판정용, 선택)
         """
         with open(config_path, 'r', encoding='utf-8') as f:
             self.config = json.load(f)
 
-        self.blocks = blocks
-        self._sections = get_all_sections(blocks)
+        if not isinstance(blocks, ParsedDocument):
+            blocks = ParsedDocument(blocks)
+        self.doc = blocks
+        self.blocks = blocks.blocks
+        self.estimator = estimator
 
     def get_cover_data(self):
         """표지(T0)에 채울 데이터를 반환한다.
@@ -53,7 +57,7 @@ class SectionMapper:
         Returns:
             dict: {field_name: summarized_text}
         """
-        summary_blocks = self._sections.get('summary', [])
+        summary_blocks = self.doc.section_blocks('summary')
         if not summary_blocks:
             return {}
 
@@ -126,7 +130,7 @@ class SectionMapper:
         Returns:
             list[dict]: 블록 리스트
         """
-        return self._sections.get(section_id, [])
+        return self.doc.section_blocks(section_id)
 
     def get_narrative_config(self):
         """서술 섹션 설정을 반환한다.
@@ -227,3 +231,31 @@ class SectionMapper:
         if len(text) <= max_chars:
             return text
         return text[:max_chars - 3] + '...'
+
+    def check_page_budgets(self, section_ops):
+        """서술 섹션 오퍼레이션의 예상 페이지 수를 max_pages와 비교한다.
+
+        Args:
+            section_ops: {section_id(md_section): ops}
+
+        Returns:
+            list[dict]: [{section_id, marker, pages, max_pages, over}, ...]
+                (estimator가 없으면 빈 리스트)
+        """
+        if self.estimator is None:
+            return []
+        report = []
+        for ns in self.get_narrative_config():
+            ops = section_ops.get(ns['md_section'])
+            if ops is None:
+                continue
+            pages = self.estimator.estimate_ops(ops)['pages']
+            max_pages = ns.get('max_pages')
+            report.append({
+                'section_id': ns['md_section'],
+                'marker': ns['marker'],
+                'pages': pages,
+                'max_pages': max_pages,
+                'over': max_pages is not None and pages > max_pages,
+            })
+        return report
@@ -0,0 +1,186 @@
+"""NumPy SSIM / 픽셀 차이 커널 — pdf_compare용 float32 구현.
+
+skimage.metrics.structural_similarity(full=True)는 float64 SSIM 맵 전체를
+만든 뒤 평균만 쓰고, 픽셀 차이 계산은 같은 이미지를 다시 float32로
+변환한다. 이 모듈은:
+
+  - 입력을 float32로 한 번만 변환하고 SSIM과 차이 마스크를 같은
+    버퍼에서 계산한다.
+  - 7x7 균일 창(box filter)을 가로/세로 분리 합산으로 계산하며, 경계를
+    잘라내는 skimage의 평균과 같도록 'valid' 영역만 계산한다 (패딩 없음).
+  - SSIM 맵은 full=True일 때만 반환한다.
+  - (N, H, W) 스택을 한 번에 처리한다 (ssim_batch — 같은 크기의 타일/페이지).
+  - tiled_ssim은 페이지를 타일로 나눠 픽셀이 다른 타일만 SSIM을 계산한다.
+    두 창이 같으면 SSIM이 정확히 1이므로, 바뀐 타일(창이 걸치는 경계
+    win_size - 1 픽셀 포함)의 합에 나머지 창 수를 더하면 전체 페이지 SSIM과
+    같은 값이 된다. 타일별 평균 SSIM은 히트맵으로 반환한다.
+
+수식은 skimage 기본값(win_size=7, K1=0.01, K2=0.03, 표본 공분산)과 같다.
+
+Usage:
+    from src.ssim_kernels import compare_arrays, ssim
+    score, mask = compare_arrays(arr_ref, arr_gen)   # uint8 2차원 배열
+"""
+
+import numpy as np
+
+WIN_SIZE = 7
+K1 = 0.01
+K2 = 0.03
+DATA_RANGE = 255.0
+PIXEL_DIFF_LEVEL = 10
+TILE_SIZE = 128
+
+
+def _box_sum(a, win):
+    """마지막 두 축에 대한 win x win 창 합 ('valid' 영역)."""
+    h = a.shape[-2] - win + 1
+    w = a.shape[-1] - win + 1
+    rows = a[..., :, 0:w].copy()
+    for k in range(1, win):
+        rows += a[..., :, k:k + w]
+    out = rows[..., 0:h, :].copy()
+    for k in range(1, win):
+        out += rows[..., k:k + h, :]
+    return out
+
+
+def _ssim_map(x, y, win_size=WIN_SIZE, data_range=DATA_RANGE):
+    """float32 배열(..., H, W)의 SSIM 맵 ('valid' 영역)."""
+    if x.shape[-1] < win_size or x.shape[-2] < win_size:
+        raise ValueError(f"image smaller than SSIM window ({win_size}x{win_size})")
+    n = win_size * win_size
+    inv_n = np.float32(1.0 / n)
+    cov_norm = np.float32(n / (n - 1))  # 표본 공분산
+
+    ux = _box_sum(x, win_size) * inv_n
+    uy = _box_sum(y, win_size) * inv_n
+    vx = (_box_sum(x * x, win_size) * inv_n - ux * ux) * cov_norm
+    vy = (_box_sum(y * y, win_size) * inv_n - uy * uy) * cov_norm
+    vxy = (_box_sum(x * y, win_size) * inv_n - ux * uy) * cov_norm
+
+    c1 = np.float32((K1 * data_range) ** 2)
+    c2 = np.float32((K2 * data_range) ** 2)
+    numerator = (2 * ux * uy + c1) * (2 * vxy + c2)
+    denominator = (ux * ux + uy * uy + c1) * (vx + vy + c2)
+    return numerator / denominator
+
+
+def to_float32(arr):
+    """uint8/PIL 이미지 → float32 배열 (이미 float32면 복사하지 않음)."""
+    return np.asarray(arr, dtype=np.float32)
+
+
+def ssim(x, y, full=False, win_size=WIN_SIZE, data_range=DATA_RANGE):
+    """두 그레이스케일 이미지의 평균 SSIM.
+
+    Args:
+        x, y: 같은 크기의 2차원 배열 (또는 PIL 이미지)
+        full: True면 (평균, SSIM 맵)을 반환 (맵은 경계 win_size//2 제외)
+
+    Returns:
+        float 또는 (float, np.ndarray)
+    """
+    s_map = _ssim_map(to_float32(x), to_float32(y), win_size, data_range)
+    score = float(s_map.mean(dtype=np.float64))
+    return (score, s_map) if full else score
+
+
+def ssim_batch(xs, ys, win_size=WIN_SIZE, data_range=DATA_RANGE):
+    """같은 크기 이미지 스택 (N, H, W)의 이미지별 평균 SSIM.
+
+    Returns:
+        np.ndarray: (N,) float64
+    """
+    s_map = _ssim_map(to_float32(xs), to_float32(ys), win_size, data_range)
+    return s_map.reshape(s_map.shape[0], -1).mean(axis=1, dtype=np.float64)
+
+
+def _tile_bounds(map_len, tile, win_size):
+    """SSIM 맵 축 길이 → 타일별 (맵 시작, 픽셀 끝) 배열."""
+    starts = np.arange(0, map_len, tile)
+    ends = np.minimum(starts + tile, map_len) + win_size - 1
+    return starts, ends
+
+
+def tiled_ssim(x, y, tile=TILE_SIZE, win_size=WIN_SIZE, data_range=DATA_RANGE):
+    """픽셀이 다른 타일만 계산한 평균 SSIM과 타일 히트맵.
+
+    Args:
+        x, y: 같은 크기의 2차원 uint8 배열
+        tile: 타일 한 변 (SSIM 맵 좌표 기준 픽셀)
+
+    Returns:
+        tuple: (평균 SSIM, 타일별 평균 SSIM 배열 (rows, cols), 바뀐 타일 수)
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    map_h = x.shape[0] - win_size + 1
+    map_w = x.shape[1] - win_size + 1
+    if map_h <= 0 or map_w <= 0:
+        raise ValueError(f"image smaller than SSIM window ({win_size}x{win_size})")
+
+    # 타일 영역(창이 걸치는 픽셀 포함)에 다른 픽셀이 있는지: 적분 영상으로 판정
+    neq = np.zeros((x.shape[0] + 1, x.shape[1] + 1), dtype=np.int32)
+    np.cumsum(np.cumsum(x != y, axis=0, dtype=np.int32), axis=1, out=neq[1:, 1:])
+    r0, r1 = _tile_bounds(map_h, tile, win_size)
+    c0, c1 = _tile_bounds(map_w, tile, win_size)
+    counts = (neq[np.ix_(r1, c1)] - neq[np.ix_(r0, c1)]
+              - neq[np.ix_(r1, c0)] + neq[np.ix_(r0, c0)])
+    dirty = list(zip(*np.nonzero(counts)))
+
+    heatmap = np.ones(counts.shape, dtype=np.float64)
+    total = map_h * map_w
+    ssim_sum = float(total)
+    full_shape = (tile + win_size - 1, tile + win_size - 1)
+    stack, stack_keys = [], []
+    for r, c in dirty:
+        region = (slice(r0[r], r1[r]), slice(c0[c], c1[c]))
+        xs, ys = x[region], y[region]
+        if xs.shape == full_shape:
+            stack.append((xs, ys))
+            stack_keys.append((r, c))
+            continue
+        s_map = _ssim_map(to_float32(xs), to_float32(ys), win_size, data_range)
+        tile_sum = float(s_map.sum(dtype=np.float64))
+        ssim_sum += tile_sum - s_map.size
+        heatmap[r, c] = tile_sum / s_map.size
+    if stack:
+        xs = to_float32(np.stack([s[0] for s in stack]))
+        ys = to_float32(np.stack([s[1] for s in stack]))
+        sums = _ssim_map(xs, ys, win_size, data_range).reshape(len(stack), -1).sum(
+            axis=1, dtype=np.float64)
+        n = tile * tile
+        for (r, c), tile_sum in zip(stack_keys, sums):
+            ssim_sum += float(tile_sum) - n
+            heatmap[r, c] = float(tile_sum) / n
+    return ssim_sum / total, heatmap, len(dirty)
+
+
+def diff_mask(x, y, level=PIXEL_DIFF_LEVEL):
+    """픽셀 값 차이가 level보다 큰 위치의 bool 배열."""
+    return np.abs(to_float32(x) - to_float32(y)) > level
+
+
+def diff_percent(mask):
+    """차이 마스크의 비율 (0.0% ~ 100.0%)."""
+    return float(np.count_nonzero(mask) / mask.size * 100)
+
+
+def compare_arrays(x, y, win_size=WIN_SIZE, data_range=DATA_RANGE, level=PIXEL_DIFF_LEVEL):
+    """float32 변환 한 번으로 (평균 SSIM, 차이 마스크)를 계산한다."""
+    xf = to_float32(x)
+    yf = to_float32(y)
+    score = float(_ssim_map(xf, yf, win_size, data_range).mean(dtype=np.float64))
+    return score, np.abs(xf - yf) > level
+
+
+def compare_arrays_tiled(x, y, tile=TILE_SIZE, win_size=WIN_SIZE,
+                         data_range=DATA_RANGE, level=PIXEL_DIFF_LEVEL):
+    """타일 단위로 (평균 SSIM, 차이 마스크, 히트맵, 바뀐 타일 수)를 계산한다.
+
+    x, y는 uint8 배열이어야 한다 (차이 마스크를 int16 차로 계산).
+    """
+    score, heatmap, changed = tiled_ssim(x, y, tile, win_size, data_range)
+    mask = np.abs(np.asarray(x, dtype=np.int16) - np.asarray(y, dtype=np.int16)) > level
+    return score, mask, heatmap, changed
@@ -0,0 +1,142 @@
+"""템플릿 지문(fingerprint) 레지스트리 — HWPX 내용 해시별 분석 결과 보관.
+
+extract_template.generate_template_config는 실행할 때마다 HWPX를 다시
+분석한다. 레지스트리는 템플릿 HWPX의 SHA-256을 키로 분석 결과(설정 초안, 표 목록,
+스타일 요약)를 보관하여 템플릿 바이트가 바뀐 경우에만 다시 분석한다.
+
+  - 항목: <root>/<SHA-256>.json (사람이 읽을 수 있는 JSON)
+  - 색인: <root>/index.json — 경로별 (크기, mtime_ns, SHA-256). 크기와
+    수정 시각이 같으면 해시 계산을 생략한다.
+  - REGISTRY_VERSION이 다른 항목은 다시 분석한다.
+
+여러 템플릿을 다루는 서비스는 entries()로 등록된 분석 결과를 미리 읽어
+시작할 수 있다. 항목은 임시 파일에 쓴 뒤 교체하므로 여러 프로세스가 같은
+디렉토리를 써도 된다.
+
+Usage:
+    from src.template_registry import TemplateRegistry
+    registry = TemplateRegistry()          # HWPX_CACHE_DIR/templates 또는 ~/.cache/hwpx_automation/templates
+    entry, regenerated = registry.ensure('ref/새양식.hwpx')
+    entry['template_config'], entry['tables'], entry['styles']
+"""
+
+import json
+import os
+from pathlib import Path
+
+from src.extract_template import ExtractedDocument, analyze_template
+from src.file_utils import default_cache_dir, file_sha256
+
+REGISTRY_VERSION = 1
+INDEX_NAME = 'index.json'
+
+
+def _write_json(path, value):
+    """임시 파일에 쓴 뒤 교체한다 (쓰기 실패는 무시)."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(value, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+    except OSError:
+        return
+
+
+def _source_path(source):
+    """HWPX 경로 또는 ExtractedDocument → 절대 경로."""
+    if isinstance(source, ExtractedDocument):
+        source = source.path
+    return os.path.abspath(str(source))
+
+
+def _read_json(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+class TemplateRegistry:
+    """템플릿 SHA-256 → 분석 결과 디스크 레지스트리."""
+
+    def __init__(self, root=None):
+        """
+        Args:
+            root: 레지스트리 디렉토리 (None이면 default_cache_dir()/templates)
+        """
+        self.root = Path(root) if root is not None else default_cache_dir() / 'templates'
+        self._index = None
+        self._entries = {}
+
+    def _entry_path(self, sha):
+        return self.root / f"{sha}.json"
+
+    def _load_index(self):
+        if self._index is None:
+            index = _read_json(self.root / INDEX_NAME)
+            self._index = index if isinstance(index, dict) else {}
+        return self._index
+
+    def fingerprint(self, hwpx_path):
+        """템플릿 파일의 SHA-256 (크기와 수정 시각이 색인과 같으면 해시 생략)."""
+        path = _source_path(hwpx_path)
+        st = os.stat(path)
+        index = self._load_index()
+        known = index.get(path)
+        if known and known.get('size') == st.st_size and known.get('mtime_ns') == st.st_mtime_ns:
+            return known['sha256']
+        sha = file_sha256(path)
+        index[path] = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'sha256': sha}
+        _write_json(self.root / INDEX_NAME, index)
+        return sha
+
+    def get(self, hwpx_path):
+        """템플릿의 현재 내용에 해당하는 항목 (없으면 None)."""
+        return self.lookup(self.fingerprint(hwpx_path))
+
+    def lookup(self, sha):
+        """SHA-256으로 항목을 찾는다 (없거나 버전이 다르면 None)."""
+        entry = self._entries.get(sha)
+        if entry is None:
+            entry = _read_json(self._entry_path(sha))
+            if not entry or entry.get('version') != REGISTRY_VERSION:
+                return None
+            self._entries[sha] = entry
+        return entry
+
+    def ensure(self, hwpx_path):
+        """항목을 반환하고, 없으면 템플릿을 분석하여 등록한다.
+
+        Returns:
+            tuple: (항목 dict, 새로 분석했는지 여부)
+        """
+        sha = self.fingerprint(hwpx_path)
+        entry = self.lookup(sha)
+        if entry is not None:
+            return entry, False
+
+        entry = analyze_template(hwpx_path)
+        entry['template_config']['source_sha256'] = sha
+        entry.update({
+            'version': REGISTRY_VERSION,
+            'sha256': sha,
+            'source_path': _source_path(hwpx_path),
+        })
+        _write_json(self._entry_path(sha), entry)
+        self._entries[sha] = entry
+        return entry, True
+
+    def entries(self):
+        """등록된 모든 항목 (서비스 시작 시 미리 읽기용)."""
+        if not self.root.is_dir():
+            return []
+        result = []
+        for path in sorted(self.root.glob('*.json')):
+            if path.name == INDEX_NAME:
+                continue
+            entry = self.lookup(path.stem)
+            if entry is not None:
+                result.append(entry)
+        return result
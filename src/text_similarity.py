@@ -0,0 +1,100 @@
+"""단계별 텍스트 유사도 — pdf_compare의 페이지 텍스트 비교용.
+
+difflib.SequenceMatcher(None, a, b).ratio()는 긴 페이지 텍스트(특히
+공백이 적은 한글)에서 거의 제곱 시간이 걸린다. 다음 순서로 가장 싼
+단계에서 결론을 낸다:
+
+  1. exact: 두 텍스트가 같으면 1.0
+  2. bound (bound_below를 준 경우만): 문자 다중집합 교집합으로 구한 상한
+     (difflib.quick_ratio와 같은 값, O(n)). 상한이 bound_below 미만이면
+     정렬 없이 상한을 반환한다. 실제 유사도가 아니라 상한이므로 통과/실패
+     판정만 필요한 호출자용이며, 평균 등 집계에는 쓰지 않는다.
+  3. align: 줄 단위로 정렬한 뒤, 바뀐 줄 구간에서만 문자 단위로 정렬해
+     일치 문자 수를 합산한다. 구간이 CHAR_ALIGN_LIMIT자를 넘으면 구간 안의
+     줄을 순서대로 짝지어 줄끼리만 문자 정렬하고, 한 줄이 그보다 길면 문자
+     다중집합 교집합으로 대신한다. 비용이 바뀐 부분의 크기에 비례하며 한
+     번의 문자 정렬은 CHAR_ALIGN_LIMIT자 이하로 제한된다.
+
+결과 비율은 2 * 일치 문자 수 / (len(a) + len(b))로 SequenceMatcher와
+같은 정의를 따른다.
+
+Usage:
+    from src.text_similarity import text_similarity
+    ratio, stage = text_similarity(ref_text, gen_text)
+"""
+
+import difflib
+from collections import Counter
+
+STAGE_EXACT = "exact"
+STAGE_BOUND = "bound"
+STAGE_ALIGN = "align"
+
+# bound 단계 사용 시 권장 기준 (상한이 이 값 미만이면 정렬 생략)
+DEFAULT_BOUND_BELOW = 0.5
+
+# 한 번에 문자 단위로 정렬할 최대 글자 수 (두 텍스트 합)
+CHAR_ALIGN_LIMIT = 600
+
+
+def _common_chars(a, b):
+    return sum((Counter(a) & Counter(b)).values())
+
+
+def similarity_bound(a, b):
+    """문자 다중집합 기반 유사도 상한 (0.0 ~ 1.0)."""
+    total = len(a) + len(b)
+    if not total:
+        return 1.0
+    return 2.0 * _common_chars(a, b) / total
+
+
+def _char_matches(a, b):
+    """문자 단위 일치 수 (CHAR_ALIGN_LIMIT 초과면 다중집합 교집합으로 근사)."""
+    if len(a) + len(b) > CHAR_ALIGN_LIMIT:
+        return _common_chars(a, b)
+    # autojunk=True면 200자 이상에서 자주 나오는 한글 글자가 무시됨
+    matcher = difflib.SequenceMatcher(None, a, b, autojunk=False)
+    return sum(m.size for m in matcher.get_matching_blocks())
+
+
+def _matched_chars(a, b):
+    """줄 정렬 후 바뀐 구간만 문자 정렬하여 일치 문자 수를 센다."""
+    a_lines = a.splitlines(keepends=True)
+    b_lines = b.splitlines(keepends=True)
+    matcher = difflib.SequenceMatcher(None, a_lines, b_lines, autojunk=False)
+    matched = 0
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            matched += sum(len(line) for line in a_lines[i1:i2])
+        elif tag == "replace":
+            block_a = "".join(a_lines[i1:i2])
+            block_b = "".join(b_lines[j1:j2])
+            if len(block_a) + len(block_b) <= CHAR_ALIGN_LIMIT:
+                matched += _char_matches(block_a, block_b)
+            else:
+                # 큰 구간: 줄을 순서대로 짝지어 줄끼리만 정렬 (남는 줄은 불일치)
+                for line_a, line_b in zip(a_lines[i1:i2], b_lines[j1:j2]):
+                    matched += _char_matches(line_a, line_b)
+    return matched
+
+
+def text_similarity(a, b, bound_below=None):
+    """두 텍스트의 유사도와 결론을 낸 단계.
+
+    Args:
+        a, b: 비교할 텍스트
+        bound_below: 상한이 이 값 미만이면 정렬 없이 상한을 반환
+            (None이면 bound 단계 없이 항상 실제 유사도)
+
+    Returns:
+        tuple: (유사도 0.0 ~ 1.0, STAGE_EXACT | STAGE_BOUND | STAGE_ALIGN)
+            STAGE_BOUND의 값은 실제 유사도의 상한
+    """
+    if a == b:
+        return 1.0, STAGE_EXACT
+    if bound_below is not None:
+        bound = similarity_bound(a, b)
+        if bound < bound_below:
+            return bound, STAGE_BOUND
+    return 2.0 * _matched_chars(a, b) / (len(a) + len(b)), STAGE_ALIGN
@@ -0,0 +1,75 @@
+"""테스트용 합성 HWPX 빌더.
+
+section0.xml 본문과 header.xml 내용만 받아 mimetype(무압축) + Contents/
+파트로 된 최소 HWPX(ZIP)를 만든다. 실제 양식 파일(ref/) 없이 추출/감사/
+편집 동작을 확인하는 테스트가 함께 사용한다.
+"""
+
+import zipfile
+
+HP = 'http://www.hancom.co.kr/hwpml/2011/paragraph'
+HS = 'http://www.hancom.co.kr/hwpml/2011/section'
+HH = 'http://www.hancom.co.kr/hwpml/2011/head'
+DECL = '<?xml version="1.0" encoding="UTF-8" standalone="yes" ?>'
+
+# section0의 서식 참조(charPr/paraPr/style 0, borderFill 1)를 모두 정의한 header
+BASIC_HEADER = ('<hh:charPr id="0"/><hh:paraPr id="0"/><hh:style id="0"/>'
+                '<hh:borderFill id="1"/>')
+
+
+def write_hwpx(path, body, header=BASIC_HEADER, decl=DECL):
+    """hs:sec 본문(body)과 hh:head 내용(header)으로 HWPX 파일을 쓴다.
+
+    Returns:
+        str: path
+    """
+    section = f'{decl}<hs:sec xmlns:hs="{HS}" xmlns:hp="{HP}">{body}</hs:sec>'
+    head = f'{DECL}<hh:head xmlns:hh="{HH}">{header}</hh:head>'
+    with zipfile.ZipFile(path, 'w') as z:
+        z.writestr('mimetype', 'application/hwp+zip', compress_type=zipfile.ZIP_STORED)
+        z.writestr('Contents/section0.xml', section)
+        z.writestr('Contents/header.xml', head)
+    return str(path)
+
+
+def _para(text, inner=''):
+    return (f'<hp:p paraPrIDRef="1" styleIDRef="0"><hp:run charPrIDRef="0">'
+            f'{inner}<hp:t>{text}</hp:t></hp:run></hp:p>')
+
+
+def _table(rows, cols, texts=None):
+    texts = texts or {}
+    trs = []
+    for r in range(rows):
+        tcs = []
+        for c in range(cols):
+            tcs.append(
+                f'<hp:tc borderFillIDRef="1"><hp:subList><hp:p><hp:run>'
+                f'<hp:t>{texts.get((r, c), "")}</hp:t></hp:run></hp:p></hp:subList>'
+                f'<hp:cellAddr colAddr="{c}" rowAddr="{r}"/>'
+                f'<hp:cellSpan colSpan="1" rowSpan="1"/></hp:tc>')
+        trs.append('<hp:tr>' + ''.join(tcs) + '</hp:tr>')
+    return (f'<hp:tbl rowCnt="{rows}" colCnt="{cols}" borderFillIDRef="1">'
+            f'<hp:sz width="1000" height="500"/>' + ''.join(trs) + '</hp:tbl>')
+
+
+FORM_HEADER = ('<hh:fontface lang="HANGUL">'
+               '<hh:font id="0" face="함초롬바탕" type="TTF"/></hh:fontface>'
+               '<hh:charPr id="0" height="1000" textColor="#000000"><hh:bold/></hh:charPr>'
+               '<hh:paraPr id="1"><hh:align horizontal="LEFT" vertical="BASELINE"/></hh:paraPr>'
+               '<hh:style id="0" type="PARA" name="바탕글" paraPrIDRef="1" charPrIDRef="0"/>')
+
+
+def make_form_hwpx(path, extra_paras=0):
+    """커버 표 + 섹션/서브섹션/표/그림 단락이 있는 작은 양식 HWPX."""
+    paras = [
+        _para('', _table(3, 2, {(0, 0): '기업명', (1, 0): '대표자명'})),
+        _para('1. 솔루션 구축 개요'),
+        _para('1.1 개발 배경'),
+        _para('본문 내용'),
+        _para('[표 1]', _table(2, 2, {(0, 0): '항목'})),
+        _para('그림 설명', '<hp:pic/>'),
+        _para('2. 추진 계획'),
+    ]
+    paras += [_para(f'추가 단락 {i}') for i in range(extra_paras)]
+    return write_hwpx(path, ''.join(paras), header=FORM_HEADER)
@@ -0,0 +1,53 @@
+"""bridge 하트비트 워치독 단위 테스트 (로컬 Python 하위 프로세스 사용)."""
+
+import os
+import subprocess
+import sys
+import textwrap
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.bridge import _watch_process
+
+
+def _spawn(code):
+    return subprocess.Popen(
+        [sys.executable, '-c', textwrap.dedent(code)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+
+
+def test_completes_and_hides_heartbeats():
+    proc = _spawn('''
+        print("@@HB 0 open", flush=True)
+        print("Opened: 3 pages", flush=True)
+        print("OK", flush=True)
+    ''')
+    lines, stderr, reason = _watch_process(proc, stall_timeout=10, echo=False)
+    assert reason is None
+    assert lines == ['Opened: 3 pages', 'OK']
+
+
+def test_stall_kills_silent_process(capsys):
+    proc = _spawn('''
+        import time
+        print("@@HB 0 fill", flush=True)
+        time.sleep(30)
+        print("OK", flush=True)
+    ''')
+    lines, stderr, reason = _watch_process(proc, stall_timeout=0.5, echo=False)
+    assert reason == 'stall'
+    assert 'OK' not in lines
+    assert 'last: fill' in capsys.readouterr().err
+
+
+def test_heartbeat_grace_extends_deadline():
+    proc = _spawn('''
+        import time
+        print("@@HB 10 export_pdf", flush=True)
+        time.sleep(1.0)
+        print("OK", flush=True)
+    ''')
+    lines, stderr, reason = _watch_process(proc, stall_timeout=0.5, echo=False)
+    assert reason is None
+    assert lines == ['OK']
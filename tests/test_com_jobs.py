@@ -0,0 +1,173 @@
+"""com_jobs 작업 계획 실행기 단위 테스트 (가짜 HwpController 사용)."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.com_jobs import (
+    HEARTBEAT_PREFIX, STEP_GRACE, execute_ops, run_plan, validate_plan,
+)
+
+
+class FakeHAction:
+    def __init__(self, log):
+        self.log = log
+
+    def Run(self, name):
+        self.log.append(('Run', name))
+        return True
+
+    def GetDefault(self, name, pset):
+        return True
+
+    def Execute(self, name, pset):
+        return True
+
+
+class FakeCom:
+    def __init__(self, log):
+        self.HAction = FakeHAction(log)
+        self.HParameterSet = None  # 스타일 리셋은 예외로 건너뜀
+        self.log = log
+
+    def GetPos(self):
+        return (0, 0, 5)
+
+    def SetPos(self, *pos):
+        self.log.append(('SetPos', pos))
+
+
+class FakeController:
+    def __init__(self, markers=()):
+        self.log = []
+        self._hwp = FakeCom(self.log)
+        self.markers = set(markers)
+        self.doc = None
+
+    def open(self, path):
+        self.log.append(('open', path))
+        self.doc = path
+
+    def get_page_count(self):
+        return 3
+
+    def move_to_start(self):
+        self.log.append(('move_to_start',))
+
+    def find_text(self, text):
+        self.log.append(('find_text', text))
+        return text in self.markers
+
+    def find_and_replace_all(self, replacements):
+        self.log.append(('replace', dict(replacements)))
+
+    def insert_text(self, text):
+        self.log.append(('insert_text', text))
+
+    def insert_line_break(self):
+        self.log.append(('line_break',))
+
+    def set_char_shape(self, **kwargs):
+        self.log.append(('char', kwargs))
+
+    def set_para_shape(self, **kwargs):
+        self.log.append(('para', kwargs))
+
+    def insert_table(self, rows, cols):
+        raise RuntimeError('table failed')
+
+    def select_line(self):
+        self.log.append(('select_line',))
+
+    def delete_selection(self):
+        self.log.append(('delete_selection',))
+
+    def save_as(self, path, fmt):
+        self.log.append(('save_as', path, fmt))
+
+    def save_as_pdf(self, path):
+        self.log.append(('save_as_pdf', path))
+
+
+def test_validate_plan_rejects_unknown_step():
+    with pytest.raises(ValueError):
+        validate_plan([{'step': 'open', 'path': 'a'}, {'step': 'explode'}])
+
+
+def test_execute_ops_sole_paragraph_uses_para_selection():
+    hwp = FakeController()
+    ops = [
+        {'op': 'set_char_shape', 'font': '바탕', 'size': 10},
+        {'op': 'insert_text', 'text': '본문'},
+        {'op': 'line_break'},
+    ]
+    assert execute_ops(hwp, ops) == 0
+    runs = [e[1] for e in hwp.log if e[0] == 'Run']
+    assert runs == ['MoveParaBegin', 'MoveSelParaEnd', 'Cancel', 'MoveParaEnd']
+    assert ('char', {'font': '바탕', 'size': 10}) in hwp.log
+
+
+def test_execute_ops_inline_run_selects_left_and_counts_errors():
+    hwp = FakeController()
+    ops = [
+        {'op': 'set_char_shape', 'bold': True},
+        {'op': 'insert_text', 'text': 'ab'},
+        {'op': 'insert_text', 'text': 'cd'},
+        {'op': 'insert_table', 'rows': 2, 'cols': 2},
+    ]
+    assert execute_ops(hwp, ops) == 1
+    runs = [e[1] for e in hwp.log if e[0] == 'Run']
+    assert runs.count('MoveSelLeft') == 4
+    assert ('SetPos', (0, 0, 5)) in hwp.log
+
+
+def test_run_plan_single_session_order():
+    hwp = FakeController(markers={'##SEC1##'})
+    steps = [
+        {'step': 'open', 'path': 'C:\\in.hwpx'},
+        {'step': 'replace', 'replacements': {'{{A}}': 'x'}},
+        {'step': 'fill_markers', 'checkpoint': 'C:\\out.hwpx', 'sections': [
+            {'marker': '##SEC1##', 'ops': [{'op': 'insert_text', 'text': 't'}]},
+            {'marker': '##MISSING##', 'ops': [{'op': 'insert_text', 'text': 'u'}]},
+        ]},
+        {'step': 'delete_text', 'search_text': '작성요령'},
+        {'step': 'save_hwpx', 'path': 'C:\\out.hwpx'},
+        {'step': 'export_pdf', 'path': 'C:\\out.pdf'},
+    ]
+    run_plan(hwp, steps)
+
+    kinds = [e[0] for e in hwp.log]
+    assert kinds.count('open') == 1
+    assert ('insert_text', 't') in hwp.log
+    assert ('insert_text', 'u') not in hwp.log
+    # 찾은 섹션 1개만 중간 저장 + 명시적 저장 1회
+    assert kinds.count('save_as') == 2
+    assert 'delete_selection' not in kinds  # 작성요령 텍스트 없음
+    assert hwp.log[-1] == ('save_as_pdf', 'C:\\out.pdf')
+
+
+def test_run_plan_emits_heartbeats(capsys):
+    hwp = FakeController()
+    ops = [{'op': 'line_break'}] * 60
+    run_plan(hwp, [
+        {'step': 'open', 'path': 'C:\\in.hwpx'},
+        {'step': 'insert_ops', 'ops': ops},
+        {'step': 'export_pdf', 'path': 'C:\\out.pdf'},
+    ])
+    beats = [l for l in capsys.readouterr().out.splitlines()
+             if l.startswith(HEARTBEAT_PREFIX)]
+    assert beats[0] == f"{HEARTBEAT_PREFIX} {STEP_GRACE['open']} open"
+    assert f"{HEARTBEAT_PREFIX} 0 op 50/60" in beats
+    assert beats[-1].endswith(' export_pdf')
+
+
+def test_run_plan_insert_ops_failure_stops_before_save():
+    hwp = FakeController()
+    with pytest.raises(RuntimeError, match='1 ops failed'):
+        run_plan(hwp, [
+            {'step': 'insert_ops', 'ops': [{'op': 'insert_table', 'rows': 1, 'cols': 1}]},
+            {'step': 'save_hwpx', 'path': 'C:\\out.hwpx'},
+        ])
+    assert 'save_as' not in [e[0] for e in hwp.log]
@@ -0,0 +1,131 @@
+"""ComProfiler 단위 테스트 (COM 없이 가짜 컨트롤러로 검증)."""
+
+import json
+import os
+import sys
+import tempfile
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.com_profiler import ComProfiler, KIND_ACTION, KIND_COM, KIND_METHOD
+
+
+class FakeClock:
+    """호출마다 약 1ms(1/1024초, 부동소수점 오차 없음)씩 증가하는 시계."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 1 / 1024
+        return self.now
+
+
+class FakeHAction:
+    def __init__(self):
+        self.ran = []
+
+    def Run(self, name):
+        self.ran.append(name)
+        return True
+
+    def Execute(self, name, pset):
+        if name == 'Boom':
+            raise RuntimeError('boom')
+        return True
+
+
+class FakeHwp:
+    def __init__(self):
+        self.HAction = FakeHAction()
+        self.Visible = True
+
+    def GetPos(self):
+        return (0, 1, 2)
+
+
+class FakeController:
+    def __init__(self):
+        self._hwp = FakeHwp()
+
+    @property
+    def hwp(self):
+        return self._hwp
+
+    def move_to_start(self):
+        self._hwp.HAction.Run('MoveDocBegin')
+
+    def insert_line_break(self):
+        self._hwp.HAction.Run('BreakPara')
+
+
+@pytest.fixture
+def attached():
+    ctrl = FakeController()
+    prof = ComProfiler(clock=FakeClock())
+    prof.attach(ctrl)
+    return ctrl, prof
+
+
+def _find(entries, kind, name):
+    return [e for e in entries if e['kind'] == kind and e['name'] == name]
+
+
+def test_methods_and_actions_recorded(attached):
+    ctrl, prof = attached
+    ctrl.move_to_start()
+    ctrl.move_to_start()
+    ctrl.insert_line_break()
+
+    rep = prof.report()
+    method = _find(rep['by_name'], KIND_METHOD, 'move_to_start')
+    assert method and method[0]['count'] == 2
+    action = _find(rep['by_name'], KIND_ACTION, 'Run:MoveDocBegin')
+    assert action and action[0]['count'] == 2
+    assert _find(rep['by_name'], KIND_ACTION, 'Run:BreakPara')[0]['count'] == 1
+
+
+def test_raw_calls_through_proxy(attached):
+    ctrl, prof = attached
+    assert ctrl._hwp.GetPos() == (0, 1, 2)
+    ctrl._hwp.HAction.Run('MoveSelLeft')
+    # 속성 쓰기는 원본 COM 객체로 전달
+    ctrl._hwp.Visible = False
+    assert ctrl.hwp._target.Visible is False
+
+    rep = prof.report()
+    assert _find(rep['by_name'], KIND_COM, 'GetPos')[0]['count'] == 1
+    assert _find(rep['by_name'], KIND_ACTION, 'Run:MoveSelLeft')[0]['count'] == 1
+
+
+def test_sections_and_errors(attached):
+    ctrl, prof = attached
+    prof.section = '##SEC1##'
+    ctrl._hwp.HAction.Run('Delete')
+    prof.section = '##SEC2##'
+    with pytest.raises(RuntimeError):
+        ctrl._hwp.HAction.Execute('Boom', None)
+
+    rep = prof.report()
+    assert set(rep['by_section']) == {'##SEC1##', '##SEC2##'}
+    boom = _find(rep['calls'], KIND_ACTION, 'Execute:Boom')[0]
+    assert boom['section'] == '##SEC2##'
+    assert boom['errors'] == 1
+
+
+def test_histogram_and_json(attached):
+    ctrl, prof = attached
+    for _ in range(5):
+        ctrl.insert_line_break()
+
+    entry = _find(prof.report()['by_name'], KIND_ACTION, 'Run:BreakPara')[0]
+    assert sum(entry['histogram'].values()) == 5
+    assert entry['histogram']['<=1ms'] == 5
+
+    with tempfile.TemporaryDirectory() as d:
+        path = prof.write_json(os.path.join(d, 'profile.json'))
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+    assert data['by_name'][0]['total_ms'] >= data['by_name'][-1]['total_ms']
+    assert 'Run:BreakPara' in prof.summary_text()
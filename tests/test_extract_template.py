@@ -0,0 +1,64 @@
+"""extract_template 공유 문서 모델 단위 테스트."""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src import extract_template
+from src.extract_template import (
+    ExtractedDocument, extract_all_tables, extract_body_sections,
+    extract_styles, generate_template_config, iter_all_tables,
+    iter_top_paragraphs, stream_body_sections,
+)
+from tests.hwpx_builder import make_form_hwpx
+
+
+def test_document_parses_each_part_once(tmp_path, monkeypatch):
+    hwpx = make_form_hwpx(tmp_path / 'doc.hwpx')
+    calls = []
+    real_fromstring = extract_template.etree.fromstring
+    monkeypatch.setattr(extract_template.etree, 'fromstring',
+                        lambda data, parser=None: calls.append(1) or real_fromstring(data, parser))
+
+    doc = ExtractedDocument(hwpx)
+    structure = extract_template.extract_document_structure(doc)
+    styles = extract_styles(doc)
+    tables = extract_all_tables(doc)
+    result = generate_template_config(doc, tmp_path / 'out')
+
+    assert len(calls) == 2  # section0 + header
+    assert doc.top_paras is doc.top_paras
+    assert [s['title'] for s in structure['sections']] == ['1. 솔루션 구축 개요', '2. 추진 계획']
+    assert styles['styles'][0]['name'] == '바탕글'
+    assert [(t['rowCnt'], t['colCnt']) for t in tables] == [(3, 2), (2, 2)]
+    assert result['total_tables'] == 2
+    with open(result['template_json'], encoding='utf-8') as f:
+        assert json.load(f)['name'] == 'doc'
+
+
+def test_path_and_document_give_same_results(tmp_path):
+    hwpx = make_form_hwpx(tmp_path / 'doc.hwpx')
+    doc = ExtractedDocument(hwpx)
+    assert extract_body_sections(str(hwpx)) == extract_body_sections(doc)
+    assert extract_all_tables(str(hwpx)) == extract_all_tables(doc)
+    children = extract_body_sections(doc)[0]['children'][0]['children']
+    assert [c['type'] for c in children] == ['paragraph', 'table', 'picture']
+
+
+def test_streaming_matches_tree_extraction(tmp_path):
+    hwpx = make_form_hwpx(tmp_path / 'big.hwpx', extra_paras=50)
+    assert stream_body_sections(hwpx) == extract_body_sections(hwpx)
+    assert list(iter_all_tables(hwpx)) == extract_all_tables(hwpx)
+
+
+def test_streaming_clears_processed_paragraphs(tmp_path):
+    hwpx = make_form_hwpx(tmp_path / 'big.hwpx', extra_paras=50)
+    root = None
+    count = 0
+    for _, p in iter_top_paragraphs(hwpx):
+        root = p.getparent()
+        assert p.getprevious() is None  # 이전 단락은 이미 제거됨
+        count += 1
+    assert count == 57
+    assert len(root) == 0
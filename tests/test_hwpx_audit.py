@@ -0,0 +1,89 @@
+"""hwpx_audit 단일 순회 감사 엔진 단위 테스트."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src import hwpx_audit
+from src.hwpx_audit import AuditCheck, audit_files, audit_hwpx, register_check
+from tests.hwpx_builder import HP, write_hwpx
+
+CELL = ('<hp:tc borderFillIDRef="1"><hp:subList><hp:p paraPrIDRef="0" styleIDRef="0">'
+        '<hp:run charPrIDRef="0"><hp:t>{}</hp:t></hp:run></hp:p></hp:subList></hp:tc>')
+
+
+def _para(inner, attrs='paraPrIDRef="0" styleIDRef="0"'):
+    return f'<hp:p {attrs}>{inner}</hp:p>'
+
+
+CLEAN = _para('<hp:run charPrIDRef="0"><hp:tbl rowCnt="1" colCnt="2" borderFillIDRef="1">'
+              '<hp:tr>' + CELL.format('가') + CELL.format('##SEC1_CONTENT##') + '</hp:tr>'
+              '</hp:tbl></hp:run>')
+
+
+def test_clean_document_has_no_errors(tmp_path):
+    report = audit_hwpx(write_hwpx(tmp_path / 'ok.hwpx', CLEAN))
+    assert report['counts'] == {'error': 0, 'warning': 0, 'info': 0}
+
+
+def test_each_check_reports_its_defect(tmp_path):
+    body = (CLEAN
+            + _para('<hp:run charPrIDRef="99"><hp:t>x</hp:t></hp:run>')          # crossrefs
+            + _para('<hp:run charPrIDRef="0"/>')                                  # empty_runs
+            + _para(_para('<hp:run charPrIDRef="0"><hp:t>y</hp:t></hp:run>'))    # nesting
+            + _para('<hp:run><hp:t>z</hp:t></hp:run>', attrs='styleIDRef="0"')    # required_attrs
+            + _para('<hp:run charPrIDRef="0"><hp:tbl rowCnt="2" colCnt="1" borderFillIDRef="1">'
+                    '<hp:tr>' + CELL.format('') + '</hp:tr></hp:tbl></hp:run>'))  # nesting (rowCnt)
+    path = write_hwpx(tmp_path / 'bad.hwpx', body, decl="<?xml version='1.0' encoding='UTF-8'?>")
+    report = audit_hwpx(path, checks=list(hwpx_audit.CHECKS))
+
+    by_check = report['by_check']
+    assert by_check['declaration'] == {'error': 1}
+    assert by_check['crossrefs'] == {'error': 1}
+    assert by_check['empty_runs'] == {'warning': 1}
+    assert by_check['nesting'] == {'error': 2}
+    assert by_check['required_attrs'] == {'error': 2}  # hp:p paraPrIDRef, hp:run charPrIDRef
+    assert by_check['markers'] == {'warning': 1}
+    crossref = next(f for f in report['findings'] if f['check'] == 'crossrefs')
+    assert 'charPrIDRef="99"' in crossref['message']
+    assert crossref['location'].startswith('/hs:sec/hp:p[2]')
+
+
+def test_registered_check_gets_elements_in_single_walk(tmp_path):
+    @register_check
+    class CountParagraphs(AuditCheck):
+        name = 'count_paragraphs'
+        tags = (f'{{{HP}}}p',)
+
+        def begin(self, ctx):
+            self.n = 0
+
+        def visit(self, elem, ctx):
+            self.n += 1
+
+        def finish(self, ctx):
+            ctx.report(self.name, 'info', f'{self.n} paragraphs')
+
+    try:
+        report = audit_hwpx(write_hwpx(tmp_path / 'ok.hwpx', CLEAN), checks=['count_paragraphs'])
+        assert report['findings'][0]['message'] == '3 paragraphs'
+    finally:
+        del hwpx_audit.CHECKS['count_paragraphs']
+
+
+def test_audit_files_parallel_keeps_order(tmp_path):
+    paths = [write_hwpx(tmp_path / f'{i}.hwpx', CLEAN) for i in range(3)]
+    paths.append(str(tmp_path / 'missing.hwpx'))
+    reports = audit_files(paths, workers=2)
+    assert [r['path'] for r in reports] == paths
+    assert reports[-1]['by_check'] == {'parse': {'error': 1}}
+
+
+def test_regions_deduplicate_overlaps_and_report_bad_xpath(tmp_path):
+    path = write_hwpx(tmp_path / 'r.hwpx', CLEAN + _para('<hp:run charPrIDRef="0"/>'))
+    regions = ['/hs:sec/hp:p[2]', '/hs:sec/hp:p[2]/hp:run', '/hs:sec/hp:p[2]',
+               '/hs:sec/hp:p[', '/hs:sec/hp:p[9]']
+    report = audit_hwpx(path, regions=regions)
+    assert report['by_check']['empty_runs'] == {'warning': 1}
+    assert report['by_check']['parse'] == {'error': 1}
+    assert "'/hs:sec/hp:p['" in report['findings'][0]['message']
@@ -10,6 +10,7 @@ from lxml import etree
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from src.hwpx_editor import HwpxEditor, NAMESPACES
+from tests.hwpx_builder import write_hwpx
 
 _PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
 REF_HWPX = os.path.join(os.path.dirname(__file__), '..', 'ref', 'test_01.hwpx')
@@ -183,3 +184,69 @@ def test_mimetype_stored(editor, cover_table):
             assert info.compress_type == zipfile.ZIP_STORED
     finally:
         os.unlink(tmp_path)
+
+
+# ── 변경 기록 (ChangeSet) — 합성 HWPX ──────────────────────
+
+def _synthetic_hwpx(path):
+    def cell(r, c, text):
+        t = f'<hp:t>{text}</hp:t>' if text else ''
+        return (f'<hp:tc borderFillIDRef="1"><hp:subList><hp:p paraPrIDRef="0" styleIDRef="0">'
+                f'<hp:run charPrIDRef="0">{t}</hp:run><hp:linesegarray><hp:lineseg/></hp:linesegarray>'
+                f'</hp:p></hp:subList><hp:cellAddr colAddr="{c}" rowAddr="{r}"/></hp:tc>')
+
+    def table(rows):
+        trs = ''.join('<hp:tr>' + cell(r, 0, '') + cell(r, 1, '값') + '</hp:tr>' for r in range(rows))
+        return (f'<hp:p paraPrIDRef="0" styleIDRef="0"><hp:run charPrIDRef="0">'
+                f'<hp:tbl rowCnt="{rows}" colCnt="2" borderFillIDRef="1">{trs}</hp:tbl></hp:run></hp:p>')
+
+    outline = '<hp:p paraPrIDRef="0" styleIDRef="0"><hp:run charPrIDRef="0"><hp:t>□ 개요</hp:t></hp:run></hp:p>'
+    return write_hwpx(path, table(3) + outline + table(2) + outline + outline + table(1))
+
+
+def test_change_set_records_mutations(tmp_path):
+    from src.hwpx_editor import (
+        CHANGE_LINESEG_REMOVED, CHANGE_PARAGRAPH_INSERTED,
+        CHANGE_PARAGRAPH_REMOVED, CHANGE_TEXT_SET,
+    )
+    ed = HwpxEditor(_synthetic_hwpx(tmp_path / 'form.hwpx'))
+    assert len(ed.changes) == 0
+
+    t0 = ed.get_table(0)
+    assert ed.fill_cells(t0, {(0, 0): '가', (2, 0): '나'}) == 2
+    assert ed.inject_marker(1, '##SEC1_CONTENT##')
+    assert ed.remove_outline_placeholders(start_table=1) == 2
+
+    counts = ed.changes.counts()
+    assert counts[CHANGE_TEXT_SET] == 2
+    assert counts[CHANGE_LINESEG_REMOVED] == 2
+    assert counts[CHANGE_PARAGRAPH_INSERTED] == 1
+    assert counts[CHANGE_PARAGRAPH_REMOVED] == 2
+    assert all(p.getparent() is None for p in ed.changes.elements(CHANGE_PARAGRAPH_REMOVED))
+
+    # lineseg 제거된 hp:p는 수정된 hp:tc 안에 포함되어 영역으로 따로 나오지 않는다
+    paths = ed.changes.paths(ed.root)
+    assert paths == [
+        '/hs:sec/hp:p[1]/hp:run/hp:tbl/hp:tr[1]/hp:tc[1]',
+        '/hs:sec/hp:p[1]/hp:run/hp:tbl/hp:tr[3]/hp:tc[1]',
+        '/hs:sec/hp:p[4]',
+    ]
+    assert ed.root.xpath(paths[-1], namespaces=NAMESPACES)[0].findtext(
+        './/hp:t', namespaces=NAMESPACES) == '##SEC1_CONTENT##'
+
+
+def test_audit_only_dirty_regions(tmp_path):
+    from src.hwpx_audit import audit_hwpx
+    path = _synthetic_hwpx(tmp_path / 'form.hwpx')
+    ed = HwpxEditor(path)
+    # 수정하지 않은 영역의 결함 (빈 run) — 영역 감사에서는 보이지 않아야 한다
+    ed.get_table(2).find('.//hp:t', NAMESPACES).getparent().clear()
+    ed.set_cell_text(ed.get_table(0), 1, 1, '새 값')
+    ed.save()
+
+    regions = ed.changes.to_dict(ed.root)['regions']
+    full = audit_hwpx(path)
+    dirty = audit_hwpx(path, regions=regions)
+    assert full['by_check'].get('empty_runs')
+    assert dirty['regions'] == 1
+    assert dirty['counts']['error'] == 0 and 'empty_runs' not in dirty['by_check']
@@ -0,0 +1,66 @@
+"""IncrementalBuild 증분 파싱/컴파일 단위 테스트."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.incremental import IncrementalBuild
+from src.md_parser import parse_markdown
+
+DOC = "\n".join([
+    "# 1. 과제의 필요성",
+    "필요성 본문",
+    "```",
+    "# 코드 안의 H1",
+    "```",
+    "# 2. 관련 현황",
+    "- 현황 항목",
+    "# 3. 과제의 목표",
+    "목표 본문",
+])
+
+
+def _build(tmp_path):
+    return IncrementalBuild(tmp_path / 'state.json')
+
+
+def test_parse_matches_full_parse(tmp_path):
+    doc = _build(tmp_path).parse(DOC)
+    assert doc.blocks == parse_markdown(DOC)
+
+
+def test_only_changed_chunk_reparsed_and_recompiled(tmp_path):
+    build = _build(tmp_path)
+    doc = build.parse(DOC)
+    for sid in doc.section_ids():
+        build.compile_section(doc.section_blocks(sid), sid)
+    build.save()
+
+    edited = DOC.replace("- 현황 항목", "- 현황 항목 (수정)")
+    build = _build(tmp_path)
+    doc = build.parse(edited)
+    for sid in doc.section_ids():
+        build.compile_section(doc.section_blocks(sid), sid)
+    # 섹션 1은 코드 블록 안 H1 후보 때문에 조각 2개(부분 + 확장)를 조회한다
+    assert build.stats == {
+        'chunks_parsed': 1, 'chunks_reused': 3,
+        'sections_compiled': 1, 'sections_reused': 2,
+    }
+
+
+def test_pass2_skip_requires_same_markers_and_input(tmp_path):
+    out = tmp_path / 'out.hwpx'
+    out.write_bytes(b'filled')
+    ops_list = [{'marker': '##A##', 'ops': [{'op': 'line_break'}]}]
+
+    build = _build(tmp_path)
+    assert not build.pass2_up_to_date('sha1', ops_list, str(out))
+    build.record_pass2('sha1', ops_list, str(out))
+    build.save()
+
+    build = _build(tmp_path)
+    assert build.pass2_up_to_date('sha1', ops_list, str(out))
+    assert not build.pass2_up_to_date('sha2', ops_list, str(out))
+    changed = [{'marker': '##A##', 'ops': []}]
+    assert build.changed_markers(changed) == ['##A##']
+    assert not build.pass2_up_to_date('sha1', changed, str(out))
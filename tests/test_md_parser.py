@@ -0,0 +1,93 @@
+"""md_parser 블록 파서 단위 테스트."""
+
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.md_parser import (
+    ParsedDocument, extract_section_blocks, get_all_sections, parse_markdown,
+    parse_inline, parse_markdown_iter, strip_markdown,
+)
+
+SAMPLE = """# 1. 과제의 필요성
+첫 줄
+이어지는 줄
+- 항목
+  * 하위 항목
+
+| A | B |
+|---|---|
+| 1 | 2 |
+> 인용
+---
+<br>
+```py
+# 코드 안의 헤더
+```
+"""
+
+
+def test_block_types_in_order():
+    blocks = parse_markdown(SAMPLE)
+    assert [b['type'] for b in blocks] == [
+        'header', 'paragraph', 'list', 'table', 'blockquote', 'hr', 'code']
+    assert blocks[1]['text'] == '첫 줄 이어지는 줄'
+    assert blocks[2]['items'][1] == {'indent': 2, 'text': '하위 항목'}
+    assert blocks[6] == {'type': 'code', 'content': '# 코드 안의 헤더', 'lang': 'py'}
+
+
+def test_iter_from_file_matches_list():
+    streamed = list(parse_markdown_iter(io.StringIO(SAMPLE, newline='\n')))
+    assert streamed == parse_markdown(SAMPLE)
+
+
+def test_unclosed_code_keeps_trailing_newline():
+    text = "```\ncode\n"
+    streamed = list(parse_markdown_iter(io.StringIO(text, newline='\n')))
+    assert streamed == parse_markdown(text)
+    assert streamed[0]['content'] == 'code\n'
+
+
+def test_parsed_document_section_index():
+    text = "\n".join([
+        "서문",
+        "# 1. 과제의 필요성",
+        "가",
+        "# 부록 아님",
+        "나",
+        "# 2. 관련 현황",
+        "다",
+        "# 1. 과제의 필요성",
+        "라",
+    ])
+    blocks = parse_markdown(text)
+    doc = ParsedDocument(blocks)
+    assert doc.section_ids() == ['1', '2']
+    assert [b.get('text') for b in doc.section_blocks('1')] == [
+        '가', '부록 아님', '나', '라']
+    # 캐시된 섹션 리스트를 호출자가 수정해도 다음 호출에 영향 없음
+    doc.section_blocks('1').clear()
+    assert len(doc.section_blocks('1')) == 4
+    assert get_all_sections(doc) == get_all_sections(blocks)
+    # extract는 첫 등장 구간만 (다른 섹션 헤더에서 종료)
+    assert [b.get('text') for b in extract_section_blocks(doc, '1')] == [
+        '가', '부록 아님', '나']
+
+
+def test_parse_inline_runs():
+    runs = parse_inline('앞 ***굵은기울임*** **굵게** *기울임* 뒤')
+    assert [(r['text'], r['bold'], r['italic']) for r in runs] == [
+        ('앞 ', False, False), ('굵은기울임', True, True), (' ', False, False),
+        ('굵게', True, False), (' ', False, False), ('기울임', False, True),
+        (' 뒤', False, False)]
+    # 캐시된 결과를 호출자가 수정해도 다음 호출에 영향 없음
+    runs[0]['text'] = 'x'
+    assert parse_inline('앞 ***굵은기울임*** **굵게** *기울임* 뒤')[0]['text'] == '앞 '
+
+
+def test_strip_markdown_matches_regex_semantics():
+    assert strip_markdown('**굵게** 와 *기울임*') == '굵게 와 기울임'
+    assert strip_markdown('a ** b') == 'a  b'
+    assert strip_markdown('줄*\n바꿈*') == '줄*\n바꿈*'
+    assert strip_markdown('****x') == 'x'
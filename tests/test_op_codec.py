@@ -0,0 +1,70 @@
+"""op_codec 압축 전송 형식 단위 테스트."""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.md_parser import parse_markdown
+from src.md_to_ops import compile_blocks_to_ops
+from src.op_codec import StringTable, decode_ops, decode_plan, encode_ops, encode_plan
+
+MD = """# 1. 과제의 필요성
+## 가. 배경
+**핵심** 내용과 *강조* 문장.
+- 첫 항목
+- 둘째 항목
+
+| 구분 | 내용 |
+|---|---|
+| A | 가 |
+"""
+
+
+def test_plan_round_trip_and_smaller():
+    ops = compile_blocks_to_ops(parse_markdown(MD))
+    steps = [
+        {'step': 'open', 'path': 'C:\\in.hwpx'},
+        {'step': 'fill_markers', 'checkpoint': None,
+         'sections': [{'marker': '##SEC1##', 'ops': ops}]},
+        {'step': 'insert_ops', 'ops': ops},
+    ]
+    data = encode_plan(steps)
+    assert decode_plan(data) == steps
+    assert len(data) < len(json.dumps(steps, ensure_ascii=False).encode('utf-8')) / 4
+
+
+def test_rows_intern_strings_and_pass_through_unknown():
+    table = StringTable()
+    ops = [
+        {'op': 'set_char_shape', 'font': '바탕', 'size': 10},
+        {'op': 'set_char_shape', 'font': '바탕', 'bold': True},
+        {'op': 'fill_table', 'data': [['바탕', 'x']]},
+        {'op': 'set_para_shape', 'align': 1},          # 정수 정렬 → dict 유지
+        {'op': 'insert_text', 'text': 'a', 'extra': 1},  # 스키마 밖 필드
+        {'op': 'custom'},
+    ]
+    rows = encode_ops(ops, table)
+    assert rows[0] == [1, 0, 10]
+    assert rows[1] == [1, 0, None, True]
+    assert rows[2] == [6, [[0, 1]]]
+    assert rows[3:] == ops[3:]
+    assert table.strings == ['바탕', 'x']
+    assert decode_ops(rows, table.strings) == ops
+
+
+def test_matrix_with_string_rows_kept_verbatim():
+    table = StringTable()
+    ops = [{'op': 'fill_table', 'data': ['ab']}, {'op': 'fill_table', 'data': 'ab'}]
+    rows = encode_ops(ops, table)
+    assert rows == ops
+    assert decode_ops(rows, table.strings) == ops
+
+
+def test_wire_version_checked():
+    import zlib
+    bad = zlib.compress(json.dumps({'v': 99, 'strings': [], 'steps': []}).encode())
+    with pytest.raises(ValueError):
+        decode_plan(bad)
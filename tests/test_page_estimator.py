@@ -0,0 +1,44 @@
+"""page_estimator 오프라인 페이지 추정 단위 테스트."""
+
+import os
+import sys
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.page_estimator import FontMetrics, LayoutEstimator, PageGeometry
+
+HP = 'http://www.hancom.co.kr/hwpml/2011/paragraph'
+HH = 'http://www.hancom.co.kr/hwpml/2011/head'
+
+
+def test_geometry_and_metrics_from_xml():
+    section = ET.fromstring(
+        f'<sec xmlns:hp="{HP}"><hp:p><hp:secPr>'
+        '<hp:pagePr landscape="WIDELY" width="59528" height="84188">'
+        '<hp:margin left="5670" right="5670" top="4252" bottom="4252" header="2835" footer="2835"/>'
+        '</hp:pagePr></hp:secPr></hp:p></sec>')
+    geo = PageGeometry.from_section_xml(section)
+    assert geo.body_width == 59528 - 2 * 5670
+    assert geo.body_height == 84188 - 2 * 4252 - 2 * 2835
+
+    header = ET.fromstring(
+        f'<head xmlns:hh="{HH}">'
+        '<hh:charPr id="3" height="1100"><hh:ratio hangul="95" latin="100"/></hh:charPr>'
+        '<hh:paraPr id="2"><hh:lineSpacing type="PERCENT" value="130"/></hh:paraPr>'
+        '<hh:style id="0" name="바탕글" charPrIDRef="3" paraPrIDRef="2"/></head>')
+    metrics = FontMetrics.from_header_xml(header)
+    assert metrics.size_pt == 11
+    assert metrics.hangul_ratio == 95
+    assert metrics.line_spacing == 130
+
+
+def test_estimate_ops_scales_with_text():
+    est = LayoutEstimator()
+    para = [{'op': 'set_char_shape', 'size': 10},
+            {'op': 'insert_text', 'text': '가' * 200},
+            {'op': 'line_break'}]
+    one = est.estimate_ops(para)
+    assert one['lines'] == est.text_lines('가' * 200, size_pt=10) == 5
+    two = est.estimate_ops(para * 2 + [{'op': 'page_break'}])
+    assert two['lines'] == 10
+    assert two['pages'] == 1.0  # 페이지 나누기 → 다음 페이지 시작으로 올림
@@ -0,0 +1,58 @@
+"""ParseCache 디스크 캐시 단위 테스트."""
+
+import os
+import pickle
+import sys
+import time
+import zlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.md_parser import parse_markdown
+from src.md_to_ops import compile_section_ops
+from src.parse_cache import ParseCache
+
+MD = "# 1. 과제의 필요성\n**굵게** 본문\n- 항목\n"
+
+
+def test_hit_returns_same_blocks_and_ops(tmp_path):
+    cache = ParseCache(tmp_path)
+    doc = cache.parse(MD)
+    ops = cache.section_ops(doc, '1')
+    assert cache.hits == 0
+
+    cache2 = ParseCache(tmp_path)
+    doc2 = cache2.parse(MD)
+    assert doc2.blocks == parse_markdown(MD)
+    assert cache2.section_ops(doc2, '1') == ops == compile_section_ops(
+        doc.section_blocks('1'), '1')
+    assert cache2.hits == 2
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = ParseCache(tmp_path, max_bytes=10 ** 9)
+    for i in range(3):
+        cache.parse(MD + f"문단 {i}\n")
+    files = sorted(tmp_path.iterdir(), key=lambda p: p.stat().st_mtime)
+    # 첫 항목을 최근 사용으로 갱신 → 두 번째가 가장 오래됨
+    past = time.time() - 100
+    for age, path in enumerate(files):
+        os.utime(path, (past + age, past + age))
+    cache.parse(MD + "문단 0\n")
+
+    cache.max_bytes = sum(p.stat().st_size for p in files) - 1
+    assert cache.evict() == 1
+    assert not files[1].exists()
+    assert files[0].exists() and files[2].exists()
+
+
+def test_stale_pickle_is_a_miss(tmp_path):
+    cache = ParseCache(tmp_path)
+    cache.parse(MD)
+    # 이전 버전 클래스를 참조하는 pickle (언피클 시 AttributeError)
+    stale = pickle.dumps(ParseCache).replace(b'ParseCache', b'OldCache__')
+    for path in tmp_path.iterdir():
+        path.write_bytes(zlib.compress(stale))
+
+    cache2 = ParseCache(tmp_path)
+    assert cache2.parse(MD).blocks == parse_markdown(MD)
+    assert (cache2.hits, cache2.misses) == (0, 1)
@@ -0,0 +1,209 @@
+"""pdf_compare 테스트 (PyMuPDF로 만든 작은 PDF 사용)"""
+
+import os
+import sys
+
+import pytest
+
+fitz = pytest.importorskip('fitz')
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src import pdf_compare
+from src.pdf_compare import PdfComparator
+from src.raster_cache import RasterCache
+
+
+WORDS = ("lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod "
+         "tempor incididunt ut labore et dolore magna aliqua enim minim veniam").split()
+
+
+def make_pdf(path, n_pages=4, changed=()):
+    """n_pages짜리 PDF 생성. changed 페이지(1-based)에는 사각형과 문구 추가."""
+    doc = fitz.open()
+    for i in range(1, n_pages + 1):
+        page = doc.new_page()
+        words = WORDS[i % len(WORDS):] + WORDS[:i % len(WORDS)]
+        for k in range(15):
+            line = " ".join(words[(k * 3 + j) % len(words)] for j in range(6))
+            page.insert_text((72, 72 + k * 30), f"{i}-{k} {line}", fontsize=11)
+        if i in changed:
+            page.draw_rect(fitz.Rect(100, 300, 400, 500), fill=(0, 0, 0))
+            page.insert_text((72, 700), "CHANGED", fontsize=20)
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+@pytest.fixture
+def pdf_pair(tmp_path):
+    ref = make_pdf(tmp_path / 'ref.pdf')
+    gen = make_pdf(tmp_path / 'gen.pdf', changed=(2,))
+    return ref, gen
+
+
+def test_parallel_matches_sequential(pdf_pair):
+    ref, gen = pdf_pair
+    seq = PdfComparator(ref, gen, dpi=50).compare()
+    par = PdfComparator(ref, gen, dpi=50).compare(workers=2)
+
+    assert [p['page'] for p in par['pages']] == [1, 2, 3, 4]
+    assert par['pages'] == seq['pages']
+    assert seq['pages'][1]['ssim'] < 1.0
+    assert not seq['pages'][1]['text_match']
+
+
+def test_reference_raster_cache_reused(pdf_pair, tmp_path):
+    ref, gen = pdf_pair
+    cache = RasterCache(tmp_path / 'raster')
+    first = PdfComparator(ref, gen, dpi=50, raster_cache=cache).compare()
+    assert (cache.hits, cache.misses) == (0, 4)
+
+    second = PdfComparator(ref, gen, dpi=50, raster_cache=cache).compare()
+    assert (cache.hits, cache.misses) == (4, 4)
+    assert second['pages'] == first['pages']
+
+
+def test_worker_chunks_reuse_reference_hash(pdf_pair, tmp_path, monkeypatch):
+    ref, gen = pdf_pair
+    cache = RasterCache(tmp_path / 'raster')
+    options = PdfComparator(ref, gen, dpi=50, raster_cache=cache)._worker_options()
+    assert options['reference_sha'] == pdf_compare.file_sha256(ref)
+
+    monkeypatch.setattr(pdf_compare, 'file_sha256',
+                        lambda path: pytest.fail('reference PDF re-hashed'))
+    results, _ = pdf_compare._compare_chunk(options, [(1, 1), (2, 2)])
+    assert [r['page'] for r in results] == [1, 2]
+
+
+def test_coarse_pass_accepts_identical_pages(pdf_pair):
+    ref, gen = pdf_pair
+    result = PdfComparator(ref, gen, dpi=72, coarse_dpi=24).compare()
+
+    decided = {p['page']: p['decided_dpi'] for p in result['pages']}
+    assert decided == {1: 24, 2: 72, 3: 24, 4: 24}
+    assert result['coarse_accepted'] == 3
+    # 저해상도 없이 비교한 결과와 변경 페이지 판정은 같다
+    full = PdfComparator(ref, gen, dpi=72).compare()
+    assert result['pages'][1] == full['pages'][1]
+
+
+def test_report_reuses_buffered_arrays(pdf_pair, tmp_path, monkeypatch):
+    ref, gen = pdf_pair
+    comparator = PdfComparator(ref, gen, dpi=50)
+    rendered = []
+    original = PdfComparator.page_to_image
+
+    def counting(self, doc, page_num, *args, **kwargs):
+        rendered.append(page_num)
+        return original(self, doc, page_num, *args, **kwargs)
+
+    monkeypatch.setattr(PdfComparator, 'page_to_image', counting)
+    comparator.compare(output_dir=str(tmp_path / 'report'))
+
+    # 비교 때 페이지당 2회(참조/생성)만 렌더링하고, 리포트는 버퍼 사용
+    assert sorted(rendered) == [1, 1, 2, 2, 3, 3, 4, 4]
+    assert (tmp_path / 'report' / 'diff_page_002.png').exists()
+    assert comparator._diff_buffer.nbytes == 0
+
+
+def test_parallel_report_uses_worker_arrays(pdf_pair, tmp_path):
+    ref, gen = pdf_pair
+    comparator = PdfComparator(ref, gen, dpi=50)
+    comparator._compare_pages([(1, 1), (2, 2), (3, 3), (4, 4)], workers=2)
+    assert list(comparator._diff_buffer._entries) == [2]
+
+
+def test_texts_kept_only_for_failing_pages(pdf_pair, tmp_path):
+    ref, gen = pdf_pair
+    result = PdfComparator(ref, gen, dpi=50).compare()
+    with_text = [p['page'] for p in result['pages'] if 'ref_text' in p]
+    assert with_text == [2]
+    assert result['pages'][0]['text_stage'] == 'exact'
+
+    report_dir = tmp_path / 'report'
+    PdfComparator(ref, gen, dpi=50).compare(output_dir=str(report_dir))
+    diff_text = (report_dir / 'text_diff_page_002.txt').read_text(encoding='utf-8')
+    assert '+CHANGED' in diff_text
+
+
+def test_bound_pages_reported_outside_text_match(tmp_path):
+    ref = make_pdf(tmp_path / 'ref.pdf')
+    gen_doc = fitz.open(ref)
+    gen_doc.delete_page(2)                       # 참조 3페이지를 전혀 다른 텍스트로 교체
+    page = gen_doc.new_page(pno=2)
+    for k in range(15):
+        page.insert_text((72, 72 + k * 30), "0123456789 " * 6, fontsize=11)
+    gen = str(tmp_path / 'gen.pdf')
+    gen_doc.save(gen)
+    gen_doc.close()
+
+    result = PdfComparator(ref, gen, dpi=50).compare(output_dir=str(tmp_path / 'report'))
+    assert result['pages'][2]['text_stage'] == 'bound'
+    assert result['text_bound_pages'] == [3]
+    assert result['overall_text_match'] == 1.0
+    summary = (tmp_path / 'report' / 'summary.txt').read_text(encoding='utf-8')
+    assert '텍스트 상한 판정 페이지 (일치도 평균 제외): [3]' in summary
+
+
+def test_alignment_skips_inserted_and_deleted_pages(tmp_path):
+    ref = make_pdf(tmp_path / 'ref.pdf', n_pages=5)
+    gen_doc = fitz.open(ref)
+    gen_doc.delete_page(1)                       # 참조 2페이지 삭제
+    for pno in (3, 4):                           # 참조 5페이지 앞에 새 페이지 2개 삽입
+        extra = gen_doc.new_page(pno=pno)
+        extra.insert_text((72, 72), f"inserted page {pno}", fontsize=20)
+    gen = str(tmp_path / 'gen.pdf')
+    gen_doc.save(gen)
+    gen_doc.close()
+
+    result = PdfComparator(ref, gen, dpi=50).compare(output_dir=str(tmp_path / 'report'))
+
+    assert result['alignment'] == {'deleted_pages': [2], 'inserted_pages': [4, 5]}
+    pairs = [(p['page'], p.get('generated_page', p['page'])) for p in result['pages']]
+    assert pairs == [(1, 1), (3, 2), (4, 3), (5, 6)]
+    assert all(p['ssim'] == 1.0 for p in result['pages'])
+    summary = (tmp_path / 'report' / 'summary.txt').read_text(encoding='utf-8')
+    assert '삭제된 참조 페이지: [2]' in summary
+
+
+def test_tile_ssim_matches_full_page(pdf_pair, tmp_path):
+    ref, gen = pdf_pair
+    tiled = PdfComparator(ref, gen, dpi=72, tile_size=64).compare(output_dir=str(tmp_path / 'r'))
+    full = PdfComparator(ref, gen, dpi=72, tile_size=None).compare()
+
+    for t, f in zip(tiled['pages'], full['pages']):
+        assert t['ssim'] == f['ssim']
+        assert t['pixel_diff_percent'] == f['pixel_diff_percent']
+    assert tiled['pages'][0]['changed_tiles'] == 0
+    assert 'tile_heatmap' not in tiled['pages'][0]
+    changed = tiled['pages'][1]
+    assert 0 < changed['changed_tiles'] < sum(len(r) for r in changed['tile_heatmap'])
+    summary = (tmp_path / 'r' / 'summary.txt').read_text(encoding='utf-8')
+    assert '타일 히트맵' in summary
+
+
+def test_stream_resume_skips_recorded_pages(pdf_pair, tmp_path, monkeypatch):
+    ref, gen = pdf_pair
+    out = tmp_path / 'report'
+    full = PdfComparator(ref, gen, dpi=50).compare(output_dir=str(out), stream=True)
+    lines = (out / 'pages.jsonl').read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 5  # 헤더 + 4페이지
+    assert (out / 'text_diff_page_002.txt').exists()
+
+    # 3페이지 기록 도중 중단된 상황: 마지막 두 줄을 자르고 반쯤 쓴 줄 추가
+    (out / 'pages.jsonl').write_text('\n'.join(lines[:3]) + '\n' + lines[3][:20],
+                                     encoding='utf-8')
+    compared = []
+    original = PdfComparator.compare_page
+
+    def tracking(self, page_num, gen_page=None):
+        compared.append(page_num)
+        return original(self, page_num, gen_page)
+
+    monkeypatch.setattr(PdfComparator, 'compare_page', tracking)
+    resumed = PdfComparator(ref, gen, dpi=50).compare(output_dir=str(out), resume=True)
+
+    assert compared == [3, 4]
+    assert resumed['pages'] == full['pages']
+    assert resumed['overall_ssim'] == full['overall_ssim']
+    assert len((out / 'pages.jsonl').read_text(encoding='utf-8').splitlines()) == 5
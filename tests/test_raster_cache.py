@@ -0,0 +1,37 @@
+"""raster_cache 단위 테스트"""
+
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.raster_cache import RasterCache
+
+
+def test_roundtrip_and_key(tmp_path):
+    cache = RasterCache(tmp_path)
+    arr = (np.arange(12, dtype=np.uint8) * 20).reshape(3, 4)
+    assert cache.get('abc', 1, 150, True) is None
+    cache.put('abc', 1, 150, True, arr)
+
+    assert np.array_equal(cache.get('abc', 1, 150, True), arr)
+    # 다른 DPI/회전/페이지는 별도 항목
+    assert cache.get('abc', 1, 72, True) is None
+    assert cache.get('abc', 1, 150, False) is None
+    assert cache.get('abc', 2, 150, True) is None
+    assert (cache.hits, cache.misses) == (1, 4)
+
+
+def test_evicts_least_recently_used(tmp_path):
+    arr = np.zeros((100, 100), dtype=np.uint8)
+    cache = RasterCache(tmp_path, max_bytes=25000)
+    cache.put('a', 1, 150, True, arr)
+    cache.put('a', 2, 150, True, arr)
+    os.utime(cache._path('a', 1, 150, True), (0, 0))  # 1페이지가 가장 오래됨
+    cache.put('a', 3, 150, True, arr)
+
+    assert cache.get('a', 1, 150, True) is None
+    assert cache.get('a', 3, 150, True) is not None
@@ -0,0 +1,41 @@
+"""ssim_kernels 단위 테스트"""
+
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.ssim_kernels import compare_arrays, diff_percent, ssim, ssim_batch
+
+
+def _pages():
+    rng = np.random.default_rng(0)
+    a = ((rng.random((120, 90)) > 0.8) * 200 + 30).astype(np.uint8)
+    b = a.copy()
+    b[20:50, 10:60] = rng.integers(0, 255, (30, 50))
+    return a, b
+
+
+def test_matches_skimage():
+    structural_similarity = pytest.importorskip('skimage.metrics').structural_similarity
+    a, b = _pages()
+    assert ssim(a, b) == pytest.approx(structural_similarity(a, b), abs=1e-6)
+    assert ssim(a, a) == pytest.approx(1.0)
+
+
+def test_batch_and_shared_buffers():
+    a, b = _pages()
+    scores = ssim_batch(np.stack([a, a]), np.stack([b, a]))
+    assert scores == pytest.approx([ssim(a, b), 1.0])
+
+    score, mask = compare_arrays(a, b)
+    assert score == pytest.approx(ssim(a, b))
+    expected = np.abs(a.astype(int) - b.astype(int)) > 10
+    assert np.array_equal(mask, expected)
+    assert diff_percent(mask) == pytest.approx(expected.mean() * 100)
+
+    score, s_map = ssim(a, b, full=True)
+    assert s_map.shape == (114, 84)
@@ -0,0 +1,62 @@
+"""template_registry 템플릿 지문 레지스트리 단위 테스트."""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src import template_registry
+from src.generate_hwpx import load_template_config
+from src.template_registry import TemplateRegistry
+from tests.hwpx_builder import make_form_hwpx
+
+
+def test_ensure_regenerates_only_on_content_change(tmp_path, monkeypatch):
+    hwpx = make_form_hwpx(tmp_path / 'form.hwpx')
+    calls = []
+    real_analyze = template_registry.analyze_template
+    monkeypatch.setattr(template_registry, 'analyze_template',
+                        lambda src: calls.append(src) or real_analyze(src))
+
+    registry = TemplateRegistry(tmp_path / 'registry')
+    entry, regenerated = registry.ensure(hwpx)
+    assert regenerated and len(calls) == 1
+    assert entry['template_config']['name'] == 'form'
+    assert entry['template_config']['cover_table_index'] == 0
+    assert [t['rowCnt'] for t in entry['tables']] == [3, 2]
+    assert entry['styles']['styles'] == ['바탕글']
+
+    # 새 프로세스(새 인스턴스)도 디스크 항목으로 시작
+    warm = TemplateRegistry(tmp_path / 'registry')
+    assert warm.ensure(hwpx) == (entry, False)
+    assert [e['sha256'] for e in warm.entries()] == [entry['sha256']]
+    assert len(calls) == 1
+
+    # 내용이 바뀌면 다시 분석
+    make_form_hwpx(hwpx, extra_paras=3)
+    os.utime(hwpx, ns=(1, 1))
+    entry2, regenerated = warm.ensure(hwpx)
+    assert regenerated and entry2['sha256'] != entry['sha256']
+    assert len(calls) == 2
+
+
+def test_load_template_config_warns_on_stale_source(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv('HWPX_CACHE_DIR', str(tmp_path / 'cache'))
+    hwpx = make_form_hwpx(tmp_path / 'form.hwpx')
+    template_dir = tmp_path / 'templates'
+    template_dir.mkdir()
+
+    # template.json이 없으면 자동 초안 대신 빈 설정, 레지스트리도 쓰지 않음
+    assert load_template_config(str(template_dir), str(hwpx)) == {}
+    assert not (tmp_path / 'cache').exists()
+
+    config = TemplateRegistry(tmp_path / 'registry').ensure(hwpx)[0]['template_config']
+    with open(template_dir / 'template.json', 'w', encoding='utf-8') as f:
+        json.dump(config, f)
+    assert load_template_config(str(template_dir), str(hwpx)) == config
+    assert '경고' not in capsys.readouterr().out
+
+    with open(template_dir / 'template.json', 'w', encoding='utf-8') as f:
+        json.dump(dict(config, source_sha256='0' * 64), f)
+    load_template_config(str(template_dir), str(hwpx))
+    assert '경고' in capsys.readouterr().out
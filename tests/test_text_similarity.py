@@ -0,0 +1,89 @@
+"""text_similarity 단위 테스트"""
+
+import difflib
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.text_similarity import (
+    CHAR_ALIGN_LIMIT, DEFAULT_BOUND_BELOW, STAGE_ALIGN, STAGE_BOUND, STAGE_EXACT,
+    similarity_bound, text_similarity,
+)
+
+REF = "\n".join(f"{i}. 사업 목표 및 추진 전략 항목 {i}번 내용입니다" for i in range(40))
+
+
+def test_exact_and_bound_stages():
+    assert text_similarity(REF, REF) == (1.0, STAGE_EXACT)
+
+    other = "영문 텍스트가 아닌 completely different page" * 3
+    ratio, stage = text_similarity(REF, other, bound_below=DEFAULT_BOUND_BELOW)
+    assert stage == STAGE_BOUND
+    assert ratio == similarity_bound(REF, other)
+    assert ratio >= difflib.SequenceMatcher(None, REF, other).ratio()
+
+    # 기본값은 상한 대신 정렬 유사도 (큰 구간은 줄 단위 근사)
+    ratio, stage = text_similarity(REF, other)
+    assert stage == STAGE_ALIGN
+    assert ratio <= similarity_bound(REF, other)
+    exact = difflib.SequenceMatcher(None, REF, other, autojunk=False).ratio()
+    assert abs(ratio - exact) < 0.05
+
+
+def test_align_matches_difflib_for_local_edits():
+    lines = REF.split("\n")
+    lines[5] = lines[5].replace("추진", "수행")
+    lines.insert(20, "새로 추가된 문단")
+    del lines[30]
+    gen = "\n".join(lines)
+
+    ratio, stage = text_similarity(REF, gen)
+    assert stage == STAGE_ALIGN
+    expected = difflib.SequenceMatcher(None, REF, gen, autojunk=False).ratio()
+    assert abs(ratio - expected) < 0.01
+
+
+def test_long_replaced_block_keeps_common_hangul():
+    # 200자 이상 블록: autojunk=True면 자주 나오는 글자가 모두 무시되어 ~0.2
+    rng = random.Random(0)
+    ref = ''.join(rng.choice('가나다라마바사 ') for _ in range(480))
+    gen = ref[:100] + '하' + ref[101:200] + '하' + ref[201:300] + '하' + ref[301:]
+    ratio, stage = text_similarity(ref, gen)
+    assert stage == STAGE_ALIGN
+    assert ratio == 2 * 477 / 960
+
+
+def test_empty_texts():
+    assert text_similarity("", "") == (1.0, STAGE_EXACT)
+    assert text_similarity("", "abc")[0] == 0.0
+
+
+def _best_time(fn, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def test_dense_page_not_slower_than_difflib_ratio():
+    # 모든 줄이 조금씩 바뀐 조밀한 한글 페이지 — 이전 경로(difflib ratio)와 비교
+    rng = random.Random(1)
+    pool = [chr(0xAC00 + rng.randrange(11172)) for _ in range(300)]
+    ref_lines = [''.join(rng.choice(pool) for _ in range(45)) for _ in range(40)]
+    gen_lines = [line[:20] + rng.choice(pool) + line[21:] for line in ref_lines]
+    ref, gen = '\n'.join(ref_lines), '\n'.join(gen_lines)
+    assert len(ref) + len(gen) > CHAR_ALIGN_LIMIT
+
+    old = difflib.SequenceMatcher(None, ref, gen).ratio()
+    ratio, stage = text_similarity(ref, gen)
+    assert stage == STAGE_ALIGN
+    assert abs(ratio - old) < 0.01
+
+    old_time = _best_time(lambda: difflib.SequenceMatcher(None, ref, gen).ratio())
+    new_time = _best_time(lambda: text_similarity(ref, gen))
+    assert new_time < old_time * 2